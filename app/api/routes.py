@@ -2,16 +2,30 @@
 API Routes for Team Intuition Engine.
 Provides endpoints for micro-error detection, team synergy evaluation, and hypothetical predictions.
 """
-from fastapi import APIRouter, HTTPException, Body, Query
+from fastapi import APIRouter, HTTPException, Body, Query, Request, Response
+from starlette.convertors import Convertor, register_url_convertor
+import asyncio
+import functools
+import itertools
 import logging
-from typing import Union, Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import operator
+import time
+import httpx
+import openai
+import orjson
+import re
+import traceback
+from dataclasses import dataclass
+from types import MappingProxyType
+from enum import Enum, IntEnum
+from typing import Union, Dict, Any, Optional, List, AsyncIterator, Callable, Final, FrozenSet, Mapping, Set, Tuple
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
 from ..models.lol import (
     # Request models
-    Player, Match, DecisionContext, GameState,
+    Player, Match, DecisionContext, GameState, PlayerState,
     PlayerAnalysisRequest, MatchAnalysisRequest, HypotheticalRequest,
     # Response models
     AnalysisResponse, MicroErrorResponse, SynergyResponse, HypotheticalResponse
@@ -19,124 +33,198 @@ from ..models.lol import (
 from ..services.error_detector import MicroErrorDetector
 from ..services.synergy_model import TeamSynergyModel
 from ..services.simulator import HypotheticalSimulator
-from ..services.grid_client import grid_client
-from ..services.hypothetical_engine import get_hypothetical_result
+from ..services.grid_client import grid_client, latest_game, LOL_TITLE_ID, VALORANT_TITLE_ID
+from ..services.hypothetical_engine import get_hypothetical_result, stream_hypothetical_result
+from ..services.deepseek_client import deepseek_client, OBJECT_SCHEMA
 from ..services.lol_analyzer import lol_analyzer, MacroReviewAgenda
 from ..services.player_insights import player_insight_generator, PlayerInsightReport
 from ..services.valorant_analyzer import valorant_analyzer
 from ..services.stats_analyzer import valorant_stats_analyzer
+from ..services.valorant_stats_processor import valorant_stats
 from ..models.valorant import ValorantMacroReview, EnhancedMacroReview
+from ..core.cache import TTLCache, SingleFlight, async_ttl_cache, single_flight
+from ..core.circuit_breaker import CircuitOpenError
+from ..core.config import settings
+from ..core.responses import (
+    ORJSONResponse, cached_json_response, dumps, etag_for, event_stream, ndjson_stream,
+    wants_event_stream, wants_ndjson
+)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # In-memory cache for expensive API calls (base reviews, GRID data)
-_enhanced_review_cache: Dict[str, Dict[str, Any]] = {}  # key: "series_id:team_name"
+_enhanced_review_cache = TTLCache(maxsize=1024, ttl=900)  # key: "series_id:team_name"
 
 # Service Initialization
 error_detector = MicroErrorDetector()
 synergy_model = TeamSynergyModel()
 simulator = HypotheticalSimulator()
 
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from fastapi import Depends
-from ..core.database import get_db
+from ..core.database import SessionLocal, get_db
 from ..models import db as db_models
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 class RecentMatchCreate(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     series_id: str
     title: str
     team1_name: str
     team2_name: str
 
 
+def _model_response(model: BaseModel) -> ORJSONResponse:
+    """
+    Serialize a service-validated model straight to JSON.
+    Used with `response_model=None` (schema kept via `responses=`) so FastAPI
+    doesn't re-validate and re-encode a model the service already built.
+    """
+    return ORJSONResponse(content=model.model_dump(mode="json"))
+
+
+# GRID goes over httpx and DeepSeek over the OpenAI SDK - failures there are an
+# upstream outage (502), not a bug in this service (500).
+_UPSTREAM_EXC: Final = (httpx.HTTPError, openai.APIError, asyncio.TimeoutError, CircuitOpenError)
+
+
+def _error_detail(context: str, exc: BaseException) -> str:
+    """
+    Log an endpoint failure and return the client-facing detail for it. The
+    traceback stays in the server log; clients only ever see `context`, never
+    `str(e)` of a chained upstream exception.
+    """
+    if isinstance(exc, _UPSTREAM_EXC):
+        logger.warning("%s: upstream unavailable (%s)", context, type(exc).__name__)
+        return f"{context}: upstream service unavailable"
+    logger.error(context, exc_info=exc)
+    return context
+
+
+def _http_error(context: str, exc: Exception) -> HTTPException:
+    """Build the HTTPException for an endpoint failure (502 upstream, 500 otherwise; see _error_detail)."""
+    return HTTPException(status_code=502 if isinstance(exc, _UPSTREAM_EXC) else 500, detail=_error_detail(context, exc))
+
 
 # ============================================================================
 # New Async Endpoints (Rich Models)
 # ============================================================================
 
-@router.post("/analyze/player/detailed", response_model=MicroErrorResponse)
-async def analyze_player_detailed(request: PlayerAnalysisRequest):
+@router.post("/analyze/player/detailed", response_model=None, responses={200: {"model": MicroErrorResponse}})
+async def analyze_player_detailed(request: PlayerAnalysisRequest) -> ORJSONResponse:
     """
     Analyzes a player's performance and detects micro-level errors.
     Returns detailed error information with cascading effects and improvement suggestions.
     """
     try:
-        return await error_detector.detect_errors(
+        return _model_response(await error_detector.detect_errors(
             player=request.player,
             timeline=request.timeline,
             player_states=request.player_states
-        )
+        ))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Analyze player detailed failed", e)
 
 
-@router.post("/review/match/detailed", response_model=SynergyResponse)
-async def review_match_detailed(request: MatchAnalysisRequest):
+@router.post("/review/match/detailed", response_model=None, responses={200: {"model": SynergyResponse}})
+async def review_match_detailed(request: MatchAnalysisRequest) -> ORJSONResponse:
     """
     Reviews a match and evaluates team synergy and composition.
     Returns detailed synergy metrics with analysis and recommendations.
     """
     try:
-        return await synergy_model.evaluate_synergy(
+        return _model_response(await synergy_model.evaluate_synergy(
             match=request.match,
             game_state=request.game_state,
             micro_errors=None  # Can be enhanced to chain with error detection
-        )
+        ))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Review match detailed failed", e)
 
 
-@router.post("/simulate/scenario", response_model=HypotheticalResponse)
-async def simulate_scenario(request: HypotheticalRequest):
+@router.post("/simulate/scenario", response_model=None, responses={200: {"model": HypotheticalResponse}})
+async def simulate_scenario(request: HypotheticalRequest) -> ORJSONResponse:
     """
     Simulates outcomes for a hypothetical game scenario.
     Returns probability distributions with reasoning and recommendations.
     """
     try:
-        return await simulator.simulate_request(request)
+        return _model_response(await simulator.simulate_request(request))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Simulate scenario failed", e)
 
 
 class SimpleScenarioRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     scenario: str
     game: str
     context: Optional[Dict[str, Any]] = None
 
-@router.post("/simulate/simple")
-async def simulate_simple(request: SimpleScenarioRequest):
+
+class ScenarioBody(BaseModel):
+    """Body for the hypothetical endpoints: `{ "scenario": "..." }` (other keys ignored)."""
+    model_config = ConfigDict(frozen=True)
+
+    scenario: str = Field(min_length=1, max_length=4000)
+
+async def _deepseek_events(
+    system_prompt: str,
+    user_prompt: str,
+    build_result: Callable[[Dict[str, Any]], Dict[str, Any]],
+    on_error: Callable[[Exception], Tuple[str, Dict[str, Any]]],
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Stream DeepSeek token deltas as ("delta", text) events, then one final
+    ("result", payload) event built from the parsed JSON. On failure the
+    stream closes with the single event returned by `on_error`.
+    """
+    parts = []
+    try:
+        async for delta in deepseek_client.analyze_stream(system_prompt, user_prompt, OBJECT_SCHEMA):
+            parts.append(delta)
+            yield "delta", delta
+        yield "result", build_result(deepseek_client.parse_json_response("".join(parts)))
+    except Exception as e:
+        logger.exception("DeepSeek stream error")
+        yield on_error(e)
+
+
+async def _hypothetical_events(series_id: str, scenario: str, build_result: Callable[[Any], Dict[str, Any]]):
+    """Wrap `stream_hypothetical_result`, shaping the final event like the JSON response."""
+    async for event, data in stream_hypothetical_result(series_id, scenario):
+        yield event, (build_result(data) if event == "result" else data)
+
+
+@router.post("/simulate/simple", response_class=ORJSONResponse)
+async def simulate_simple(request: SimpleScenarioRequest, http_request: Request):
     """
     Simplified simulator endpoint for frontend constraints.
     Calls DeepSeek for actual analysis.
+    Send `Accept: text/event-stream` to receive tokens as Server-Sent Events.
     """
+    if wants_event_stream(http_request):
+        return event_stream(_hypothetical_events(
+            f"{request.game}-simple", request.scenario,
+            lambda result: {"status": "success", "result": result}
+        ))
     try:
         # Use the hypothetical engine for actual AI analysis
         result = await get_hypothetical_result(f"{request.game}-simple", request.scenario)
-        return {
+        return ORJSONResponse(content={
             "status": "success",
             "result": result
-        }
+        })
     except Exception as e:
-        logger.error(f"Simulation error: {e}")
-        raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+        raise _http_error("Simulation failed", e)
 
 
-@router.post("/grid/hypothetical/valorant")
-async def hypothetical_valorant(payload: Dict[str, str] = Body(...)) -> Dict[str, Any]:
-    """
-    VALORANT-specific hypothetical analysis.
-    Doesn't require a series_id - uses generic VALORANT context.
-    Expects JSON body `{ "scenario": "..." }`.
-    """
-    scenario = payload.get("scenario")
-    if not scenario:
-        raise HTTPException(status_code=400, detail="Missing scenario")
-    
-    try:
-        from ..services.deepseek_client import deepseek_client
-        
-        system_prompt = """You are a VALORANT tactical analyst. Analyze the hypothetical scenario and return a JSON response:
+# System prompts are module constants: built once, and byte-identical across
+# requests so DeepSeek's prefix cache can reuse them.
+_VALORANT_SYS_PROMPT: Final[str] = """You are a VALORANT tactical analyst. Analyze the hypothetical scenario and return a JSON response:
 {
     "alternative": "Brief description of the user's proposed action",
     "suggested": "Your recommended optimal action",
@@ -144,41 +232,109 @@ async def hypothetical_valorant(payload: Dict[str, str] = Body(...)) -> Dict[str
     "impact": "Primary strategic benefit",
     "reasoning": "2-3 sentence explanation of your analysis"
 }"""
-        
+
+# Canned VALORANT hypothetical answer when DeepSeek fails ("alternative" echoes the scenario).
+# Read-only so a shared instance can't be mutated across requests.
+_VALORANT_FALLBACK: Final[Mapping[str, str]] = MappingProxyType({
+    "suggested": "Continue with default strategy based on economy",
+    "delta": "+5%",
+    "impact": "Better economy management",
+    "reasoning": "Based on standard VALORANT tactics, maintaining economy while adapting to opponent patterns leads to better mid-game positioning."
+})
+
+_ESPORTS_ANALYST_SYS_PROMPT: Final[str] = """You are an esports analyst. Analyze the hypothetical scenario and return a JSON with:
+{
+    "primary_scenario": {
+        "scenario": "description",
+        "success_probability": 0.0-1.0,
+        "expected_outcome": "what would happen",
+        "reasoning": "why this outcome"
+    },
+    "alternative_scenario": {
+        "scenario": "alternative approach",
+        "success_probability": 0.0-1.0,
+        "expected_outcome": "what would happen",
+        "reasoning": "why this outcome"
+    },
+    "recommendation": "which approach is better and why"
+}"""
+
+
+_WHAT_IF_SYS_PROMPT: Final[str] = """You are an elite VALORANT tactical analyst. Analyze the hypothetical scenario with the provided game context.
+
+Return a JSON response with:
+{
+    "round_number": <int>,
+    "score_state": "<current score>",
+    "situation": "<game situation like '3v5 retake C-site'>",
+    "action_taken": "<what the team did>",
+    "action_probability": <0.0-1.0 success probability>,
+    "alternative_action": "<suggested alternative>",
+    "alternative_probability": <0.0-1.0 success probability>,
+    "expected_value_taken": "<expected outcome of action taken>",
+    "expected_value_alternative": "<expected outcome of alternative>",
+    "recommendation": "<which was the better choice and by how much>",
+    "reasoning": "<2-3 sentence tactical explanation>"
+}
+
+Be specific with probabilities. Consider: player count, utility, economy, time, spike state."""
+
+
+@router.post("/grid/hypothetical/valorant", response_class=ORJSONResponse)
+async def hypothetical_valorant(request: Request, body: ScenarioBody) -> Dict[str, Any]:
+    """
+    VALORANT-specific hypothetical analysis.
+    Doesn't require a series_id - uses generic VALORANT context.
+    Expects JSON body `{ "scenario": "..." }`.
+    Send `Accept: text/event-stream` to receive tokens as Server-Sent Events.
+    """
+    scenario = body.scenario
+    
+    def _payload(result: Dict[str, Any], status: str = "success") -> Dict[str, Any]:
+        return {"status": status, "game": "valorant", "scenario": scenario, "result": result}
+    
+    def _fallback_payload() -> Dict[str, Any]:
+        # "degraded" so clients/monitoring can tell the canned answer from a real one
+        return _payload({"alternative": scenario, **_VALORANT_FALLBACK}, status="degraded")
+    
+    user_prompt = f"VALORANT Scenario: {scenario}"
+    
+    if wants_event_stream(request):
+        return event_stream(_deepseek_events(
+            _VALORANT_SYS_PROMPT, user_prompt, _payload,
+            lambda e: ("result", _fallback_payload())
+        ))
+    
+    try:
         response = await deepseek_client.analyze(
-            system_prompt=system_prompt,
-            user_prompt=f"VALORANT Scenario: {scenario}",
-            response_schema={"type": "object"}
+            system_prompt=_VALORANT_SYS_PROMPT,
+            user_prompt=user_prompt,
+            response_schema=OBJECT_SCHEMA
         )
         
-        return {"status": "success", "game": "valorant", "scenario": scenario, "result": response}
+        return ORJSONResponse(content=_payload(response))
     except Exception as e:
-        logger.error(f"VALORANT hypothetical error: {e}")
+        logger.error("VALORANT hypothetical error: %s", e)
         # Return a fallback response if DeepSeek fails
-        return {
-            "status": "success",
-            "game": "valorant", 
-            "scenario": scenario,
-            "result": {
-                "alternative": scenario,
-                "suggested": "Continue with default strategy based on economy",
-                "delta": "+5%",
-                "impact": "Better economy management",
-                "reasoning": "Based on standard VALORANT tactics, maintaining economy while adapting to opponent patterns leads to better mid-game positioning."
-            }
-        }
+        return ORJSONResponse(content=_fallback_payload())
 
 
 @router.post("/grid/hypothetical/{series_id}")
-async def hypothetical_analysis(series_id: str, payload: Dict[str, str] = Body(...)) -> Dict[str, Any]:
+async def hypothetical_analysis(series_id: str, request: Request, body: ScenarioBody) -> Dict[str, Any]:
     """Return live 'what-if' prediction for a series.
     Expects JSON body `{ "scenario": "..." }`.
+    Send `Accept: text/event-stream` to receive tokens as Server-Sent Events.
     """
-    scenario = payload.get("scenario")
-    if not scenario:
-        raise HTTPException(status_code=400, detail="Missing scenario")
+    scenario = body.scenario
+    
+    def _payload(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "success", "series_id": series_id, "scenario": scenario, "result": result}
+    
+    if wants_event_stream(request):
+        return event_stream(_hypothetical_events(series_id, scenario, _payload))
+    
     result = await get_hypothetical_result(series_id, scenario)
-    return {"status": "success", "series_id": series_id, "scenario": scenario, "result": result}
+    return _payload(result)
 
 
 # ============================================================================
@@ -188,9 +344,18 @@ async def hypothetical_analysis(series_id: str, payload: Dict[str, str] = Body(.
 from ..services.stats_analyzer import valorant_stats_analyzer
 from ..models.valorant import WhatIfRequest, WhatIfAnalysis, KASTImpactStats, EconomyStats
 
+def _segments_by_number(segments: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Index GRID round segments by sequenceNumber (first segment wins, as a scan would)."""
+    by_number: Dict[int, Dict[str, Any]] = {}
+    for seg in segments:
+        by_number.setdefault(seg.get("sequenceNumber"), seg)
+    return by_number
+
+
 @router.post("/grid/what-if/{series_id}")
 async def analyze_what_if(
     series_id: str, 
+    request: Request,
     payload: Dict[str, Any] = Body(...)
 ) -> Dict[str, Any]:
     """
@@ -200,6 +365,7 @@ async def analyze_what_if(
     "The 3v5 retake had 15% probability of success. Saving was the superior choice."
     
     Expects JSON body: { "scenario": "...", "round_number": 22 }
+    Send `Accept: text/event-stream` to receive tokens as Server-Sent Events.
     """
     scenario = payload.get("scenario", "")
     round_number = payload.get("round_number")
@@ -207,111 +373,136 @@ async def analyze_what_if(
     if not scenario:
         raise HTTPException(status_code=400, detail="Missing scenario")
     
+    if wants_event_stream(request):
+        return event_stream(_what_if_events(series_id, scenario, round_number))
+    
     try:
-        # Fetch actual match data from GRID
-        game_state = await grid_client.get_game_state(series_id)
-        if not game_state:
-            raise HTTPException(status_code=404, detail="Series not found")
+        user_prompt, round_context = await _what_if_prompt(series_id, scenario, round_number)
         
-        series_data = await grid_client.get_series_state(series_id)
-        
-        # Extract round context if round number provided
-        round_context = None
-        rounds = series_data.get("games", [{}])[0].get("segments", []) if series_data else []
-        
-        if round_number and rounds:
-            for rd in rounds:
-                if rd.get("sequenceNumber") == round_number:
-                    round_context = valorant_stats_analyzer.extract_what_if_context(
-                        rd,
-                        game_state.team_1_name,
-                        game_state.team_2_name,
-                        game_state.team_1_score,
-                        game_state.team_2_score
-                    )
-                    break
+        response = await deepseek_client.analyze(
+            system_prompt=_WHAT_IF_SYS_PROMPT,
+            user_prompt=user_prompt,
+            response_schema=OBJECT_SCHEMA
+        )
         
-        # Build AI prompt with actual context
-        from ..services.deepseek_client import deepseek_client
+        return _what_if_result(series_id, scenario, round_number, response, round_context)
         
-        context_str = ""
-        if round_context:
-            context_str = f"\n\nACTUAL GAME CONTEXT:\n{round_context.to_prompt_context()}"
-        else:
-            context_str = f"""
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("What If analysis error: %s", e)
+        return _what_if_fallback(series_id, scenario, round_number)
+
+
+async def _what_if_events(series_id: str, scenario: str, round_number: Optional[int]) -> AsyncIterator[Tuple[str, Any]]:
+    """SSE events for analyze_what_if: DeepSeek deltas, then the same body as the JSON response."""
+    try:
+        user_prompt, round_context = await _what_if_prompt(series_id, scenario, round_number)
+    except HTTPException as e:
+        yield "error", {"status": "error", "series_id": series_id, "detail": e.detail}
+        return
+    except Exception as e:
+        logger.error("What If analysis error: %s", e)
+        yield "result", _what_if_fallback(series_id, scenario, round_number)
+        return
+    
+    async for event in _deepseek_events(
+        _WHAT_IF_SYS_PROMPT, user_prompt,
+        lambda response: _what_if_result(series_id, scenario, round_number, response, round_context),
+        lambda e: ("result", _what_if_fallback(series_id, scenario, round_number))
+    ):
+        yield event
+
+
+async def _what_if_prompt(
+    series_id: str, scenario: str, round_number: Optional[int]
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Fetch the series from GRID and build the what-if user prompt; returns (prompt, round context dict)."""
+    # Fetch actual match data from GRID (concurrent calls share one series-state request)
+    game_state, series_data = await asyncio.gather(
+        grid_client.get_game_state(series_id),
+        grid_client.get_series_state(series_id)
+    )
+    if not game_state:
+        raise HTTPException(status_code=404, detail="Series not found")
+    
+    # Extract round context if round number provided. GRID segments only
+    # carry per-round player states on some feeds; without them the
+    # extracted context is all defaults (5v5, $0 loadouts), so fall back
+    # to the match context below instead.
+    round_context = None
+    rounds = latest_game(series_data).get("segments") or []
+    
+    rd = _segments_by_number(rounds).get(round_number) if round_number else None
+    if rd is not None and rd.get("player_states"):
+        round_context = valorant_stats_analyzer.extract_what_if_context(
+            rd,
+            game_state.team_1_name,
+            game_state.team_2_name,
+            game_state.team_1_score,
+            game_state.team_2_score
+        )
+    
+    # Build AI prompt with actual context
+    context_str = ""
+    if round_context:
+        context_str = f"\n\nACTUAL GAME CONTEXT:\n{round_context.to_prompt_context()}"
+    else:
+        context_str = f"""
 MATCH CONTEXT:
 Match: {game_state.team_1_name} vs {game_state.team_2_name}
 Score: {game_state.team_1_score} - {game_state.team_2_score}
 Map: {game_state.map_name}
 """
-        
-        system_prompt = """You are an elite VALORANT tactical analyst. Analyze the hypothetical scenario with the provided game context.
-
-Return a JSON response with:
-{
-    "round_number": <int>,
-    "score_state": "<current score>",
-    "situation": "<game situation like '3v5 retake C-site'>",
-    "action_taken": "<what the team did>",
-    "action_probability": <0.0-1.0 success probability>,
-    "alternative_action": "<suggested alternative>",
-    "alternative_probability": <0.0-1.0 success probability>,
-    "expected_value_taken": "<expected outcome of action taken>",
-    "expected_value_alternative": "<expected outcome of alternative>",
-    "recommendation": "<which was the better choice and by how much>",
-    "reasoning": "<2-3 sentence tactical explanation>"
-}
+    
+    return f"SCENARIO: {scenario}{context_str}", round_context.to_dict() if round_context else None
 
-Be specific with probabilities. Consider: player count, utility, economy, time, spike state."""
 
-        user_prompt = f"SCENARIO: {scenario}{context_str}"
-        
-        response = await deepseek_client.analyze(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            response_schema={"type": "object"}
-        )
-        
-        return {
-            "status": "success",
-            "series_id": series_id,
-            "scenario": scenario,
-            "round_number": round_number,
-            "analysis": response,
-            "context": round_context.to_dict() if round_context else None
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"What If analysis error: {e}")
-        # Return fallback with clear indication
-        return {
-            "status": "success",
-            "series_id": series_id,
-            "scenario": scenario,
-            "analysis": {
-                "round_number": round_number or 0,
-                "score_state": "Unknown",
-                "situation": scenario,
-                "action_taken": "Unknown action",
-                "action_probability": 0.35,
-                "alternative_action": "Save weapons and play for economy",
-                "alternative_probability": 0.55,
-                "expected_value_taken": "Risky outcome with low probability",
-                "expected_value_alternative": "Better economy for next round",
-                "recommendation": "Alternative appears superior based on general VALORANT strategy",
-                "reasoning": "Unable to fetch full context. General analysis suggests saving weapons in disadvantaged situations provides better expected value."
-            }
+def _what_if_result(
+    series_id: str,
+    scenario: str,
+    round_number: Optional[int],
+    response: Dict[str, Any],
+    round_context: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        "status": "success",
+        "series_id": series_id,
+        "scenario": scenario,
+        "round_number": round_number,
+        "analysis": response,
+        "context": round_context
+    }
+
+
+def _what_if_fallback(series_id: str, scenario: str, round_number: Optional[int]) -> Dict[str, Any]:
+    """Generic answer when GRID or DeepSeek fails (still "success" for the frontend)."""
+    return {
+        "status": "success",
+        "series_id": series_id,
+        "scenario": scenario,
+        "analysis": {
+            "round_number": round_number or 0,
+            "score_state": "Unknown",
+            "situation": scenario,
+            "action_taken": "Unknown action",
+            "action_probability": 0.35,
+            "alternative_action": "Save weapons and play for economy",
+            "alternative_probability": 0.55,
+            "expected_value_taken": "Risky outcome with low probability",
+            "expected_value_alternative": "Better economy for next round",
+            "recommendation": "Alternative appears superior based on general VALORANT strategy",
+            "reasoning": "Unable to fetch full context. General analysis suggests saving weapons in disadvantaged situations provides better expected value."
         }
+    }
 
 
-@router.post("/grid/enhanced-review/{series_id}")
+@router.post("/grid/enhanced-review/{series_id}", response_class=ORJSONResponse)
 async def get_enhanced_macro_review(
     series_id: str,
     team_name: Optional[str] = Query(None),
     payload: Optional[Dict[str, Any]] = Body(default=None)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Enhanced macro review with hackathon-winning stats.
 
@@ -326,499 +517,62 @@ async def get_enhanced_macro_review(
 
     # Check server-side cache first for instant response
     cache_key = f"{series_id}:{team_name or 'default'}"
-    if cache_key in _enhanced_review_cache:
-        logger.info(f"[Cache HIT] Returning cached review for {cache_key}")
-        return _enhanced_review_cache[cache_key]
+    cached = _enhanced_review_cache.get(cache_key)
+    if cached is not None:
+        logger.info("[Cache HIT] Returning cached review for %s", cache_key)
+        return ORJSONResponse(content=cached)
     
+    # Concurrent misses for the same series/team share one computation
+    result = await _analysis_flight.do(
+        ("enhanced", cache_key),
+        lambda: _compute_enhanced_review(series_id, team_name, cache_key)
+    )
+    # Returned as a Response so FastAPI skips the jsonable_encoder walk
+    return ORJSONResponse(content=result)
+
+
+async def _compute_enhanced_review(series_id: str, team_name: Optional[str], cache_key: str) -> Dict[str, Any]:
+    """Build (and cache, when KAST data is present) the enhanced review (see get_enhanced_macro_review)."""
     try:
         # FAST PATH: Fetch GRID data directly (no AI call)
-        logger.info(f"[Enhanced Review] Fetching GRID data for {series_id}")
-        game_state = await grid_client.get_game_state(series_id)
+        logger.info("[Enhanced Review] Fetching GRID data for %s", series_id)
+        # One series-state request; the raw data is only read for VALORANT rounds
+        game_state, series_data = await grid_client.get_game_state_with_series(series_id)
         if not game_state:
-            logger.error(f"[Enhanced Review] No game state for {series_id}")
+            logger.error("[Enhanced Review] No game state for %s", series_id)
             return {
                 "status": "error",
                 "series_id": series_id,
                 "error": "No game state available"
             }
         
-        series_data = await grid_client.get_series_state(series_id)
-        
-        # Detect game type
-        is_valorant = False
-        lol_maps = ["Summoner's Rift", "Howling Abyss", "Arena"]
-        if game_state.map_name and game_state.map_name not in lol_maps and game_state.map_name != "Unknown":
-            is_valorant = True
-        if not is_valorant:
-            for ps in game_state.player_states:
-                if ps.headshots > 0:
-                    is_valorant = True
-                    break
-        
-        if not is_valorant:
-            # LoL-specific enhanced review with detailed stats
-            target_team = team_name or game_state.team_1_name or "Blue"
-            opponent_team = game_state.team_2_name if target_team == game_state.team_1_name else game_state.team_1_name
-
-            # Calculate player stats for LoL
-            lol_player_scoreboard = []
-            total_team_kills = {"team1": 0, "team2": 0}
-            total_team_deaths = {"team1": 0, "team2": 0}
-            total_team_gold = {"team1": 0, "team2": 0}
-            total_team_damage = {"team1": 0, "team2": 0}
-
-            players = [ps.model_dump() for ps in game_state.player_states] if game_state.player_states else []
-            duration_min = max(1, 30)  # Default 30 min if not available
-
-            # First pass: calculate totals
-            for player in players:
-                player_team = player.get("team_name", "")
-                is_team1 = player_team == game_state.team_1_name or player_team == "blue" or player_team == "Blue"
-                key = "team1" if is_team1 else "team2"
-                total_team_kills[key] += player.get("kills", 0)
-                total_team_deaths[key] += player.get("deaths", 0)
-                total_team_gold[key] += player.get("gold", 0)
-                total_team_damage[key] += player.get("damage_dealt", 0)
-
-            # Second pass: calculate player stats
-            for player in players:
-                player_name = player.get("player_name", "Unknown")
-                champion = player.get("champion", "Unknown")
-                role = player.get("role", "Unknown")
-                player_team = player.get("team_name", "")
-                kills = player.get("kills", 0)
-                deaths = player.get("deaths", 0)
-                assists = player.get("assists", 0)
-                gold = player.get("gold", 0)
-                cs = player.get("cs", 0)
-                vision_score = player.get("vision_score", 0)
-                damage_dealt = player.get("damage_dealt", 0)
-
-                is_team1 = player_team == game_state.team_1_name or player_team == "blue" or player_team == "Blue"
-                key = "team1" if is_team1 else "team2"
-
-                # Calculate derived stats
-                kda_ratio = (kills + assists) / max(deaths, 1)
-                cs_per_min = round(cs / duration_min, 1)
-                gold_per_min = round(gold / duration_min, 0)
-                kp_percent = round(((kills + assists) / max(total_team_kills[key], 1)) * 100, 1)
-                dmg_share = round((damage_dealt / max(total_team_damage[key], 1)) * 100, 1)
-                gold_share = round((gold / max(total_team_gold[key], 1)) * 100, 1)
-                vision_per_min = round(vision_score / duration_min, 2)
-
-                # Isolated deaths estimate (30% of deaths)
-                isolated_deaths = int(deaths * 0.3)
-
-                # Survival rating heuristic
-                survival_rating = max(0, min(100, (kda_ratio * 15) + (18 * 2) - (deaths * 5)))
-
-                # Laning score heuristic
-                laning_score = max(0, min(100, (gold_per_min / 350) * 50 + (cs_per_min / 8) * 50))
-
-                lol_player_scoreboard.append({
-                    "player_name": player_name,
-                    "champion": champion,
-                    "role": role,
-                    "team_name": player_team,
-                    "kills": kills,
-                    "deaths": deaths,
-                    "assists": assists,
-                    "kda": f"{kills}/{deaths}/{assists}",
-                    "kda_ratio": round(kda_ratio, 2),
-                    "cs": cs,
-                    "cs_per_min": cs_per_min,
-                    "gold": gold,
-                    "gold_per_min": gold_per_min,
-                    "kp_percent": kp_percent,
-                    "dmg_share": dmg_share,
-                    "gold_share": gold_share,
-                    "damage_dealt": damage_dealt,
-                    "vision_score": vision_score,
-                    "vision_per_min": vision_per_min,
-                    "isolated_deaths": isolated_deaths,
-                    "survival_rating": round(survival_rating, 1),
-                    "laning_score": round(laning_score, 1)
-                })
-
-            # Sort by gold (best performers first)
-            lol_player_scoreboard.sort(key=lambda x: x["gold"], reverse=True)
-
-            # Calculate role impact (similar to KAST for LoL)
-            role_impact = []
-            for player in lol_player_scoreboard:
-                # Impact score based on KDA, damage share, and KP
-                impact_score = (player["kda_ratio"] * 20) + (player["kp_percent"] * 0.3) + (player["dmg_share"] * 0.5)
-                impact_score = min(100, max(0, impact_score))
-
-                # Generate insight
-                if player["deaths"] == 0:
-                    insight = f"{player['player_name']} had a perfect game with no deaths - exceptional positioning."
-                elif player["kda_ratio"] >= 3:
-                    insight = f"{player['player_name']} dominated with {player['kda']} KDA. High impact on team fights."
-                elif player["isolated_deaths"] >= 3:
-                    insight = f"{player['player_name']} died isolated {player['isolated_deaths']} times. Improve map awareness and positioning."
-                elif player["kp_percent"] < 40:
-                    insight = f"{player['player_name']} had low kill participation ({player['kp_percent']}%). Consider roaming more or joining fights earlier."
-                else:
-                    insight = f"{player['player_name']} contributed {player['dmg_share']:.0f}% of team damage with {player['kp_percent']:.0f}% KP."
-
-                role_impact.append({
-                    "player_name": player["player_name"],
-                    "champion": player["champion"],
-                    "role": player["role"],
-                    "team_name": player["team_name"],
-                    "impact_score": round(impact_score, 1),
-                    "kda_ratio": player["kda_ratio"],
-                    "kp_percent": player["kp_percent"],
-                    "dmg_share": player["dmg_share"],
-                    "isolated_deaths": player["isolated_deaths"],
-                    "insight": insight
-                })
-
-            # Sort role impact by impact score
-            role_impact.sort(key=lambda x: x["impact_score"], reverse=True)
-
-            # Calculate team performance
-            is_team_1 = target_team == game_state.team_1_name
-            target_key = "team1" if is_team_1 else "team2"
-            opponent_key = "team2" if is_team_1 else "team1"
-
-            target_score = game_state.team_1_score if is_team_1 else game_state.team_2_score
-            opponent_score = game_state.team_2_score if is_team_1 else game_state.team_1_score
-            team_won = target_score > opponent_score
-
-            gold_diff = total_team_gold[target_key] - total_team_gold[opponent_key]
-            kd_diff = total_team_kills[target_key] - total_team_deaths[target_key]
-
-            lol_team_performance = {
-                "team_name": target_team,
-                "opponent_name": opponent_team,
-                "result": "WIN" if team_won else "LOSS",
-                "total_kills": total_team_kills[target_key],
-                "total_deaths": total_team_deaths[target_key],
-                "total_gold": total_team_gold[target_key],
-                "total_damage": total_team_damage[target_key],
-                "gold_diff": gold_diff,
-                "kd_diff": kd_diff,
-                "avg_kda": round(sum(p["kda_ratio"] for p in lol_player_scoreboard if p["team_name"] == target_team) / max(1, len([p for p in lol_player_scoreboard if p["team_name"] == target_team])), 2),
-                "avg_cs_min": round(sum(p["cs_per_min"] for p in lol_player_scoreboard if p["team_name"] == target_team) / max(1, len([p for p in lol_player_scoreboard if p["team_name"] == target_team])), 1),
-                "avg_vision": round(sum(p["vision_per_min"] for p in lol_player_scoreboard if p["team_name"] == target_team) / max(1, len([p for p in lol_player_scoreboard if p["team_name"] == target_team])), 2)
-            }
-
-            # Calculate team metrics
-            lol_team_metrics = {
-                "gold_diff_15": int(gold_diff * 0.5),  # Rough estimate for @15
-                "dragon_control_rate": 60.0 if team_won else 40.0,  # Estimate
-                "baron_control_rate": 70.0 if team_won else 30.0,   # Estimate
-                "tower_destruction_rate": 65.0 if team_won else 35.0,
-                "vision_score_per_minute": lol_team_performance["avg_vision"],
-                "lane_pressure_score": round((lol_team_performance["avg_cs_min"] / 8) * 100, 1)
-            }
-
-            # Generate insights
-            lol_insights = []
-            if gold_diff > 5000:
-                lol_insights.append(f"{target_team} dominated economy with +{gold_diff:,} gold advantage.")
-            elif gold_diff < -5000:
-                lol_insights.append(f"{target_team} fell behind in economy ({gold_diff:,} gold). Focus on farming efficiency.")
-
-            if kd_diff > 10:
-                lol_insights.append(f"Strong team fighting with +{kd_diff} kill differential.")
-            elif kd_diff < -10:
-                lol_insights.append(f"Struggled in team fights ({kd_diff} K/D diff). Review engage timing and positioning.")
-
-            if lol_team_performance["avg_vision"] > 1.5:
-                lol_insights.append(f"Excellent vision control ({lol_team_performance['avg_vision']:.1f} vision/min). Maintain this strength.")
-            elif lol_team_performance["avg_vision"] < 0.8:
-                lol_insights.append(f"Vision score is low ({lol_team_performance['avg_vision']:.1f}/min). Prioritize warding objectives.")
-
-            return {
-                "status": "success",
-                "series_id": series_id,
-                "game": "lol",
-                "review": None,
-                "role_impact": role_impact,
-                "team_metrics": lol_team_metrics,
-                "team_performance": lol_team_performance,
-                "player_scoreboard": lol_player_scoreboard,
-                "insights": lol_insights,
-                "team_1": game_state.team_1_name,
-                "team_2": game_state.team_2_name,
-                "map_name": game_state.map_name or "Summoner's Rift",
-                "target_team": target_team
-            }
-        
-        # Extract rounds from series data - FIX: correct nested path
-        rounds = []
-        total_rounds = game_state.team_1_score + game_state.team_2_score
-
-        if series_data:
-            series_state = series_data.get("data", {}).get("seriesState", {})
-            games = series_state.get("games", [])
-            if games:
-                current_game = games[-1]  # Use latest game
-                segments = current_game.get("segments", [])
-
-                # Use segments count as fallback for total_rounds
-                if total_rounds == 0 and len(segments) > 0:
-                    total_rounds = len(segments)
-                    logger.info(f"[Enhanced Review] Using segment count for total_rounds: {total_rounds}")
-
-                # Also try to get score from game teams
-                if total_rounds == 0:
-                    game_teams = current_game.get("teams", [])
-                    for team in game_teams:
-                        score = team.get("score", 0)
-                        total_rounds += score
-                    logger.info(f"[Enhanced Review] Using game teams score: {total_rounds}")
-
-                for seg in segments:
-                    rounds.append({
-                        "round_number": seg.get("sequenceNumber", 0),
-                        "round_type": seg.get("type", "FULL_BUY"),
-                        "winner": "",  # Not available in segments
-                        "player_states": []  # Not available in segments
-                    })
-
-        # Final fallback: estimate from player K/D (typical match is 20-25 rounds)
-        if total_rounds == 0 and game_state.player_states:
-            total_deaths = sum(ps.deaths for ps in game_state.player_states)
-            # In a typical match, ~15-20 kills happen per team per half
-            # Estimate rounds as total deaths / 5 (avg 1 death per team per round)
-            total_rounds = max(13, min(25, total_deaths // 5)) if total_deaths > 0 else 20
-            logger.info(f"[Enhanced Review] Estimated total_rounds from deaths: {total_rounds}")
-        
-        # Determine target team for team-specific analysis
-        target_team = team_name or game_state.team_1_name or "Team 1"
-        opponent_team = game_state.team_2_name if target_team == game_state.team_1_name else game_state.team_1_name
-
-        # Calculate KAST impact for ALL players (frontend will filter by team)
-        kast_impact = []
-        economy_stats = {}
-        player_scoreboard = []
-
-        try:
-            players = [ps.model_dump() for ps in game_state.player_states] if game_state.player_states else []
-
-            # Since GRID HTTP API doesn't provide per-round player states,
-            # we calculate estimated KAST from aggregate stats
-            if players and total_rounds > 0:
-                for player in players:
-                    kills = player.get("kills", 0)
-                    deaths = player.get("deaths", 0)
-                    assists = player.get("assists", 0)
-                    player_name = player.get("player_name", "Unknown")
-                    agent = player.get("champion", player.get("agent", "Unknown"))
-                    player_team = player.get("team_name", "")
-                    damage_dealt = player.get("damage_dealt", 0)
-                    headshots = player.get("headshots", 0)
-                    first_bloods = player.get("first_bloods", 0)
-                    first_deaths = player.get("first_deaths", 0)
-                    clutch_wins = player.get("clutch_wins", 0)
-                    multikills = player.get("multikills", 0)
-
-                    # Calculate ADR (Average Damage per Round)
-                    adr = round(damage_dealt / total_rounds, 1) if total_rounds > 0 else 0
-
-                    # Calculate ACS estimate (Average Combat Score)
-                    # ACS ≈ (Kills * 150 + Assists * 50 + FirstBloods * 50 + ADR) / total_rounds
-                    acs_estimate = round((kills * 150 + assists * 50 + first_bloods * 50 + damage_dealt) / max(total_rounds, 1), 0)
-
-                    # Calculate Headshot %
-                    total_shots_estimate = kills * 4 if kills > 0 else 1  # Rough estimate
-                    hs_percent = round((headshots / max(total_shots_estimate, 1)) * 100, 1)
-
-                    # Estimate KAST: rounds where player got K, A, or survived
-                    survived_rounds = max(0, total_rounds - deaths)
-                    ka_rounds = min(kills + assists, total_rounds)
-                    estimated_kast_rounds = min(total_rounds, survived_rounds + (kills + assists) // 2)
-                    rounds_without_kast = max(0, total_rounds - estimated_kast_rounds)
-
-                    # Estimate loss rate when no KAST based on death patterns
-                    kd_ratio = kills / max(deaths, 1)
-                    estimated_loss_rate = min(95, max(40, 80 - (kd_ratio * 15)))
-                    estimated_win_rate = min(80, max(30, 40 + (kd_ratio * 12)))
-
-                    kast_percentage = (estimated_kast_rounds / total_rounds) * 100 if total_rounds > 0 else 0
-
-                    # Generate insight
-                    if rounds_without_kast == 0:
-                        insight = f"{player_name} maintained KAST in all {total_rounds} rounds - exceptional consistency."
-                    else:
-                        severity = "critically impacts" if estimated_loss_rate >= 70 else "significantly affects" if estimated_loss_rate >= 50 else "impacts"
-                        insight = f"Team loses {estimated_loss_rate:.0f}% of rounds when {player_name} dies without KAST. ({rounds_without_kast}/{total_rounds} rounds without KAST). Their positioning {severity} team performance."
-
-                    kast_impact.append({
-                        "player_name": player_name,
-                        "agent": agent,
-                        "team_name": player_team,
-                        "total_rounds": total_rounds,
-                        "rounds_with_kast": estimated_kast_rounds,
-                        "rounds_without_kast": rounds_without_kast,
-                        "kast_percentage": round(kast_percentage, 1),
-                        "loss_rate_without_kast": round(estimated_loss_rate, 1),
-                        "win_rate_with_kast": round(estimated_win_rate, 1),
-                        "insight": insight
-                    })
-
-                    # Add to player scoreboard
-                    player_scoreboard.append({
-                        "player_name": player_name,
-                        "agent": agent,
-                        "team_name": player_team,
-                        "kills": kills,
-                        "deaths": deaths,
-                        "assists": assists,
-                        "kda": f"{kills}/{deaths}/{assists}",
-                        "kd_ratio": round(kd_ratio, 2),
-                        "adr": adr,
-                        "acs": acs_estimate,
-                        "hs_percent": hs_percent,
-                        "first_bloods": first_bloods,
-                        "first_deaths": first_deaths,
-                        "clutch_wins": clutch_wins,
-                        "multikills": multikills,
-                        "kast_percentage": round(kast_percentage, 1),
-                        "damage_dealt": damage_dealt
-                    })
-
-                # Sort KAST by loss rate (most impactful first)
-                kast_impact.sort(key=lambda x: x["loss_rate_without_kast"], reverse=True)
-                # Sort scoreboard by ACS (best performers first)
-                player_scoreboard.sort(key=lambda x: x["acs"], reverse=True)
-
-            # Calculate team-specific economy analysis
-            team_1_score = game_state.team_1_score
-            team_2_score = game_state.team_2_score
-            is_team_1 = target_team == game_state.team_1_name
-            target_score = team_1_score if is_team_1 else team_2_score
-            opponent_score = team_2_score if is_team_1 else team_1_score
-            team_won = target_score > opponent_score
-
-            # Get team players for aggregate stats
-            team_players = [p for p in player_scoreboard if p["team_name"] == target_team]
-            team_kills = sum(p["kills"] for p in team_players)
-            team_deaths = sum(p["deaths"] for p in team_players)
-            team_damage = sum(p["damage_dealt"] for p in team_players)
-            team_first_bloods = sum(p["first_bloods"] for p in team_players)
-            team_first_deaths = sum(p["first_deaths"] for p in team_players)
-            team_clutches = sum(p["clutch_wins"] for p in team_players)
-            team_multikills = sum(p["multikills"] for p in team_players)
-            team_avg_adr = round(sum(p["adr"] for p in team_players) / max(len(team_players), 1), 1)
-            team_avg_acs = round(sum(p["acs"] for p in team_players) / max(len(team_players), 1), 0)
-
-            # Estimate economy stats from round count with team-specific data
-            pistol_rounds = 2 if total_rounds >= 13 else 1
-            # Better estimation based on score patterns
-            pistol_wins_estimate = 2 if target_score >= 10 else (1 if target_score >= 5 else 0)
-            pistol_wins = min(pistol_wins_estimate, pistol_rounds)
-
-            # Calculate round win rates by type (estimates based on score pattern)
-            attack_rounds = min(12, total_rounds // 2)
-            defense_rounds = total_rounds - attack_rounds
-            # Estimate based on final score distribution
-            attack_wins_estimate = round((target_score / max(total_rounds, 1)) * attack_rounds)
-            defense_wins_estimate = target_score - attack_wins_estimate
-
-            economy_stats = {
-                "team_name": target_team,
-                "total_rounds": total_rounds,
-                "rounds_won": target_score,
-                "rounds_lost": opponent_score,
-                "win_rate": round((target_score / max(total_rounds, 1)) * 100, 1),
-                "pistol_win_rate": round((pistol_wins / max(pistol_rounds, 1)) * 100, 1),
-                "force_buy_win_rate": round(35.0 + (15 if team_won else -10) + (team_first_bloods * 2), 1),
-                "eco_conversion_rate": round(15.0 + (10 if team_won else -5) + (team_clutches * 3), 1),
-                "bonus_loss_rate": round(25.0 + (-10 if team_won else 15), 1),
-                "full_buy_win_rate": round(55.0 + (20 if team_won else -15), 1),
-                "attack_win_rate": round((attack_wins_estimate / max(attack_rounds, 1)) * 100, 1) if attack_rounds > 0 else 50.0,
-                "defense_win_rate": round((defense_wins_estimate / max(defense_rounds, 1)) * 100, 1) if defense_rounds > 0 else 50.0,
-                "insights": []
-            }
-
-            # Team performance stats
-            team_performance = {
-                "team_name": target_team,
-                "opponent_name": opponent_team,
-                "final_score": f"{target_score}-{opponent_score}",
-                "result": "WIN" if team_won else "LOSS",
-                "total_kills": team_kills,
-                "total_deaths": team_deaths,
-                "total_damage": team_damage,
-                "avg_adr": team_avg_adr,
-                "avg_acs": team_avg_acs,
-                "first_bloods": team_first_bloods,
-                "first_deaths": team_first_deaths,
-                "first_blood_rate": round((team_first_bloods / max(total_rounds, 1)) * 100, 1),
-                "first_death_rate": round((team_first_deaths / max(total_rounds, 1)) * 100, 1),
-                "clutch_wins": team_clutches,
-                "multikills": team_multikills,
-                "kd_diff": team_kills - team_deaths
-            }
-
-            # Generate team-specific insights
-            if economy_stats["pistol_win_rate"] < 40:
-                economy_stats["insights"].append(f"{target_team} struggles in pistol rounds ({economy_stats['pistol_win_rate']:.0f}% WR). Focus on pistol setups and utility usage.")
-            elif economy_stats["pistol_win_rate"] >= 75:
-                economy_stats["insights"].append(f"{target_team} dominates pistol rounds ({economy_stats['pistol_win_rate']:.0f}% WR). This is a core strength to maintain.")
-
-            if economy_stats["full_buy_win_rate"] < 50:
-                economy_stats["insights"].append(f"Full buy win rate ({economy_stats['full_buy_win_rate']:.0f}%) is concerning. Review executes and site takes.")
-            elif economy_stats["full_buy_win_rate"] >= 65:
-                economy_stats["insights"].append(f"Strong full buy performance ({economy_stats['full_buy_win_rate']:.0f}% WR). Team executes are working well.")
-
-            if team_performance["first_blood_rate"] > 50:
-                economy_stats["insights"].append(f"{target_team} wins first bloods {team_performance['first_blood_rate']:.0f}% of rounds - strong opening presence.")
-            elif team_performance["first_death_rate"] > 50:
-                economy_stats["insights"].append(f"{target_team} gives up first death {team_performance['first_death_rate']:.0f}% of rounds - review positioning and aggression.")
-
-            if team_performance["kd_diff"] > 10:
-                economy_stats["insights"].append(f"Dominant fragging with +{team_performance['kd_diff']} K/D differential.")
-            elif team_performance["kd_diff"] < -10:
-                economy_stats["insights"].append(f"Negative K/D differential ({team_performance['kd_diff']}). Focus on trading and survival.")
-
-        except Exception as stats_error:
-            logger.warning(f"Stats calculation error: {stats_error}")
-            import traceback
-            logger.warning(traceback.format_exc())
-            team_performance = {}
-        
         # Check if we have a cached AI review from macro_cache
         cached_review = None
-        if series_id in macro_cache:
-            cached_data = macro_cache[series_id]
-            cached_review = cached_data.get("review")
-            logger.info(f"[Enhanced Review] Using cached AI review for {series_id}")
-        
-        result = {
-            "status": "success",
-            "series_id": series_id,
-            "game": "valorant",
-            "review": cached_review,  # May be None if AI review not cached
-            "kast_impact": kast_impact,
-            "economy_analysis": economy_stats,
-            "team_performance": team_performance,
-            "player_scoreboard": player_scoreboard,
-            "what_if_candidates": [],
-            "team_1": game_state.team_1_name,
-            "team_2": game_state.team_2_name,
-            "map_name": game_state.map_name,
-            "target_team": target_team
-        }
+        cached_entry = macro_cache.get(series_id)
+        if cached_entry is not None:
+            cached_review = orjson.loads(cached_entry[0]).get("review")
+            logger.info("[Enhanced Review] Using cached AI review for %s", series_id)
+        
+        # The stats pass is pure CPU - keep it off the event loop
+        result = await asyncio.to_thread(
+            _build_enhanced_review, series_id, team_name, game_state, series_data,
+            cached_review, _is_valorant(series_id, game_state)
+        )
+        if result["game"] != "valorant":
+            return result
 
         # Only cache if we have valid KAST data (not empty)
+        kast_impact = result["kast_impact"]
         if kast_impact and len(kast_impact) > 0:
             _enhanced_review_cache[cache_key] = result
-            logger.info(f"[Cache STORE] Cached review for {cache_key} with {len(kast_impact)} players")
+            logger.info("[Cache STORE] Cached review for %s with %s players", cache_key, len(kast_impact))
         else:
-            logger.warning(f"[Cache SKIP] Not caching {cache_key} - empty KAST data")
+            logger.warning("[Cache SKIP] Not caching %s - empty KAST data", cache_key)
         
         return result
         
     except Exception as e:
-        logger.error(f"Enhanced review error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        detail = _error_detail("Enhanced review failed", e)
         return {
             "status": "partial",
             "series_id": series_id,
@@ -827,181 +581,767 @@ async def get_enhanced_macro_review(
             "kast_impact": [],
             "economy_analysis": {},
             "what_if_candidates": [],
-            "error": str(e)
+            "error": detail
+        }
+
+
+def _build_enhanced_review(
+    series_id: str,
+    team_name: Optional[str],
+    game_state: GameState,
+    series_data: Dict[str, Any],
+    cached_review: Optional[Dict[str, Any]],
+    is_valorant: bool
+) -> Dict[str, Any]:
+    """
+    Stats half of the enhanced review: scoreboards, KAST and economy estimates.
+    Pure CPU on already-fetched data - run via asyncio.to_thread.
+    """
+    if not is_valorant:
+        # LoL-specific enhanced review with detailed stats
+        target_team = team_name or game_state.team_1_name or "Blue"
+        opponent_team = game_state.team_2_name if target_team == game_state.team_1_name else game_state.team_1_name
+
+        # Calculate player stats for LoL
+        lol_player_scoreboard = []
+        total_team_kills = {"team1": 0, "team2": 0}
+        total_team_deaths = {"team1": 0, "team2": 0}
+        total_team_gold = {"team1": 0, "team2": 0}
+        total_team_damage = {"team1": 0, "team2": 0}
+
+        # Read PlayerState attributes directly - no per-player model_dump() dict
+        players = game_state.player_states
+        duration_min = max(1, 30)  # Default 30 min if not available
+
+        # First pass: calculate totals
+        for player in players:
+            player_team = player.team_name
+            is_team1 = player_team == game_state.team_1_name or player_team == "blue" or player_team == "Blue"
+            key = "team1" if is_team1 else "team2"
+            total_team_kills[key] += player.kills
+            total_team_deaths[key] += player.deaths
+            total_team_gold[key] += player.gold
+            total_team_damage[key] += player.damage_dealt
+
+        # Second pass: calculate player stats, accumulating target-team averages inline
+        target_count = 0
+        target_kda_sum = target_cs_min_sum = target_vision_sum = 0.0
+        for player in players:
+            player_name = player.player_name
+            champion = player.champion
+            role = player.role
+            player_team = player.team_name
+            kills = player.kills
+            deaths = player.deaths
+            assists = player.assists
+            gold = player.gold
+            cs = player.cs
+            vision_score = player.vision_score
+            damage_dealt = player.damage_dealt
+
+            is_team1 = player_team == game_state.team_1_name or player_team == "blue" or player_team == "Blue"
+            key = "team1" if is_team1 else "team2"
+
+            # Calculate derived stats
+            kda_ratio = (kills + assists) / max(deaths, 1)
+            cs_per_min = round(cs / duration_min, 1)
+            gold_per_min = round(gold / duration_min, 0)
+            kp_percent = round(((kills + assists) / max(total_team_kills[key], 1)) * 100, 1)
+            dmg_share = round((damage_dealt / max(total_team_damage[key], 1)) * 100, 1)
+            gold_share = round((gold / max(total_team_gold[key], 1)) * 100, 1)
+            vision_per_min = round(vision_score / duration_min, 2)
+
+            # Isolated deaths estimate (30% of deaths)
+            isolated_deaths = int(deaths * 0.3)
+
+            # Survival rating heuristic
+            survival_rating = max(0, min(100, (kda_ratio * 15) + (18 * 2) - (deaths * 5)))
+
+            # Laning score heuristic
+            laning_score = max(0, min(100, (gold_per_min / 350) * 50 + (cs_per_min / 8) * 50))
+
+            lol_player_scoreboard.append({
+                "player_name": player_name,
+                "champion": champion,
+                "role": role,
+                "team_name": player_team,
+                "kills": kills,
+                "deaths": deaths,
+                "assists": assists,
+                "kda": f"{kills}/{deaths}/{assists}",
+                "kda_ratio": round(kda_ratio, 2),
+                "cs": cs,
+                "cs_per_min": cs_per_min,
+                "gold": gold,
+                "gold_per_min": gold_per_min,
+                "kp_percent": kp_percent,
+                "dmg_share": dmg_share,
+                "gold_share": gold_share,
+                "damage_dealt": damage_dealt,
+                "vision_score": vision_score,
+                "vision_per_min": vision_per_min,
+                "isolated_deaths": isolated_deaths,
+                "survival_rating": round(survival_rating, 1),
+                "laning_score": round(laning_score, 1)
+            })
+            if player_team == target_team:
+                target_count += 1
+                target_kda_sum += round(kda_ratio, 2)
+                target_cs_min_sum += cs_per_min
+                target_vision_sum += vision_per_min
+
+        # Sort by gold (best performers first)
+        lol_player_scoreboard.sort(key=lambda x: x["gold"], reverse=True)
+
+        # Calculate role impact (similar to KAST for LoL)
+        role_impact = []
+        for player in lol_player_scoreboard:
+            # Impact score based on KDA, damage share, and KP
+            impact_score = (player["kda_ratio"] * 20) + (player["kp_percent"] * 0.3) + (player["dmg_share"] * 0.5)
+            impact_score = min(100, max(0, impact_score))
+
+            # Generate insight
+            if player["deaths"] == 0:
+                insight = f"{player['player_name']} had a perfect game with no deaths - exceptional positioning."
+            elif player["kda_ratio"] >= 3:
+                insight = f"{player['player_name']} dominated with {player['kda']} KDA. High impact on team fights."
+            elif player["isolated_deaths"] >= 3:
+                insight = f"{player['player_name']} died isolated {player['isolated_deaths']} times. Improve map awareness and positioning."
+            elif player["kp_percent"] < 40:
+                insight = f"{player['player_name']} had low kill participation ({player['kp_percent']}%). Consider roaming more or joining fights earlier."
+            else:
+                insight = f"{player['player_name']} contributed {player['dmg_share']:.0f}% of team damage with {player['kp_percent']:.0f}% KP."
+
+            role_impact.append({
+                "player_name": player["player_name"],
+                "champion": player["champion"],
+                "role": player["role"],
+                "team_name": player["team_name"],
+                "impact_score": round(impact_score, 1),
+                "kda_ratio": player["kda_ratio"],
+                "kp_percent": player["kp_percent"],
+                "dmg_share": player["dmg_share"],
+                "isolated_deaths": player["isolated_deaths"],
+                "insight": insight
+            })
+
+        # Sort role impact by impact score
+        role_impact.sort(key=lambda x: x["impact_score"], reverse=True)
+
+        # Calculate team performance
+        is_team_1 = target_team == game_state.team_1_name
+        target_key = "team1" if is_team_1 else "team2"
+        opponent_key = "team2" if is_team_1 else "team1"
+
+        target_score = game_state.team_1_score if is_team_1 else game_state.team_2_score
+        opponent_score = game_state.team_2_score if is_team_1 else game_state.team_1_score
+        team_won = target_score > opponent_score
+
+        gold_diff = total_team_gold[target_key] - total_team_gold[opponent_key]
+        kd_diff = total_team_kills[target_key] - total_team_deaths[target_key]
+
+        lol_team_performance = {
+            "team_name": target_team,
+            "opponent_name": opponent_team,
+            "result": "WIN" if team_won else "LOSS",
+            "total_kills": total_team_kills[target_key],
+            "total_deaths": total_team_deaths[target_key],
+            "total_gold": total_team_gold[target_key],
+            "total_damage": total_team_damage[target_key],
+            "gold_diff": gold_diff,
+            "kd_diff": kd_diff,
+            "avg_kda": round(target_kda_sum / max(1, target_count), 2),
+            "avg_cs_min": round(target_cs_min_sum / max(1, target_count), 1),
+            "avg_vision": round(target_vision_sum / max(1, target_count), 2)
+        }
+
+        # Calculate team metrics
+        lol_team_metrics = {
+            "gold_diff_15": int(gold_diff * 0.5),  # Rough estimate for @15
+            "dragon_control_rate": 60.0 if team_won else 40.0,  # Estimate
+            "baron_control_rate": 70.0 if team_won else 30.0,   # Estimate
+            "tower_destruction_rate": 65.0 if team_won else 35.0,
+            "vision_score_per_minute": lol_team_performance["avg_vision"],
+            "lane_pressure_score": round((lol_team_performance["avg_cs_min"] / 8) * 100, 1)
+        }
+
+        # Generate insights
+        lol_insights = []
+        if gold_diff > 5000:
+            lol_insights.append(f"{target_team} dominated economy with +{gold_diff:,} gold advantage.")
+        elif gold_diff < -5000:
+            lol_insights.append(f"{target_team} fell behind in economy ({gold_diff:,} gold). Focus on farming efficiency.")
+
+        if kd_diff > 10:
+            lol_insights.append(f"Strong team fighting with +{kd_diff} kill differential.")
+        elif kd_diff < -10:
+            lol_insights.append(f"Struggled in team fights ({kd_diff} K/D diff). Review engage timing and positioning.")
+
+        if lol_team_performance["avg_vision"] > 1.5:
+            lol_insights.append(f"Excellent vision control ({lol_team_performance['avg_vision']:.1f} vision/min). Maintain this strength.")
+        elif lol_team_performance["avg_vision"] < 0.8:
+            lol_insights.append(f"Vision score is low ({lol_team_performance['avg_vision']:.1f}/min). Prioritize warding objectives.")
+
+        return {
+            "status": "success",
+            "series_id": series_id,
+            "game": "lol",
+            "review": None,
+            "role_impact": role_impact,
+            "team_metrics": lol_team_metrics,
+            "team_performance": lol_team_performance,
+            "player_scoreboard": lol_player_scoreboard,
+            "insights": lol_insights,
+            "team_1": game_state.team_1_name,
+            "team_2": game_state.team_2_name,
+            "map_name": game_state.map_name or "Summoner's Rift",
+            "target_team": target_team
+        }
+    
+    # Extract rounds from series data - FIX: correct nested path
+    rounds = []
+    total_rounds = game_state.team_1_score + game_state.team_2_score
+
+    if series_data:
+        current_game = latest_game(series_data)
+        if current_game:
+            segments = current_game.get("segments") or []
+
+            # Use segments count as fallback for total_rounds
+            if total_rounds == 0 and len(segments) > 0:
+                total_rounds = len(segments)
+                logger.info("[Enhanced Review] Using segment count for total_rounds: %s", total_rounds)
+
+            # Also try to get score from game teams
+            if total_rounds == 0:
+                game_teams = current_game.get("teams", [])
+                for team in game_teams:
+                    score = team.get("score", 0)
+                    total_rounds += score
+                logger.info("[Enhanced Review] Using game teams score: %s", total_rounds)
+
+            for seg in segments:
+                rounds.append({
+                    "round_number": seg.get("sequenceNumber", 0),
+                    "round_type": seg.get("type", "FULL_BUY"),
+                    "winner": "",  # Not available in segments
+                    "player_states": []  # Not available in segments
+                })
+
+    # Final fallback: estimate from player K/D (typical match is 20-25 rounds)
+    if total_rounds == 0 and game_state.player_states:
+        total_deaths = sum(ps.deaths for ps in game_state.player_states)
+        # In a typical match, ~15-20 kills happen per team per half
+        # Estimate rounds as total deaths / 5 (avg 1 death per team per round)
+        total_rounds = max(13, min(25, total_deaths // 5)) if total_deaths > 0 else 20
+        logger.info("[Enhanced Review] Estimated total_rounds from deaths: %s", total_rounds)
+    
+    # Determine target team for team-specific analysis
+    target_team = team_name or game_state.team_1_name or "Team 1"
+    opponent_team = game_state.team_2_name if target_team == game_state.team_1_name else game_state.team_1_name
+
+    # Calculate KAST impact for ALL players (frontend will filter by team)
+    kast_impact = []
+    economy_stats = {}
+    player_scoreboard = []
+
+    # Target-team aggregates, accumulated in the same pass that builds the rows
+    team_size = 0
+    team_kills = team_deaths = team_damage = 0
+    team_first_bloods = team_first_deaths = team_clutches = team_multikills = 0
+    team_adr_sum = team_acs_sum = 0.0
+
+    try:
+        players = game_state.player_states
+
+        # Since GRID HTTP API doesn't provide per-round player states,
+        # we calculate estimated KAST from aggregate stats
+        if players and total_rounds > 0:
+            for player in players:
+                kast_row, scoreboard_row = _valorant_player_rows(player, total_rounds)
+                kast_impact.append(kast_row)
+                player_scoreboard.append(scoreboard_row)
+                if player.team_name == target_team:
+                    team_size += 1
+                    team_kills += player.kills
+                    team_deaths += player.deaths
+                    team_damage += player.damage_dealt
+                    team_first_bloods += player.first_bloods
+                    team_first_deaths += player.first_deaths
+                    team_clutches += player.clutch_wins
+                    team_multikills += player.multikills
+                    team_adr_sum += scoreboard_row["adr"]
+                    team_acs_sum += scoreboard_row["acs"]
+
+            # Sort KAST by loss rate (most impactful first)
+            kast_impact.sort(key=lambda x: x["loss_rate_without_kast"], reverse=True)
+            # Sort scoreboard by ACS (best performers first)
+            player_scoreboard.sort(key=lambda x: x["acs"], reverse=True)
+
+        # Calculate team-specific economy analysis
+        team_1_score = game_state.team_1_score
+        team_2_score = game_state.team_2_score
+        is_team_1 = target_team == game_state.team_1_name
+        target_score = team_1_score if is_team_1 else team_2_score
+        opponent_score = team_2_score if is_team_1 else team_1_score
+        team_won = target_score > opponent_score
+
+        team_avg_adr = round(team_adr_sum / max(team_size, 1), 1)
+        team_avg_acs = round(team_acs_sum / max(team_size, 1), 0)
+
+        # Estimate economy stats from round count with team-specific data
+        pistol_rounds = 2 if total_rounds >= 13 else 1
+        # Better estimation based on score patterns
+        pistol_wins_estimate = 2 if target_score >= 10 else (1 if target_score >= 5 else 0)
+        pistol_wins = min(pistol_wins_estimate, pistol_rounds)
+
+        # Calculate round win rates by type (estimates based on score pattern)
+        attack_rounds = min(12, total_rounds // 2)
+        defense_rounds = total_rounds - attack_rounds
+        # Estimate based on final score distribution
+        attack_wins_estimate = round((target_score / max(total_rounds, 1)) * attack_rounds)
+        defense_wins_estimate = target_score - attack_wins_estimate
+
+        economy_stats = {
+            "team_name": target_team,
+            "total_rounds": total_rounds,
+            "rounds_won": target_score,
+            "rounds_lost": opponent_score,
+            "win_rate": round((target_score / max(total_rounds, 1)) * 100, 1),
+            "pistol_win_rate": round((pistol_wins / max(pistol_rounds, 1)) * 100, 1),
+            "force_buy_win_rate": round(35.0 + (15 if team_won else -10) + (team_first_bloods * 2), 1),
+            "eco_conversion_rate": round(15.0 + (10 if team_won else -5) + (team_clutches * 3), 1),
+            "bonus_loss_rate": round(25.0 + (-10 if team_won else 15), 1),
+            "full_buy_win_rate": round(55.0 + (20 if team_won else -15), 1),
+            "attack_win_rate": round((attack_wins_estimate / max(attack_rounds, 1)) * 100, 1) if attack_rounds > 0 else 50.0,
+            "defense_win_rate": round((defense_wins_estimate / max(defense_rounds, 1)) * 100, 1) if defense_rounds > 0 else 50.0,
+            "insights": []
         }
 
+        # Team performance stats
+        team_performance = {
+            "team_name": target_team,
+            "opponent_name": opponent_team,
+            "final_score": f"{target_score}-{opponent_score}",
+            "result": "WIN" if team_won else "LOSS",
+            "total_kills": team_kills,
+            "total_deaths": team_deaths,
+            "total_damage": team_damage,
+            "avg_adr": team_avg_adr,
+            "avg_acs": team_avg_acs,
+            "first_bloods": team_first_bloods,
+            "first_deaths": team_first_deaths,
+            "first_blood_rate": round((team_first_bloods / max(total_rounds, 1)) * 100, 1),
+            "first_death_rate": round((team_first_deaths / max(total_rounds, 1)) * 100, 1),
+            "clutch_wins": team_clutches,
+            "multikills": team_multikills,
+            "kd_diff": team_kills - team_deaths
+        }
 
-@router.get("/grid/round-timeline/{series_id}")
-async def get_round_timeline(series_id: str) -> Dict[str, Any]:
+        # Generate team-specific insights
+        if economy_stats["pistol_win_rate"] < 40:
+            economy_stats["insights"].append(f"{target_team} struggles in pistol rounds ({economy_stats['pistol_win_rate']:.0f}% WR). Focus on pistol setups and utility usage.")
+        elif economy_stats["pistol_win_rate"] >= 75:
+            economy_stats["insights"].append(f"{target_team} dominates pistol rounds ({economy_stats['pistol_win_rate']:.0f}% WR). This is a core strength to maintain.")
+
+        if economy_stats["full_buy_win_rate"] < 50:
+            economy_stats["insights"].append(f"Full buy win rate ({economy_stats['full_buy_win_rate']:.0f}%) is concerning. Review executes and site takes.")
+        elif economy_stats["full_buy_win_rate"] >= 65:
+            economy_stats["insights"].append(f"Strong full buy performance ({economy_stats['full_buy_win_rate']:.0f}% WR). Team executes are working well.")
+
+        if team_performance["first_blood_rate"] > 50:
+            economy_stats["insights"].append(f"{target_team} wins first bloods {team_performance['first_blood_rate']:.0f}% of rounds - strong opening presence.")
+        elif team_performance["first_death_rate"] > 50:
+            economy_stats["insights"].append(f"{target_team} gives up first death {team_performance['first_death_rate']:.0f}% of rounds - review positioning and aggression.")
+
+        if team_performance["kd_diff"] > 10:
+            economy_stats["insights"].append(f"Dominant fragging with +{team_performance['kd_diff']} K/D differential.")
+        elif team_performance["kd_diff"] < -10:
+            economy_stats["insights"].append(f"Negative K/D differential ({team_performance['kd_diff']}). Focus on trading and survival.")
+
+    except Exception as stats_error:
+        logger.warning("Stats calculation error: %s", stats_error)
+        logger.warning(traceback.format_exc())
+        team_performance = {}
+    
+    result = {
+        "status": "success",
+        "series_id": series_id,
+        "game": "valorant",
+        "review": cached_review,  # May be None if AI review not cached
+        "kast_impact": kast_impact,
+        "economy_analysis": economy_stats,
+        "team_performance": team_performance,
+        "player_scoreboard": player_scoreboard,
+        "what_if_candidates": [],
+        "team_1": game_state.team_1_name,
+        "team_2": game_state.team_2_name,
+        "map_name": game_state.map_name,
+        "target_team": target_team
+    }
+    return result
+
+
+def _valorant_player_rows(player: PlayerState, total_rounds: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    KAST-impact and scoreboard rows for one VALORANT player, estimated from
+    aggregate stats (GRID's HTTP API has no per-round player states).
+    `total_rounds` must be positive.
+    """
+    kills = player.kills
+    deaths = player.deaths
+    assists = player.assists
+    player_name = player.player_name
+    agent = player.champion  # GRID maps the VALORANT agent onto `champion`
+    player_team = player.team_name
+    damage_dealt = player.damage_dealt
+    headshots = player.headshots
+    first_bloods = player.first_bloods
+    first_deaths = player.first_deaths
+    clutch_wins = player.clutch_wins
+    multikills = player.multikills
+
+    # ADR (Average Damage per Round)
+    adr = round(damage_dealt / total_rounds, 1)
+
+    # ACS estimate (Average Combat Score)
+    # ACS ≈ (Kills * 150 + Assists * 50 + FirstBloods * 50 + ADR) / total_rounds
+    acs_estimate = round((kills * 150 + assists * 50 + first_bloods * 50 + damage_dealt) / total_rounds, 0)
+
+    # Headshot %
+    total_shots_estimate = kills * 4 if kills > 0 else 1  # Rough estimate
+    hs_percent = round((headshots / total_shots_estimate) * 100, 1)
+
+    # Estimate KAST: rounds where player got K, A, or survived
+    survived_rounds = max(0, total_rounds - deaths)
+    estimated_kast_rounds = min(total_rounds, survived_rounds + (kills + assists) // 2)
+    rounds_without_kast = max(0, total_rounds - estimated_kast_rounds)
+
+    # Estimate loss rate when no KAST based on death patterns
+    kd_ratio = kills / max(deaths, 1)
+    estimated_loss_rate = min(95, max(40, 80 - (kd_ratio * 15)))
+    estimated_win_rate = min(80, max(30, 40 + (kd_ratio * 12)))
+
+    kast_percentage = round((estimated_kast_rounds / total_rounds) * 100, 1)
+
+    if rounds_without_kast == 0:
+        insight = f"{player_name} maintained KAST in all {total_rounds} rounds - exceptional consistency."
+    else:
+        severity = "critically impacts" if estimated_loss_rate >= 70 else "significantly affects" if estimated_loss_rate >= 50 else "impacts"
+        insight = f"Team loses {estimated_loss_rate:.0f}% of rounds when {player_name} dies without KAST. ({rounds_without_kast}/{total_rounds} rounds without KAST). Their positioning {severity} team performance."
+
+    kast_row = {
+        "player_name": player_name,
+        "agent": agent,
+        "team_name": player_team,
+        "total_rounds": total_rounds,
+        "rounds_with_kast": estimated_kast_rounds,
+        "rounds_without_kast": rounds_without_kast,
+        "kast_percentage": kast_percentage,
+        "loss_rate_without_kast": round(estimated_loss_rate, 1),
+        "win_rate_with_kast": round(estimated_win_rate, 1),
+        "insight": insight
+    }
+    scoreboard_row = {
+        "player_name": player_name,
+        "agent": agent,
+        "team_name": player_team,
+        "kills": kills,
+        "deaths": deaths,
+        "assists": assists,
+        "kda": f"{kills}/{deaths}/{assists}",
+        "kd_ratio": round(kd_ratio, 2),
+        "adr": adr,
+        "acs": acs_estimate,
+        "hs_percent": hs_percent,
+        "first_bloods": first_bloods,
+        "first_deaths": first_deaths,
+        "clutch_wins": clutch_wins,
+        "multikills": multikills,
+        "kast_percentage": kast_percentage,
+        "damage_dealt": damage_dealt
+    }
+    return kast_row, scoreboard_row
+
+
+@router.get("/grid/round-timeline/{series_id}", response_class=ORJSONResponse)
+async def get_round_timeline(series_id: str, request: Request) -> Response:
     """
     Get round-by-round timeline data for visual display.
     
     Returns rounds with winners and critical moment markers for the MatchTimeline component.
     Used for the "wow factor" visual timeline on the frontend.
+    
+    Send `Accept: application/x-ndjson` to stream a header row, one row per
+    round and a trailer with the critical round numbers instead.
     """
     try:
-        game_state = await grid_client.get_game_state(series_id)
-        series_data = await grid_client.get_series_state(series_id)
+        # Concurrent calls share one series-state request
+        game_state, series_data = await asyncio.gather(
+            grid_client.get_game_state(series_id),
+            grid_client.get_series_state(series_id)
+        )
         
         if not game_state or not series_data:
             raise HTTPException(status_code=404, detail="Series not found")
         
-        rounds = []
-        critical_rounds = []
-        
-        # Extract round data from series
-        games = series_data.get("games", [])
-        if games:
-            segments = games[0].get("segments", [])
-            for seg in segments:
-                round_num = seg.get("sequenceNumber", 0)
-                meta = seg.get("meta", {})
-                round_type = meta.get("round_type", "FULL_BUY").upper()
-                winner = meta.get("winner", "")
-                
-                # Determine if this is a critical round
-                is_critical = False
-                critical_reason = None
-                
-                # Pistol rounds are critical
-                if round_num in [1, 13]:
-                    is_critical = True
-                    critical_reason = "Pistol Round"
-                
-                # Rounds with significant score impact (close games)
-                state = seg.get("state", {})
-                score_diff = abs(state.get("team1_score", 0) - state.get("team2_score", 0))
-                if score_diff <= 2 and round_num > 10:
-                    is_critical = True
-                    critical_reason = critical_reason or "Close Game Pivot"
-                
-                # OT rounds
-                if round_num > 24:
-                    is_critical = True
-                    critical_reason = "Overtime"
-                
-                round_data = {
-                    "number": round_num,
-                    "winner": winner,
-                    "round_type": round_type,
-                    "is_critical": is_critical
-                }
-                
-                if critical_reason:
-                    round_data["critical_reason"] = critical_reason
-                    critical_rounds.append(round_num)
-                
-                rounds.append(round_data)
-        
-        # Sort by round number
-        rounds.sort(key=lambda r: r["number"])
-        
-        return {
+        # Extract round data from the current game, in round order
+        segments = sorted(
+            latest_game(series_data).get("segments") or [],
+            key=lambda seg: seg.get("sequenceNumber", 0)
+        )
+        header = {
             "status": "success",
             "series_id": series_id,
             "team_1": game_state.team_1_name,
             "team_2": game_state.team_2_name,
-            "map": game_state.map_name,
+            "map": game_state.map_name
+        }
+        
+        if wants_ndjson(request):
+            # Rounds are shaped lazily as the stream is consumed
+            return ndjson_stream(itertools.chain((header,), _timeline_rows(segments)))
+        
+        rounds = []
+        critical_rounds: Set[int] = set()
+        for seg in segments:
+            round_data = _timeline_round(seg)
+            if "critical_reason" in round_data:
+                critical_rounds.add(round_data["number"])
+            rounds.append(round_data)
+        
+        return ORJSONResponse(content={
+            **header,
             "rounds": rounds,
-            "critical_round_numbers": sorted(set(critical_rounds)),
+            "critical_round_numbers": sorted(critical_rounds),
             "total_rounds": len(rounds)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Round timeline error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Round timeline failed", e)
 
 
-# Simple in-memory cache for expensive AI analysis
-# Key: series_id, Value: Analysis Result
-macro_cache = {}
-insights_cache = {}
+def _timeline_round(seg: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape one GRID round segment into a timeline row with its critical-moment marker."""
+    round_num = seg.get("sequenceNumber", 0)
+    meta = seg.get("meta", {})
+    round_type = meta.get("round_type", "FULL_BUY").upper()
+    winner = meta.get("winner", "")
+    
+    # Determine if this is a critical round
+    is_critical = False
+    critical_reason = None
+    
+    # Pistol rounds are critical
+    if round_num in [1, 13]:
+        is_critical = True
+        critical_reason = "Pistol Round"
+    
+    # Rounds with significant score impact (close games) - only when
+    # the segment carries a running score, else every late round would match
+    state = seg.get("state") or {}
+    score_diff = abs(state.get("team1_score", 0) - state.get("team2_score", 0))
+    if state and score_diff <= 2 and round_num > 10:
+        is_critical = True
+        critical_reason = critical_reason or "Close Game Pivot"
+    
+    # OT rounds
+    if round_num > 24:
+        is_critical = True
+        critical_reason = "Overtime"
+    
+    round_data = {
+        "number": round_num,
+        "winner": winner,
+        "round_type": round_type,
+        "is_critical": is_critical
+    }
+    
+    if critical_reason:
+        round_data["critical_reason"] = critical_reason
+    
+    return round_data
 
-@router.post("/grid/macro-review/{series_id}")
-async def get_macro_review(series_id: str) -> Dict[str, Any]:
+
+def _timeline_rows(segments: List[Dict[str, Any]]):
+    """Yield timeline rows one round at a time, then the critical-round trailer."""
+    critical_rounds: Set[int] = set()
+    for seg in segments:
+        round_data = _timeline_round(seg)
+        if "critical_reason" in round_data:
+            critical_rounds.add(round_data["number"])
+        yield round_data
+    yield {"critical_round_numbers": sorted(critical_rounds), "total_rounds": len(segments)}
+
+
+# Bounded TTL+LRU caches for expensive AI analysis
+# Key: series_id (macro) / (series_id, player) (insights)
+# Value: the serialized JSON body, so cache hits skip re-encoding entirely
+macro_cache = TTLCache(maxsize=256, ttl=300)  # series_id -> (json bytes, etag)
+insights_cache = TTLCache(maxsize=256, ttl=300)
+
+# Coalesces concurrent cache misses so a hot series triggers one GRID+DeepSeek pipeline
+_analysis_flight = SingleFlight()
+
+
+# Stored analyses are only replayed for the same analyzer version and model
+_ANALYSIS_VERSION: Final[str] = f"{settings.ANALYSIS_CACHE_VERSION}:{settings.DEEPSEEK_MODEL}"
+
+
+def _analysis_cutoff() -> datetime:
+    """Oldest created_at still replayed (ANALYSIS_CACHE_MAX_AGE)."""
+    return db_models.utcnow() - timedelta(seconds=settings.ANALYSIS_CACHE_MAX_AGE)
+
+
+def _read_finished_analysis(series_id: str, endpoint: str) -> Optional[bytes]:
+    CachedAnalysis = db_models.CachedAnalysis
+    with SessionLocal() as db:
+        return db.scalar(
+            select(CachedAnalysis.payload).where(
+                CachedAnalysis.series_id == series_id,
+                CachedAnalysis.endpoint == endpoint,
+                CachedAnalysis.version == _ANALYSIS_VERSION,
+                CachedAnalysis.created_at >= _analysis_cutoff()
+            )
+        )
+
+
+def _write_finished_analysis(series_id: str, endpoint: str, payload: bytes) -> None:
+    CachedAnalysis = db_models.CachedAnalysis
+    with SessionLocal() as db:
+        # Writes are rare (once per finished series), so they also clear out
+        # rows from older versions or past the max age
+        db.execute(delete(CachedAnalysis).where(
+            (CachedAnalysis.version != _ANALYSIS_VERSION) | (CachedAnalysis.created_at < _analysis_cutoff())
+        ))
+        db.merge(CachedAnalysis(
+            series_id=series_id, endpoint=endpoint, version=_ANALYSIS_VERSION,
+            payload=payload, created_at=db_models.utcnow()
+        ))
+        db.commit()
+
+
+async def _load_finished_analysis(series_id: str, endpoint: str) -> Optional[bytes]:
+    """Stored JSON body of a finished series' analysis, if any. Best effort - DB errors read as a miss."""
+    try:
+        return await asyncio.to_thread(_read_finished_analysis, series_id, endpoint)
+    except Exception as e:
+        logger.warning("Cached analysis lookup failed for %s/%s: %r", series_id, endpoint, e)
+        return None
+
+
+async def _store_finished_analysis(series_id: str, endpoint: str, result: Dict[str, Any]) -> None:
+    """Persist a finished series' analysis so repeat calls skip GRID and DeepSeek (best effort)."""
+    try:
+        await asyncio.to_thread(_write_finished_analysis, series_id, endpoint, dumps(result))
+    except Exception as e:
+        logger.warning("Caching analysis failed for %s/%s: %r", series_id, endpoint, e)
+
+# LoL map names - anything else named (and not "Unknown") is treated as VALORANT
+_LOL_MAPS: Final[FrozenSet[str]] = frozenset({"Summoner's Rift", "Howling Abyss", "Arena"})
+
+# series_id -> is VALORANT; a series never changes title
+_game_type_cache = TTLCache(maxsize=1024, ttl=3600)
+
+
+def _is_valorant(series_id: str, game_state: GameState) -> bool:
+    """
+    Detect the game of a series - GRID title when known, otherwise map and
+    player stats. Cached per series once the answer is definitive (title known
+    or VALORANT evidence seen); a "no" from the heuristics alone may just mean
+    a live series hasn't produced a headshot yet, so it is re-checked.
+    """
+    cached = _game_type_cache.get(series_id)
+    if cached is not None:
+        return cached
+    if game_state.title_id is not None:
+        is_valorant = game_state.title_id == VALORANT_TITLE_ID
+    else:
+        # 1. Map Name Heuristic / 2. Stat Heuristic (headshots are always 0 in LoL)
+        is_valorant = (
+            bool(game_state.map_name) and game_state.map_name not in _LOL_MAPS and game_state.map_name != "Unknown"
+        ) or any(ps.headshots > 0 for ps in game_state.player_states)
+        if not is_valorant:
+            return False
+    _game_type_cache[series_id] = is_valorant
+    return is_valorant
+
+# Reviews are idempotent per series: let clients reuse them briefly and revalidate via ETag
+_REVIEW_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=300"
+
+
+@router.post("/grid/macro-review/{series_id}", response_class=ORJSONResponse)
+async def get_macro_review(series_id: str, request: Request) -> Dict[str, Any]:
     """
     Generate macro review from GRID series data.
     Uses live GRID data + DeepSeek AI for analysis.
     Supports both League of Legends and VALORANT.
+    Successful reviews carry an ETag; resend it in If-None-Match to get a 304.
     """
     # Check cache first
-    if series_id in macro_cache:
-        logger.info(f"Serving macro review for {series_id} from cache")
-        return macro_cache[series_id]
-
+    cached = macro_cache.get(series_id)
+    if cached is not None:
+        logger.info("Serving macro review for %s from cache", series_id)
+        payload, etag = cached
+        response = cached_json_response(request, payload, etag, _REVIEW_CACHE_CONTROL)
+        response.headers["X-Cache"] = "HIT"
+        return response
+
+    payload, etag = await _analysis_flight.do(("macro", series_id), lambda: _compute_macro_review(series_id))
+    if etag is None:
+        # Fallback result - don't let clients hold on to it
+        response = _json_bytes_response(payload)
+    else:
+        response = cached_json_response(request, payload, etag, _REVIEW_CACHE_CONTROL)
+    response.headers["X-Cache"] = "MISS"
+    return response
+
+
+def _json_bytes_response(payload: bytes, cache_status: Optional[str] = None) -> Response:
+    """Wrap an already-serialized JSON body in a response, tagging X-Cache if given."""
+    headers = {"X-Cache": cache_status} if cache_status else None
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+async def _compute_macro_review(series_id: str) -> Tuple[bytes, Optional[str]]:
+    """
+    Run the GRID + DeepSeek macro review pipeline and cache successful results.
+    Returns the JSON body and its ETag (None for the uncached fallback).
+    """
     try:
-        # Fetch series state from GRID
-        game_state = await grid_client.get_game_state(series_id)
+        # Match + GameState come from one series-state fetch; the raw state
+        # call below is then served by the same in-flight request
+        (match, game_state), series_data = await asyncio.gather(
+            grid_client.get_bundle(series_id),
+            grid_client.get_series_state(series_id)
+        )
         if not game_state:
             raise HTTPException(status_code=404, detail="Series not found or no data available")
-        
-        # Get series state (raw dict)
-        series_data = await grid_client.get_series_state(series_id)
         if not series_data:
             raise HTTPException(status_code=404, detail="Could not get match data")
         
-        # Detect game type from map and player stats
-        # 1. Map Name Heuristic
-        is_valorant = False
-        lol_maps = ["Summoner's Rift", "Howling Abyss", "Arena"]
-        if game_state.map_name and game_state.map_name not in lol_maps and game_state.map_name != "Unknown":
-            is_valorant = True
-            
-        # 2. Stat Heuristic (Headshots are Valorant-specific)
-        if not is_valorant:
-            for ps in game_state.player_states:
-                # In LoL, headshots are 0. In Valorant, usually > 0.
-                if ps.headshots > 0:
-                    is_valorant = True
-                    break
+        is_valorant = _is_valorant(series_id, game_state)
         
-        # Get match for analysis (this returns a Match object)
-        match = await grid_client.get_match_for_analysis(series_id)
         if not match:
             raise HTTPException(status_code=404, detail="Could not create match for analysis")
         
         if is_valorant:
             # Use Valorant Analyzer
             review = await valorant_analyzer.generate_macro_review_from_grid(match, game_state)
-            result = {
-                "status": "success",
-                "series_id": series_id,
-                "game": "valorant",
-                "review": review.dict()
-            }
-            macro_cache[series_id] = result
-            return result
+            build_result = _build_valorant_result
         else:
             # Use LoL Analyzer (renamed from Macro Review Generator)
             review = await lol_analyzer.generate_review(match, game_state)
-            
-            result = {
-                "status": "success",
-                "series_id": series_id,
-                "game": "lol",
-                "review": {
-                    "executive_summary": review.executive_summary,
-                    "key_takeaways": review.key_takeaways,
-                    "critical_moments": [
-                        {
-                            "timestamp_formatted": cm.timestamp_formatted,
-                            "description": cm.description,
-                            "decision_made": cm.decision_made,
-                            "outcome": cm.outcome,
-                            "alternative_decision": cm.alternative_decision,
-                            "impact_score": cm.impact_score
-                        } for cm in review.critical_moments
-                    ],
-                    "priority_review_points": review.priority_review_points,
-                    "training_recommendations": review.training_recommendations
-                }
-            }
-            macro_cache[series_id] = result
-            return result
+            build_result = _build_lol_result
+        
+        # Dump + encode off the event loop; large reviews take measurable CPU
+        payload = await asyncio.to_thread(lambda: dumps(build_result(series_id, review)))
+        macro_cache[series_id] = entry = (payload, etag_for(payload))
+        return entry
     except Exception as e:
-        logger.error(f"Macro review error: {e}")
+        detail = _error_detail("Macro review failed", e)
         # Return graceful fallback instead of 500 crash
         failed_result = {
             "status": "partial_success",
@@ -1013,64 +1353,131 @@ async def get_macro_review(series_id: str) -> Dict[str, Any]:
                 "training_recommendations": [],
                 "critical_moments": []
             },
-            "error": str(e)
+            "error": detail
         }
-        return failed_result
+        return dumps(failed_result), None
+
+
+
+def _build_valorant_result(series_id: str, review: EnhancedMacroReview) -> Dict[str, Any]:
+    """Shape a VALORANT macro review into the /grid/macro-review response body."""
+    return {
+        "status": "success",
+        "series_id": series_id,
+        "game": "valorant",
+        "review": review.model_dump()
+    }
+
+
+def _build_lol_result(series_id: str, review: MacroReviewAgenda) -> Dict[str, Any]:
+    """Shape a LoL macro review agenda into the /grid/macro-review response body."""
+    return {
+        "status": "success",
+        "series_id": series_id,
+        "game": "lol",
+        "review": {
+            "executive_summary": review.executive_summary,
+            "key_takeaways": review.key_takeaways,
+            "critical_moments": [
+                {
+                    "timestamp_formatted": cm.timestamp_formatted,
+                    "description": cm.description,
+                    "decision_made": cm.decision_made,
+                    "outcome": cm.outcome,
+                    "alternative_decision": cm.alternative_decision,
+                    "impact_score": cm.impact_score
+                } for cm in review.critical_moments
+            ],
+            "priority_review_points": review.priority_review_points,
+            "training_recommendations": review.training_recommendations
+        }
+    }
+
+
+# Normalized scenario -> DeepSeek response, so rewordings that only differ in
+# case, punctuation or filler words ("push B site" / "Push to B site.") share one call
+_scenario_cache = TTLCache(maxsize=1024, ttl=3600)
+
+_SCENARIO_FILLER: Final[FrozenSet[str]] = frozenset({"a", "an", "the", "to", "at", "on", "in", "of", "we", "should"})
+_SCENARIO_TOKEN = re.compile(r"[\w$%.]+")
+
+
+def _scenario_cache_key(game: str, scenario: str, context: Optional[Dict[str, Any]]) -> Tuple[str, str, bytes]:
+    """Cache key for a simple scenario: game, normalized wording and canonical context."""
+    words = (w.strip(".") for w in _SCENARIO_TOKEN.findall(scenario.casefold()))
+    normalized = " ".join(w for w in words if w and w not in _SCENARIO_FILLER)
+    return game.casefold(), normalized, orjson.dumps(context or {}, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+async def _single_event(event: str, data: Any) -> AsyncIterator[Tuple[str, Any]]:
+    yield event, data
 
 
+# Fallbacks for parts of a simple-scenario answer DeepSeek left out or mis-shaped
+# (json_object mode guarantees an object, not its fields)
+_DEFAULT_PRIMARY_SCENARIO: Final[Mapping[str, Any]] = MappingProxyType({
+    "success_probability": 0.35,
+    "expected_outcome": "Uncertain outcome based on current game state",
+    "reasoning": "Analysis based on limited context"
+})
+_DEFAULT_ALTERNATIVE_SCENARIO: Final[Mapping[str, Any]] = MappingProxyType({
+    "scenario": "Alternative approach",
+    "success_probability": 0.55,
+    "expected_outcome": "Potentially better outcome",
+    "reasoning": "Alternative strategy consideration"
+})
+_DEFAULT_RECOMMENDATION: Final[str] = "Consider the alternative approach for better odds"
+
 
 @router.post("/simulate/scenario-simple")
-async def simulate_scenario_simple(request: SimpleScenarioRequest) -> Dict[str, Any]:
+async def simulate_scenario_simple(request: SimpleScenarioRequest, http_request: Request) -> Dict[str, Any]:
 
     """
     Simplified simulation endpoint for frontend.
     Accepts a simple scenario string and returns AI-generated predictions.
+    Send `Accept: text/event-stream` to receive tokens as Server-Sent Events.
     """
-    try:
-        # Build prompt for DeepSeek
-        from ..services.deepseek_client import deepseek_client
-        
-        system_prompt = """You are an esports analyst. Analyze the hypothetical scenario and return a JSON with:
-{
-    "primary_scenario": {
-        "scenario": "description",
-        "success_probability": 0.0-1.0,
-        "expected_outcome": "what would happen",
-        "reasoning": "why this outcome"
-    },
-    "alternative_scenario": {
-        "scenario": "alternative approach",
-        "success_probability": 0.0-1.0,
-        "expected_outcome": "what would happen",
-        "reasoning": "why this outcome"
-    },
-    "recommendation": "which approach is better and why"
-}"""
-        
-        game_context = request.context.get("game", "VALORANT") if request.context else "VALORANT"
-        user_prompt = f"Game: {game_context}\nScenario: {request.scenario}\nGame State: {request.game_state}"
-        
-        response = await deepseek_client.analyze(system_prompt, user_prompt, {"type": "object"})
-        
+    
+    game_context = request.context.get("game", "VALORANT") if request.context else "VALORANT"
+    user_prompt = f"Game: {game_context}\nScenario: {request.scenario}\nContext: {request.context or {}}"
+    cache_key = _scenario_cache_key(game_context, request.scenario, request.context)
+    
+    def _remember(response: Dict[str, Any]) -> Dict[str, Any]:
+        if not response.get("parse_error"):
+            _scenario_cache[cache_key] = response
+        return response
+    
+    def _payload(response: Dict[str, Any]) -> Dict[str, Any]:
+        primary = response.get("primary_scenario")
+        if not isinstance(primary, dict):
+            primary = {"scenario": request.scenario, **_DEFAULT_PRIMARY_SCENARIO}
+        alternative = response.get("alternative_scenario")
+        recommendation = response.get("recommendation")
         return {
             "status": "success",
-            "primary_scenario": response.get("primary_scenario", {
-                "scenario": request.scenario,
-                "success_probability": 0.35,
-                "expected_outcome": "Uncertain outcome based on current game state",
-                "reasoning": "Analysis based on limited context"
-            }),
-            "alternative_scenario": response.get("alternative_scenario", {
-                "scenario": "Alternative approach",
-                "success_probability": 0.55,
-                "expected_outcome": "Potentially better outcome",
-                "reasoning": "Alternative strategy consideration"
-            }),
-            "recommendation": response.get("recommendation", "Consider the alternative approach for better odds")
+            "primary_scenario": primary,
+            "alternative_scenario": alternative if isinstance(alternative, dict) else dict(_DEFAULT_ALTERNATIVE_SCENARIO),
+            "recommendation": recommendation if isinstance(recommendation, str) else _DEFAULT_RECOMMENDATION
         }
+    
+    cached = _scenario_cache.get(cache_key)
+    
+    if wants_event_stream(http_request):
+        if cached is not None:
+            return event_stream(_single_event("result", _payload(cached)))
+        return event_stream(_deepseek_events(
+            _ESPORTS_ANALYST_SYS_PROMPT, user_prompt, lambda response: _payload(_remember(response)),
+            lambda e: ("error", {"status": "error", "detail": "Simulation failed"})
+        ))
+    
+    if cached is not None:
+        return _payload(cached)
+    try:
+        response = await deepseek_client.analyze(_ESPORTS_ANALYST_SYS_PROMPT, user_prompt, OBJECT_SCHEMA)
+        return _payload(_remember(response))
     except Exception as e:
-        logger.error(f"Simulation error: {e}")
-        raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+        raise _http_error("Simulation failed", e)
+
 
 
 # ============================================================================
@@ -1094,7 +1501,7 @@ async def analyze_player(player: Player):
             metadata=result.metadata
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Analyze player failed", e)
 
 
 @router.post("/grid/player-insights/{series_id}/{player_name}")
@@ -1103,35 +1510,24 @@ async def get_player_insights(series_id: str, player_name: str) -> Dict[str, Any
     Generate personalized AI insights for a specific player in a series.
     Uses DeepSeek to analyze player impact based on GRID data.
     """
+    cache_key = (series_id, player_name.casefold())
+    cached = insights_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Serving player insights for %s from cache", cache_key)
+        return _json_bytes_response(cached, cache_status="HIT")
+
     try:
-        # Check cache first (could implement specific cache)
-        # For now, always fetch fresh or rely on service-level caching if added
-        
-        # 1. Fetch Game State
-        game_state = await grid_client.get_game_state(series_id)
-        if not game_state:
-            raise HTTPException(status_code=404, detail="Series not found")
-        
-        # 2. Generate Insights
-        insights = await valorant_analyzer.generate_player_insights_from_grid(
-            game_state, 
-            player_name
+        payload = await _analysis_flight.do(
+            ("insights",) + cache_key,
+            lambda: _compute_player_insights(series_id, player_name, cache_key)
         )
-        
-        return {
-            "status": "success",
-            "series_id": series_id,
-            "player": player_name,
-            "insights": insights
-        }
-        
+        return _json_bytes_response(payload, cache_status="MISS")
     except Exception as e:
-        logger.error(f"Player insights error: {e}")
         return {
             "status": "error",
             "series_id": series_id,
             "player": player_name,
-            "error": str(e),
+            "error": _error_detail("Player insights failed", e),
             "insights": {
                 "positive_impacts": [], 
                 "negative_impacts": [],
@@ -1140,6 +1536,30 @@ async def get_player_insights(series_id: str, player_name: str) -> Dict[str, Any
         }
 
 
+async def _compute_player_insights(series_id: str, player_name: str, cache_key: tuple) -> bytes:
+    """Fetch GRID state, generate insights and cache the successful result."""
+    # 1. Fetch Game State
+    game_state = await grid_client.get_game_state(series_id)
+    if not game_state:
+        raise HTTPException(status_code=404, detail="Series not found")
+
+    # 2. Generate Insights
+    insights = await valorant_analyzer.generate_player_insights_from_grid(
+        game_state,
+        player_name
+    )
+
+    result = {
+        "status": "success",
+        "series_id": series_id,
+        "player": player_name,
+        "insights": insights
+    }
+    payload = dumps(result)
+    insights_cache[cache_key] = payload
+    return payload
+
+
 @router.post("/review/match", response_model=AnalysisResponse)
 async def review_match(match: Match):
     """
@@ -1159,7 +1579,7 @@ async def review_match(match: Match):
             metadata=result.metadata
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Review match failed", e)
 
 
 @router.post("/simulate/decision", response_model=AnalysisResponse)
@@ -1190,43 +1610,64 @@ async def simulate_decision(context: DecisionContext):
             metadata=result.metadata
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Simulate decision failed", e)
 
 
 # ============================================================================
 # GRID API Endpoints
 # ============================================================================
 
+def _grid_ok(result: Dict[str, Any]) -> bool:
+    """Only cache GRID reference data that came back without GraphQL errors."""
+    return not result.get("errors")
+
+
+# GRID reference data changes minute-to-hour, so these read-only proxies are
+# cached briefly (series lists for less time, as they change more often; the
+# title list practically never does).
+
 @router.get("/grid/titles")
+@async_ttl_cache(ttl=3600, cache_if=_grid_ok)
 async def get_grid_titles() -> Dict[str, Any]:
     """Fetch available titles from GRID Central Data."""
     try:
         return await grid_client.get_titles()
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Failed to fetch GRID titles", e)
 
 
 @router.get("/grid/tournaments")
+@async_ttl_cache(ttl=60, cache_if=_grid_ok)
 async def get_grid_tournaments(title_id: str = "3") -> Dict[str, Any]:
     """Fetch tournaments for a specific title (default LoL=3) from GRID Central Data."""
     try:
         return await grid_client.get_tournaments([title_id])
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Failed to fetch GRID tournaments", e)
 
 
 @router.get("/grid/all-series")
+@async_ttl_cache(ttl=15, cache_if=_grid_ok)
 async def get_grid_all_series(tournament_id: str) -> Dict[str, Any]:
     """Fetch series for a specific tournament from GRID Central Data."""
     try:
         return await grid_client.get_series(tournament_id)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Failed to fetch GRID series", e)
+
+
+class GridTitle(IntEnum):
+    """GRID title IDs the series picker supports (query strings coerce to these)."""
+    DOTA2 = 1
+    COUNTER_STRIKE = 2
+    LOL = LOL_TITLE_ID
+    VALORANT = VALORANT_TITLE_ID
 
 
 @router.get("/grid/series-by-title")
+@async_ttl_cache(ttl=15, cache_if=_grid_ok)
 async def get_series_by_title(
-    title_id: int = 6,  # Default to VALORANT
+    title_id: GridTitle = GridTitle.VALORANT,  # Default to VALORANT
     hours: int = 168,   # Default to 1 week
     limit: int = 20,
     team_name: Optional[str] = None,  # Search by team name
@@ -1252,7 +1693,7 @@ async def get_series_by_title(
     """
     try:
         result = await grid_client.get_all_series_by_title(
-            title_id=title_id,
+            title_id=int(title_id),
             hours=min(hours, 720),  # Cap at 30 days (kept for API compat)
             limit=min(limit, 50),   # Cap at GRID max
             team_name=team_name,
@@ -1260,43 +1701,74 @@ async def get_series_by_title(
         )
         return result
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Failed to fetch GRID series", e)
+
+
+
 
+# series_id -> serialized /grid/series body. Live series are re-fetched every
+# few seconds; once GRID marks the series finished the state is final and kept longer.
+_series_body_live = TTLCache(maxsize=256, ttl=10)
+_series_body_final = TTLCache(maxsize=256, ttl=3600)
 
 
+class _GridSeriesIdConvertor(Convertor):
+    """Path convertor matching only GRID series ids (all digits), kept as str."""
+    regex = "[0-9]+"
 
-@router.get("/grid/series/{series_id}")
-async def get_grid_series(series_id: str) -> Dict[str, Any]:
+    def convert(self, value: str) -> str:
+        return value
+
+    def to_string(self, value: str) -> str:
+        return str(value)
+
+
+# /grid/series/{game} shares this prefix; game names must not match the id route
+register_url_convertor("grid_series_id", _GridSeriesIdConvertor())
+
+
+@router.get("/grid/series/{series_id:grid_series_id}", response_model=None)
+async def get_grid_series(series_id: str) -> Response:
     """
     Fetch raw series data from GRID API.
     Returns game state transformed into our Pydantic models.
+    Only numeric GRID series ids route here; anything else falls through to
+    get_grid_series_by_game.
     """
+    payload = _series_body_final.get(series_id) or _series_body_live.get(series_id)
+    if payload is not None:
+        return _json_bytes_response(payload, cache_status="HIT")
     try:
-        game_state = await grid_client.get_game_state(series_id)
-        gs_dict = game_state.model_dump()
-        
-        return {
-            "status": "success",
-            "series_id": series_id,
-            "game_state": gs_dict,
-        }
+        payload = await _analysis_flight.do(("series", series_id), lambda: _serialize_grid_series(series_id))
     except Exception as e:
-        logger.error(f"GRID fetch failed for {series_id}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch series data: {str(e)}")
+        raise _http_error("Failed to fetch series data", e)
+    return _json_bytes_response(payload, cache_status="MISS")
+
 
+async def _serialize_grid_series(series_id: str) -> bytes:
+    """Fetch the game state and cache the encoded get_grid_series body (see there)."""
+    game_state = await grid_client.get_game_state(series_id)
+    payload = dumps({
+        "status": "success",
+        "series_id": series_id,
+        "game_state": game_state.model_dump(mode="json"),
+    })
+    (_series_body_final if game_state.series_finished else _series_body_live)[series_id] = payload
+    return payload
 
 
 
-@router.post("/grid/analyze/{series_id}", response_model=SynergyResponse)
-async def analyze_grid_series(series_id: str) -> SynergyResponse:
+
+@router.post("/grid/analyze/{series_id}", response_model=None, responses={200: {"model": SynergyResponse}})
+@single_flight()
+async def analyze_grid_series(series_id: str) -> ORJSONResponse:
     """
     Fetch GRID data and run full team synergy analysis.
     Combines GRID data fetching with DeepSeek analysis in one call.
     """
     try:
-        # Fetch and transform GRID data
-        match = await grid_client.get_match_for_analysis(series_id)
-        game_state = await grid_client.get_game_state(series_id)
+        # Fetch GRID data (Match + GameState from a single series fetch)
+        match, game_state = await grid_client.get_bundle(series_id)
         
         # Run synergy analysis with DeepSeek
         result = await synergy_model.evaluate_synergy(
@@ -1308,13 +1780,14 @@ async def analyze_grid_series(series_id: str) -> SynergyResponse:
         # Add GRID metadata
         result.metadata["grid_series_id"] = series_id
         
-        return result
+        return _model_response(result)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Analyze grid series failed", e)
 
 
-@router.post("/grid/errors/{series_id}", response_model=MicroErrorResponse)
-async def detect_grid_errors(series_id: str, player_name: str) -> MicroErrorResponse:
+@router.post("/grid/errors/{series_id}", response_model=None, responses={200: {"model": MicroErrorResponse}})
+@single_flight()
+async def detect_grid_errors(series_id: str, player_name: str) -> ORJSONResponse:
     """
     Fetch GRID data and detect micro-errors for a specific player.
     """
@@ -1322,22 +1795,13 @@ async def detect_grid_errors(series_id: str, player_name: str) -> MicroErrorResp
         game_state = await grid_client.get_game_state(series_id)
         
         # Find the player in the game state
-        player_state = None
-        for ps in game_state.player_states:
-            if ps.player_name.lower() == player_name.lower():
-                player_state = ps
-                break
+        player_state = game_state.player_index.get(player_name.casefold())
         
         if not player_state:
             raise HTTPException(status_code=404, detail=f"Player '{player_name}' not found in series")
         
         # Create Player object from state
-        player = Player(
-            name=player_state.player_name,
-            role=player_state.role,
-            champion=player_state.champion,
-            rank="Pro"
-        )
+        player = Player.from_state(player_state)
         
         # Detect errors
         result = await error_detector.detect_errors(
@@ -1349,78 +1813,141 @@ async def detect_grid_errors(series_id: str, player_name: str) -> MicroErrorResp
         # Add GRID metadata
         result.metadata["grid_series_id"] = series_id
         
-        return result
+        return _model_response(result)
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Detect grid errors failed", e)
+
+
+@router.post("/grid/errors/{series_id}/all", response_class=ORJSONResponse)
+@single_flight()
+async def detect_grid_errors_all(series_id: str) -> ORJSONResponse:
+    """
+    Fetch GRID data and detect micro-errors for every player in the series.
+    Players are analyzed concurrently; one player's failure is reported under
+    `errors` without failing the others.
+    """
+    try:
+        game_state = await grid_client.get_game_state(series_id)
+        players = [(Player.from_state(ps), ps) for ps in game_state.player_states]
+        results = await error_detector.detect_errors_batch(players, timeline=game_state.recent_timeline)
+    except Exception as e:
+        raise _http_error("Detect grid errors failed", e)
+    
+    reports, errors = {}, {}
+    for (player, _), outcome in zip(players, results):
+        if isinstance(outcome, Exception):
+            errors[player.name] = _error_detail(f"Micro-error detection failed for {player.name}", outcome)
+        else:
+            reports[player.name] = outcome.model_dump(mode="json")
+    if errors and not reports:
+        raise _http_error("Detect grid errors failed", next(o for o in results if isinstance(o, Exception)))
+    
+    return ORJSONResponse(content={
+        "status": "success" if not errors else "partial",
+        "series_id": series_id,
+        "players": reports,
+        "errors": errors
+    })
 
 
 # ============================================================================
-# DeepSeek-Powered Analysis Endpoints (Production Quality)
+# Persistent Recent Matches
 # ============================================================================
 
-@router.post("/grid/player-insights/{series_id}/{player_name}")
-async def get_player_insights(series_id: str, player_name: str) -> Dict[str, Any]:
+_SERIES_TIME_FMT = "%b %d, %H:%M"
+
+# The series list changes slowly; short client caching plus ETag revalidation
+_SERIES_LIST_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=300"
+
+class GameName(str, Enum):
+    """Game names accepted by the series picker (case-insensitive)."""
+    LOL = "lol"
+    LEAGUE = "league"
+    VALORANT = "valorant"
+    VAL = "val"
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["GameName"]:
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+# Game name -> GRID title ID
+_TITLE_MAP: Final[Dict[GameName, int]] = {
+    GameName.LOL: LOL_TITLE_ID,
+    GameName.LEAGUE: LOL_TITLE_ID,
+    GameName.VALORANT: VALORANT_TITLE_ID,
+    GameName.VAL: VALORANT_TITLE_ID,
+}
+
+# Series list date filters ('all' has no entry -> no date filter)
+_FILTER_DELTAS = {
+    "24h": timedelta(hours=24),
+    "1w": timedelta(days=7),
+    "1m": timedelta(days=30),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_start_time(raw_time: Optional[str]) -> str:
     """
-    Generate AI-powered player insights using live GRID data.
-    
-    Orchestrates the retrieval of game state, extraction of player-specific metrics 
-    (e.g., KAST, ACS), and generation of pattern-based coaching insights via DeepSeek.
+    Format a GRID ISO timestamp for the series picker ("Recent" when absent).
+    Memoized - picker polls re-format the same scheduled start times every page.
     """
+    if not raw_time:
+        return "Recent"
     try:
-        # Fetch GRID data
-        game_state = await grid_client.get_game_state(series_id)
-        
-        # Find the target player
-        player_state = None
-        for ps in game_state.player_states:
-            if ps.player_name.lower() == player_name.lower():
-                player_state = ps
-                break
-        
-        if not player_state:
-            raise HTTPException(status_code=404, detail=f"Player '{player_name}' not found")
-        
-        # Create Player object for analysis
-        from ..models.lol import Player
-        player = Player(
-            name=player_state.player_name,
-            role=player_state.role,
-            champion=player_state.champion,
-            rank="Pro"
-        )
-        
-        # Generate insights with DeepSeek
-        report = await player_insight_generator.generate_insights(
-            player=player,
-            player_states=[player_state],
-            game_state=game_state
-        )
-        
-        return {
-            "status": "success",
-            "series_id": series_id,
-            "player_name": player_name,
-            "insights": report.dict()
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Player insights error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        return datetime.fromisoformat(raw_time.replace("Z", "+00:00")).strftime(_SERIES_TIME_FMT)
+    except ValueError:
+        return raw_time
 
 
+def _series_summary(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Project an allSeries node onto the compact shape the series picker renders."""
+    team_names = [t.get("baseInfo", {}).get("name", "Unknown") for t in node.get("teams", [])]
+    return {
+        "id": node.get("id"),
+        "tournament": node.get("tournament", {}).get("name", "Unknown Tournament"),
+        "teams": " vs ".join(team_names) if team_names else "TBD vs TBD",
+        "startTime": _format_start_time(node.get("startTimeScheduled"))
+    }
 
 
 
-# ============================================================================
-# Persistent Recent Matches
-# ============================================================================
+@functools.lru_cache(maxsize=64)
+def _start_time_for(filter: str, minute_bucket: int) -> Optional[str]:
+    """
+    GRID start_time cutoff for a series-list filter ('all' -> None, no date filter).
+    Computed once per minute: callers pass the current minute as `minute_bucket`,
+    so bursts of picker polls share one ISO string (and one GRID query shape).
+    """
+    delta = _FILTER_DELTAS.get(filter)
+    if not delta:
+        return None
+    return (datetime.fromtimestamp(minute_bucket * 60, timezone.utc) - delta).isoformat().replace("+00:00", "Z")
+
+
+@async_ttl_cache(ttl=15, cache_if=_grid_ok)
+async def _fetch_series_page(title_id: int, filter: str, cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    One page of the series picker from GRID. Cached on the filter name rather
+    than the computed start_time, so repeat polls within the TTL share a page.
+    """
+    return await grid_client.get_all_series_by_title(
+        title_id=title_id, 
+        start_time=_start_time_for(filter, int(time.time() // 60)),
+        limit=10, 
+        cursor=cursor
+    )
+
 
 @router.get("/grid/series/{game}")
 async def get_grid_series_by_game(
-    game: str, 
+    game: GameName, 
+    request: Request,
     filter: str = "24h", 
     cursor: Optional[str] = None
 ):
@@ -1428,91 +1955,80 @@ async def get_grid_series_by_game(
     Fetch recent series from GRID for a specific game with date filter and pagination.
     filter: '24h', '1w', '1m', 'all'
     cursor: Pagination cursor for next page
+    Responses carry an ETag; resend it in If-None-Match to get a 304.
+    Send `Accept: application/x-ndjson` to stream one series per line instead,
+    followed by a final `{"status", "source", "nextCursor"}` line.
+    Unknown game names are rejected with 422 before the handler runs.
     """
     try:
-        # Map game name to GRID Title ID
-        title_map = {
-            "lol": 3,
-            "league": 3,
-            "valorant": 6,
-            "val": 6
-        }
-        
-        normalized_game = game.lower()
-        title_id = title_map.get(normalized_game)
-        
-        if not title_id:
-            return {"status": "error", "message": "Invalid game", "series": []}
-            
-        # Calculate start_time based on filter
-        start_time = None
-        now = datetime.utcnow()
-        if filter == "24h":
-            start_time = (now - timedelta(hours=24)).isoformat() + "Z"
-        elif filter == "1w":
-            start_time = (now - timedelta(days=7)).isoformat() + "Z"
-        elif filter == "1m":
-            start_time = (now - timedelta(days=30)).isoformat() + "Z"
-        # 'all' sends None, which means no date filter
-        
         # Fetch from GRID with pagination
-        data = await grid_client.get_all_series_by_title(
-            title_id=title_id, 
-            start_time=start_time,
-            limit=10, 
-            cursor=cursor
-        )
+        data = await _fetch_series_page(title_id=_TITLE_MAP[game], filter=filter, cursor=cursor)
         
         # Transform for frontend
-        series_list = []
         all_series_node = data.get("data", {}).get("allSeries", {})
         edges = all_series_node.get("edges", [])
         page_info = all_series_node.get("pageInfo", {})
+        next_cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+        source = "grid" if edges else "no_data"  # Changed from mock_fallback
         
-        for edge in edges:
-            node = edge.get("node", {})
-            teams = node.get("teams", [])
-            team_names = [t.get("baseInfo", {}).get("name", "Unknown") for t in teams]
-            
-            # Format time if present
-            raw_time = node.get("startTimeScheduled")
-            formatted_time = raw_time
-            if raw_time:
-                try:
-                    dt = datetime.fromisoformat(raw_time.replace("Z", "+00:00"))
-                    formatted_time = dt.strftime("%b %d, %H:%M")
-                except:
-                    pass
-
-            series_list.append({
-                "id": node.get("id"),
-                "tournament": node.get("tournament", {}).get("name", "Unknown Tournament"),
-                "teams": " vs ".join(team_names) if team_names else "TBD vs TBD",
-                "startTime": formatted_time or "Recent"
-            })
-            
-        return {
+        if wants_ndjson(request):
+            # Rows are shaped lazily as the stream is consumed
+            rows = (_series_summary(edge.get("node", {})) for edge in edges)
+            trailer = {"status": "success", "source": source, "nextCursor": next_cursor}
+            return ndjson_stream(itertools.chain(rows, (trailer,)))
+        
+        series_list = [_series_summary(edge.get("node", {})) for edge in edges]
+        payload = dumps({
             "status": "success", 
-            "source": "grid" if edges else "no_data", # Changed from mock_fallback
+            "source": source,
             "series": series_list,
-            "nextCursor": page_info.get("endCursor") if page_info.get("hasNextPage") else None
-        }
+            "nextCursor": next_cursor
+        })
+        return cached_json_response(request, payload, etag_for(payload), _SERIES_LIST_CACHE_CONTROL)
     except Exception as e:
-        logger.error(f"Failed to fetch series for {game}: {e}")
-        return {"status": "error", "message": str(e), "series": []}
+        return {"status": "error", "message": _error_detail(f"Failed to fetch {game} series", e), "series": []}
+
+# Note: the DB routes are deliberately sync `def` - FastAPI runs them in its
+# threadpool, so the blocking SQLAlchemy calls never stall the event loop.
 
 @router.get("/matches/recent")
 def get_recent_matches(db: Session = Depends(get_db)):
     """Fetch recently connected matches from the database."""
-    return db.query(db_models.RecentMatch).order_by(db_models.RecentMatch.match_time.desc()).limit(3).all()
+    return db.scalars(
+        select(db_models.RecentMatch).order_by(db_models.RecentMatch.match_time.desc()).limit(3)
+    ).all()
+
+# Dialects with INSERT .. ON CONFLICT, so a save is one upsert statement
+_UPSERT_INSERTS: Final = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
 
 @router.post("/matches/recent")
 def save_recent_match(match: RecentMatchCreate, db: Session = Depends(get_db)):
-    """Save a connected match to history."""
-    # Check if exists
-    existing = db.query(db_models.RecentMatch).filter(db_models.RecentMatch.series_id == match.series_id).first()
+    """Save a connected match to history (re-saving a series just bumps its time)."""
+    now = db_models.utcnow()
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        stmt = insert(db_models.RecentMatch).values(
+            series_id=match.series_id,
+            title=match.title,
+            team1_name=match.team1_name,
+            team2_name=match.team2_name,
+            match_time=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[db_models.RecentMatch.series_id],
+            set_={"match_time": stmt.excluded.match_time}
+        ).returning(db_models.RecentMatch)
+        db_match = db.scalars(stmt).one()
+        db.commit()
+        return db_match
+    
+    # Other dialects: check if exists
+    existing = db.scalars(
+        select(db_models.RecentMatch).where(db_models.RecentMatch.series_id == match.series_id).limit(1)
+    ).first()
     if existing:
-        existing.match_time = datetime.utcnow()
+        existing.match_time = now
         db.commit()
         return existing
     
@@ -1521,7 +2037,7 @@ def save_recent_match(match: RecentMatchCreate, db: Session = Depends(get_db)):
         title=match.title,
         team1_name=match.team1_name,
         team2_name=match.team2_name,
-        match_time=datetime.utcnow()
+        match_time=now
     )
     db.add(db_match)
     db.commit()
@@ -1534,6 +2050,7 @@ def save_recent_match(match: RecentMatchCreate, db: Session = Depends(get_db)):
 # ============================================================================
 
 @router.post("/review/macro/{series_id}", response_model=MacroReviewAgenda)
+@single_flight()
 async def generate_macro_review(series_id: str) -> MacroReviewAgenda:
     """
     Generate an Automated Macro Game Review Agenda.
@@ -1543,9 +2060,8 @@ async def generate_macro_review(series_id: str) -> MacroReviewAgenda:
     economy for coaching VOD review sessions.
     """
     try:
-        # Fetch GRID data
-        match = await grid_client.get_match_for_analysis(series_id)
-        game_state = await grid_client.get_game_state(series_id)
+        # Fetch GRID data (Match + GameState from a single series fetch)
+        match, game_state = await grid_client.get_bundle(series_id)
         
         # Generate macro review
         result = await lol_analyzer.generate_review(
@@ -1559,7 +2075,7 @@ async def generate_macro_review(series_id: str) -> MacroReviewAgenda:
         
         return result
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Generate macro review failed", e)
 
 
 @router.post("/insights/player/{player_name}", response_model=PlayerInsightReport)
@@ -1580,21 +2096,10 @@ async def generate_player_insights(
         # If series_id provided, fetch from GRID
         if series_id:
             game_state = await grid_client.get_game_state(series_id)
-            for ps in game_state.player_states:
-                if ps.player_name.lower() == player_name.lower():
-                    player_state = ps
-                    break
+            player_state = game_state.player_index.get(player_name.casefold())
         
         # Create player object
-        if player_state:
-            player = Player(
-                name=player_state.player_name,
-                role=player_state.role,
-                champion=player_state.champion,
-                rank="Pro"
-            )
-        else:
-            player = None
+        player = Player.from_state(player_state) if player_state else None
         
         # Generate insights
         result = await player_insight_generator.generate_insights(
@@ -1608,11 +2113,11 @@ async def generate_player_insights(
         
         return result
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Generate player insights failed", e)
 
 
-@router.post("/coach/full-analysis/{series_id}")
-async def full_coaching_analysis(series_id: str) -> Dict[str, Any]:
+@router.post("/coach/full-analysis/{series_id}", response_class=ORJSONResponse)
+async def full_coaching_analysis(series_id: str, request: Request, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Complete End-to-End Coaching Analysis.
     
@@ -1624,49 +2129,165 @@ async def full_coaching_analysis(series_id: str) -> Dict[str, Any]:
     5. Generates Player Insights for key players
     
     This is the flagship hackathon endpoint for coaches.
+    Concurrent requests for the same series share one pipeline run.
+    
+    Send `Accept: text/event-stream` to receive `macro_review`, `team_synergy`
+    and `player_insights` as each DeepSeek call lands (each followed by a
+    `progress` event), then `recommendations` and a final `done`, or `error`.
+    
+    Complete analyses of finished series are stored and replayed; pass
+    `force_refresh=true` to recompute.
     """
+    if wants_event_stream(request):
+        return event_stream(_full_coaching_analysis_events(series_id))
+    if not force_refresh and (cached := await _load_finished_analysis(series_id, "full")):
+        return _json_bytes_response(cached, cache_status="HIT")
+    result = await _analysis_flight.do(("full", series_id), lambda: _run_full_coaching_analysis(series_id))
+    # Already plain data from model_dump(); encode with orjson directly instead of
+    # letting FastAPI walk the whole tree again through jsonable_encoder
+    return ORJSONResponse(content=result)
+
+
+async def _run_full_coaching_analysis(series_id: str) -> Dict[str, Any]:
+    """Pipeline behind full_coaching_analysis (see there)."""
     try:
-        # Fetch GRID data
-        match = await grid_client.get_match_for_analysis(series_id)
-        game_state = await grid_client.get_game_state(series_id)
-        
-        # 1. Macro Review
-        macro_review = await macro_review_generator.generate_review(
-            match=match,
-            game_state=game_state,
-            timeline=game_state.recent_timeline
-        )
-        
-        # 2. Team Synergy
-        synergy = await synergy_model.evaluate_synergy(
-            match=match,
-            game_state=game_state
-        )
+        # Fetch GRID data (Match + GameState from a single series fetch)
+        match, game_state = await grid_client.get_bundle(series_id)
         
         # 3. Find the worst-performing player for detailed insights
         # (In real app, would analyze all 5)
         key_player = match.players[0] if match.players else None
-        player_insights = None
-        if key_player:
-            player_insights = await player_insight_generator.generate_insights(
+        
+        # 1-3. Macro Review, Team Synergy and Player Insights are independent
+        # DeepSeek calls - run them concurrently and keep whatever succeeds
+        macro_review, synergy, player_insights = await asyncio.gather(
+            lol_analyzer.generate_review(
+                match=match,
+                game_state=game_state,
+                timeline=game_state.recent_timeline
+            ),
+            synergy_model.evaluate_synergy(
+                match=match,
+                game_state=game_state
+            ),
+            player_insight_generator.generate_insights(
                 player=key_player,
                 game_state=game_state
-            )
+            ) if key_player else _none(),
+            return_exceptions=True
+        )
         
-        return {
-            "status": "success",
-            "series_id": series_id,
-            "macro_review": macro_review.model_dump(),
-            "team_synergy": synergy.model_dump(),
-            "player_insights": player_insights.model_dump() if player_insights else None,
-            "recommendations": {
-                "priority_vod_review": macro_review.priority_review_points[:3],
-                "training_focus": macro_review.training_recommendations[:3],
-                "team_improvements": synergy.recommendations[:3]
-            }
+        errors = {}
+        for name, outcome in (("macro_review", macro_review), ("team_synergy", synergy), ("player_insights", player_insights)):
+            if isinstance(outcome, Exception):
+                errors[name] = _error_detail(f"Full analysis {name} failed", outcome)
+        if errors.keys() >= {"macro_review", "team_synergy"}:
+            status_code = 502 if isinstance(macro_review, _UPSTREAM_EXC) else 500
+            raise HTTPException(status_code=status_code, detail=errors["macro_review"])
+        
+        # Dumping the three review models is pure CPU - keep it off the event loop
+        result = await asyncio.to_thread(
+            _build_full_analysis_result,
+            series_id,
+            None if "macro_review" in errors else macro_review,
+            None if "team_synergy" in errors else synergy,
+            None if "player_insights" in errors else player_insights,
+            errors
+        )
+        if game_state.series_finished and not errors:
+            await _store_finished_analysis(series_id, "full", result)
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise _http_error("Full coaching analysis failed", e)
+
+
+def _build_full_analysis_result(
+    series_id: str,
+    macro_review: Optional[MacroReviewAgenda],
+    synergy: Optional[SynergyResponse],
+    player_insights: Optional[PlayerInsightReport],
+    errors: Dict[str, str]
+) -> Dict[str, Any]:
+    """Shape the LoL full coaching analysis body (sync; run via asyncio.to_thread)."""
+    result = {
+        "status": "partial_success" if errors else "success",
+        "series_id": series_id,
+        "macro_review": macro_review.model_dump() if macro_review else None,
+        "team_synergy": synergy.model_dump() if synergy else None,
+        "player_insights": player_insights.model_dump() if player_insights else None,
+        "recommendations": {
+            "priority_vod_review": macro_review.priority_review_points[:3] if macro_review else [],
+            "training_focus": macro_review.training_recommendations[:3] if macro_review else [],
+            "team_improvements": synergy.recommendations[:3] if synergy else []
         }
+    }
+    if errors:
+        result["errors"] = errors
+    return result
+
+
+async def _none() -> None:
+    """Placeholder awaitable for an optional branch of asyncio.gather."""
+    return None
+
+
+async def _full_coaching_analysis_events(series_id: str) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Streaming variant of the LoL full analysis: the three DeepSeek calls run
+    concurrently and each part is sent as soon as its call finishes.
+    """
+    try:
+        match, game_state = await grid_client.get_bundle(series_id)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        yield "error", {"status": "error", "series_id": series_id, "detail": _error_detail("Full analysis failed", e)}
+        return
+    
+    key_player = match.players[0] if match.players else None
+    parts = {
+        asyncio.create_task(lol_analyzer.generate_review(
+            match=match, game_state=game_state, timeline=game_state.recent_timeline
+        )): "macro_review",
+        asyncio.create_task(synergy_model.evaluate_synergy(match=match, game_state=game_state)): "team_synergy",
+    }
+    if key_player:
+        parts[asyncio.create_task(player_insight_generator.generate_insights(
+            player=key_player, game_state=game_state
+        ))] = "player_insights"
+    
+    results, errors = {}, {}
+    pending = set(parts)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = parts[task]
+                if task.exception() is not None:
+                    errors[name] = _error_detail(f"Full analysis {name} failed", task.exception())
+                else:
+                    results[name] = task.result()
+                    yield name, await asyncio.to_thread(results[name].model_dump)
+                yield "progress", {"phase": name, "progress": round((len(results) + len(errors)) / len(parts), 2)}
+        
+        if errors.keys() >= {"macro_review", "team_synergy"}:
+            yield "error", {"status": "error", "series_id": series_id, "detail": errors["macro_review"]}
+            return
+        
+        macro_review, synergy = results.get("macro_review"), results.get("team_synergy")
+        yield "recommendations", {
+            "priority_vod_review": macro_review.priority_review_points[:3] if macro_review else [],
+            "training_focus": macro_review.training_recommendations[:3] if macro_review else [],
+            "team_improvements": synergy.recommendations[:3] if synergy else []
+        }
+        done_event = {"status": "partial_success" if errors else "success", "series_id": series_id}
+        if errors:
+            done_event["errors"] = errors
+        yield "done", done_event
+    finally:
+        # Client went away (or we bailed out) - don't leave DeepSeek running for nobody
+        for task in pending:
+            task.cancel()
 
 
 # ============================================================================
@@ -1690,16 +2311,14 @@ async def valorant_macro_review(series_id: str) -> Dict[str, Any]:
     Requires a valid GRID series_id.
     """
     try:
-        # Fetch live match data from GRID
-        match = await grid_client.get_match_for_analysis(series_id)
-        game_state = await grid_client.get_game_state(series_id)
+        # Fetch live match data from GRID (one series round trip for both)
+        match, game_state = await grid_client.get_bundle(series_id)
         
         # Generate macro review with AI
         result = await valorant_analyzer.generate_macro_review_from_grid(match, game_state)
         return result
     except Exception as e:
-        logger.error(f"Valorant macro review failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Valorant macro review failed", e)
 
 
 # NOTE: Duplicate route removed - primary handler is at line ~309
@@ -1707,160 +2326,262 @@ async def valorant_macro_review(series_id: str) -> Dict[str, Any]:
 
 
 
-@router.post("/coach/full-analysis-valorant/{series_id}")
-async def full_coaching_analysis_valorant(series_id: str) -> Dict[str, Any]:
+@router.post("/coach/full-analysis-valorant/{series_id}", response_class=ORJSONResponse)
+async def full_coaching_analysis_valorant(series_id: str, request: Request, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Complete End-to-End Coaching Analysis for VALORANT.
     
     Runs all analysis on match data from GRID.
     Requires a valid series_id.
+    Concurrent requests for the same series share one pipeline run.
+    
+    Send `Accept: text/event-stream` to receive parts as they become ready:
+    `match` (scoreline + players, right after the GRID fetch), then
+    `macro_review`, `recommendations` and `enhanced_metrics` once DeepSeek
+    answers, or a final `error` event.
+    
+    Analyses of finished series are stored and replayed; pass
+    `force_refresh=true` to recompute.
     """
+    if wants_event_stream(request):
+        return event_stream(_full_coaching_analysis_valorant_events(series_id))
+    if not force_refresh and (cached := await _load_finished_analysis(series_id, "full-valorant")):
+        return _json_bytes_response(cached, cache_status="HIT")
+    result = await _analysis_flight.do(
+        ("full-valorant", series_id), lambda: _run_full_coaching_analysis_valorant(series_id)
+    )
+    # Plain data already - skip jsonable_encoder and encode with orjson directly
+    return ORJSONResponse(content=result)
+
+
+async def _run_full_coaching_analysis_valorant(series_id: str) -> Dict[str, Any]:
+    """Pipeline behind full_coaching_analysis_valorant (see there)."""
     try:
-        # Fetch live match data from GRID
-        match = await grid_client.get_match_for_analysis(series_id)
-        game_state = await grid_client.get_game_state(series_id)
+        # Fetch live match data from GRID (Match + GameState from a single series fetch)
+        match, game_state = await grid_client.get_bundle(series_id)
         
-        # Try to generate macro review
+        # Start the macro review, and build the players array while DeepSeek works
+        review_task = asyncio.create_task(valorant_analyzer.generate_macro_review_from_grid(match, game_state))
         try:
-            enhanced_review = await valorant_analyzer.generate_macro_review_from_grid(match, game_state)
-            # Unpack for backward compatibility while adding new stats
-            macro_data = enhanced_review.review.model_dump()
-            enhanced_stats = {
-                "kast_impact": [k.dict() for k in enhanced_review.kast_impact],
-                "economy_analysis": enhanced_review.economy_analysis.dict() if enhanced_review.economy_analysis else None,
-                "what_if_candidates": enhanced_review.what_if_candidates
-            }
-        except Exception as e:
-            logger.error(f"DeepSeek analysis failed: {e}")
-            raise HTTPException(status_code=500, detail=f"AI analysis failed: {str(e)}")
+            all_players = _build_valorant_players(series_id, game_state)
+        except BaseException:
+            review_task.cancel()
+            raise
         
-        # Build flat players array for frontend from game_state
-        all_players = []
-        for ps in game_state.player_states:
-            all_players.append({
-                "name": ps.player_name,
-                "agent": ps.champion,  # champion field holds agent in VALORANT
-                "role": ps.role,
-                "team": ps.team_name,
-                # Core stats
-                "kills": ps.kills,
-                "deaths": ps.deaths,
-                "assists": ps.assists,
-                # Advanced stats from GRID
-                "adr": ps.adr,
-                "headshot_pct": ps.headshot_pct,
-                "headshots": ps.headshots,
-                "damage_dealt": ps.damage_dealt,
-                # Performance metrics
-                "first_bloods": ps.first_bloods,
-                "first_deaths": ps.first_deaths,
-                "clutch_wins": ps.clutch_wins,
-                "multikills": ps.multikills,
-                "kast": ps.kast, # Default 0 from GRID
-                "acs": ps.acs,   # Default 0 from GRID - will be overwritten
-                # State
-                # State
-                "alive": ps.alive,
-                "money": ps.gold
-            })
-            
-        # [NEW] Calculate Advanced Stats (ACS, KAST) using Processor
         try:
-            # 1. Convert to ValorantMatch
-            v_team1_players = [
-                ValorantPlayerState(
-                    player_name=p["name"], 
-                    agent=p["agent"] or "Unknown", 
-                    role=p["role"] or "Unknown", 
-                    team_side="Attack", # Dummy for stats calc
-                    kills=p["kills"], 
-                    deaths=p["deaths"], 
-                    assists=p["assists"], 
-                    damage_dealt=p["damage_dealt"], 
-                    headshots=p["headshots"]
-                ) 
-                for p in all_players if p["team"] == game_state.team_1_name
-            ]
-            v_team2_players = [
-                ValorantPlayerState(
-                    player_name=p["name"], 
-                    agent=p["agent"] or "Unknown", 
-                    role=p["role"] or "Unknown", 
-                    team_side="Defense", # Dummy for stats calc
-                    kills=p["kills"], 
-                    deaths=p["deaths"], 
-                    assists=p["assists"], 
-                    damage_dealt=p["damage_dealt"], 
-                    headshots=p["headshots"]
-                ) 
-                for p in all_players if p["team"] == game_state.team_2_name
-            ]
-            
-            v_match = ValorantMatch(
-                match_id=series_id,
-                map_name=game_state.map_name or "Unknown",
-                team_1=game_state.team_1_name or "Team 1",
-                team_2=game_state.team_2_name or "Team 2",
-                team_1_score=game_state.team_1_score,
-                team_2_score=game_state.team_2_score,
-                winner=game_state.winner or "Unknown",
-                team_1_players=v_team1_players,
-                team_2_players=v_team2_players,
-                total_rounds=game_state.team_1_score + game_state.team_2_score
-            )
-            
-            # 2. Run Processor
-            from ..services.valorant_stats_processor import valorant_stats
-            computed_stats = valorant_stats.process_match_stats(v_match)
-            p_stats_map = computed_stats["player_stats"]
-            
-            # 3. Merge back into all_players
-            for p in all_players:
-                if p["name"] in p_stats_map:
-                    stats = p_stats_map[p["name"]]
-                    p["acs"] = stats.average_damage_per_round # ACS (mapped to this field)
-                    p["headshot_pct"] = stats.headshot_percent # Real HS %
-                    # Recalculate ADR properly if needed, but ACS covers the 'score'
-                    # Let's ensure ADR is also accurate (Damage / Rounds)
-                    # p["adr"] = (stats.average_damage_per_round if stats.average_damage_per_round > 0 else p["adr"]) # Wait, stats.ADPR is ACS.
-                    # We need real ADR field or assume ACS ~ ADR for now? No, ACS > ADR.
-                    # Processor calculated ACS into 'average_damage_per_round'.
-                    # We need to compute ADR separately if we want it.
-                    # For now, let's just make sure Headshot % is fixed.
-                    # KAST - unavailable without round history, but we can try estimating or leave 0
-                    # p["kast"] = 0 # Grid default
+            enhanced_review = await review_task
+            macro_data, enhanced_stats = await asyncio.to_thread(_unpack_valorant_review, enhanced_review)
         except Exception as e:
-            logger.error(f"Failed to calculate advanced stats: {e}")
-
+            raise _http_error("AI analysis failed", e)
         
         # Build response data
-        return {
+        result = {
             "status": "success",
             "game": "valorant",
             "series_id": series_id,
-            "match": {
-                "team_1_name": game_state.team_1_name,
-                "team_2_name": game_state.team_2_name,
-                "team_1_score": game_state.team_1_score,
-                "team_2_score": game_state.team_2_score,
-                "winner": game_state.winner,
-                "map_name": game_state.map_name,
-                "players": all_players
-            },
+            "match": _valorant_match_summary(game_state, all_players),
             "macro_review": macro_data,
-            "recommendations": {
-                "priority_review_rounds": macro_data.get("priority_review_rounds", [])[:5],
-                "training_focus": macro_data.get("training_recommendations", [])[:3],
-                "attack_patterns": macro_data.get("attack_patterns", [])[:3],
-                "defense_patterns": macro_data.get("defense_patterns", [])[:3]
-            },
+            "recommendations": _valorant_recommendations(macro_data),
             "enhanced_metrics": enhanced_stats
         }
+        # Never persist a review DeepSeek failed to produce - fallbacks only
+        if game_state.series_finished and enhanced_review.ai_parsed:
+            await _store_finished_analysis(series_id, "full-valorant", result)
+        return result
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Full analysis error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error("Full analysis failed", e)
+
+
+async def _full_coaching_analysis_valorant_events(series_id: str) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Streaming variant of the VALORANT full analysis.
+    The DeepSeek review starts right after the GRID fetch and runs while the
+    match/player event is built and sent.
+    """
+    try:
+        match, game_state = await grid_client.get_bundle(series_id)
+    except Exception as e:
+        yield "error", {"status": "error", "series_id": series_id, "detail": _error_detail("Full analysis failed", e)}
+        return
+    
+    review_task = asyncio.create_task(valorant_analyzer.generate_macro_review_from_grid(match, game_state))
+    try:
+        all_players = _build_valorant_players(series_id, game_state)
+        yield "match", {
+            "status": "success",
+            "game": "valorant",
+            "series_id": series_id,
+            "match": _valorant_match_summary(game_state, all_players)
+        }
+        
+        try:
+            macro_data, enhanced_stats = await asyncio.to_thread(_unpack_valorant_review, await review_task)
+        except Exception as e:
+            yield "error", {"status": "error", "series_id": series_id, "detail": _error_detail("AI analysis failed", e)}
+            return
+        
+        yield "macro_review", macro_data
+        yield "recommendations", _valorant_recommendations(macro_data)
+        yield "enhanced_metrics", enhanced_stats
+    finally:
+        # Client went away (or we bailed out) - don't leave DeepSeek running for nobody
+        if not review_task.done():
+            review_task.cancel()
+
+
+def _unpack_valorant_review(enhanced_review: EnhancedMacroReview) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Split an EnhancedMacroReview into the macro_review dict and enhanced_metrics.
+    Pure CPU model dumping - callers run it via asyncio.to_thread.
+    """
+    # Unpack for backward compatibility while adding new stats
+    macro_data = enhanced_review.review.model_dump()
+    enhanced_stats = {
+        "kast_impact": [k.model_dump() for k in enhanced_review.kast_impact],
+        "economy_analysis": enhanced_review.economy_analysis.model_dump() if enhanced_review.economy_analysis else None,
+        "what_if_candidates": enhanced_review.what_if_candidates
+    }
+    return macro_data, enhanced_stats
+
+
+def _valorant_match_summary(game_state: GameState, all_players: List["PlayerView"]) -> Dict[str, Any]:
+    """Scoreline block of the VALORANT full analysis."""
+    return {
+        "team_1_name": game_state.team_1_name,
+        "team_2_name": game_state.team_2_name,
+        "team_1_score": game_state.team_1_score,
+        "team_2_score": game_state.team_2_score,
+        "winner": game_state.winner,
+        "map_name": game_state.map_name,
+        "players": all_players
+    }
+
+
+def _valorant_recommendations(macro_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Top coaching recommendations pulled from a VALORANT macro review."""
+    return {
+        "priority_review_rounds": macro_data.get("priority_review_rounds", [])[:5],
+        "training_focus": macro_data.get("training_recommendations", [])[:3],
+        "attack_patterns": macro_data.get("attack_patterns", [])[:3],
+        "defense_patterns": macro_data.get("defense_patterns", [])[:3]
+    }
+
+
+@dataclass(slots=True)
+class PlayerView:
+    """
+    One row of the VALORANT players array for the frontend. Slotted, so ten of
+    them cost far less than 19-key dicts; orjson encodes it as a JSON object
+    with the fields in this order.
+    """
+    name: str
+    agent: str  # champion field holds agent in VALORANT
+    role: str
+    team: Optional[str]
+    # Core stats
+    kills: int
+    deaths: int
+    assists: int
+    # Advanced stats from GRID
+    adr: float
+    headshot_pct: float
+    headshots: int
+    damage_dealt: int
+    # Performance metrics
+    first_bloods: int
+    first_deaths: int
+    clutch_wins: int
+    multikills: int
+    kast: float  # Default 0 from GRID
+    acs: float   # Default 0 from GRID - overwritten by the stats processor
+    # State
+    alive: bool
+    money: int
+
+
+# PlayerState attribute behind each PlayerView field, in field order; one
+# C-level call fetches them all as a tuple
+_PLAYER_VIEW_SOURCES: Final[Tuple[str, ...]] = (
+    "player_name", "champion", "role", "team_name",
+    "kills", "deaths", "assists",
+    "adr", "headshot_pct", "headshots", "damage_dealt",
+    "first_bloods", "first_deaths", "clutch_wins", "multikills", "kast", "acs",
+    "alive", "gold",
+)
+_player_row = operator.attrgetter(*_PLAYER_VIEW_SOURCES)
+
+
+def _build_valorant_players(series_id: str, game_state: GameState) -> List[PlayerView]:
+    """Flat players array for the frontend, with ACS/HS% recomputed by the stats processor."""
+    # Build flat players array for frontend from game_state
+    all_players = [PlayerView(*_player_row(ps)) for ps in game_state.player_states]
+        
+    # [NEW] Calculate Advanced Stats (ACS, KAST) using Processor
+    try:
+        # 1. Convert to ValorantMatch, partitioning players by team in one pass.
+        # Every value comes from the already-validated GameState, so the stats
+        # models are built with model_construct (no re-validation).
+        v_team1_players: List[ValorantPlayerState] = []
+        v_team2_players: List[ValorantPlayerState] = []
+        team_1_name, team_2_name = game_state.team_1_name, game_state.team_2_name
+        for p in all_players:
+            team = p.team
+            if team == team_1_name:
+                side, roster = "Attack", v_team1_players  # Dummy side for stats calc
+            elif team == team_2_name:
+                side, roster = "Defense", v_team2_players
+            else:
+                continue
+            roster.append(ValorantPlayerState.model_construct(
+                player_name=p.name,
+                agent=p.agent or "Unknown",
+                role=p.role or "Unknown",
+                team_side=side,
+                kills=p.kills,
+                deaths=p.deaths,
+                assists=p.assists,
+                damage_dealt=p.damage_dealt,
+                headshots=p.headshots
+            ))
+        
+        v_match = ValorantMatch.model_construct(
+            match_id=series_id,
+            map_name=game_state.map_name or "Unknown",
+            team_1=team_1_name or "Team 1",
+            team_2=team_2_name or "Team 2",
+            team_1_score=game_state.team_1_score,
+            team_2_score=game_state.team_2_score,
+            winner=game_state.winner or "Unknown",
+            team_1_players=v_team1_players,
+            team_2_players=v_team2_players,
+            total_rounds=game_state.team_1_score + game_state.team_2_score
+        )
+        
+        # 2. Run Processor
+        computed_stats = valorant_stats.process_match_stats(v_match)
+        p_stats_map = computed_stats["player_stats"]
+        
+        # 3. Merge back into all_players (one lookup per player)
+        for p in all_players:
+            stats = p_stats_map.get(p.name)
+            if stats is not None:
+                p.acs = stats.average_damage_per_round # ACS (mapped to this field)
+                p.headshot_pct = stats.headshot_percent # Real HS %
+                # Recalculate ADR properly if needed, but ACS covers the 'score'
+                # Let's ensure ADR is also accurate (Damage / Rounds)
+                # p["adr"] = (stats.average_damage_per_round if stats.average_damage_per_round > 0 else p["adr"]) # Wait, stats.ADPR is ACS.
+                # We need real ADR field or assume ACS ~ ADR for now? No, ACS > ADR.
+                # Processor calculated ACS into 'average_damage_per_round'.
+                # We need to compute ADR separately if we want it.
+                # For now, let's just make sure Headshot % is fixed.
+                # KAST - unavailable without round history, but we can try estimating or leave 0
+                # p["kast"] = 0 # Grid default
+    except Exception as e:
+        logger.error("Failed to calculate advanced stats: %s", e)
+    
+    return all_players
 
 
 @router.post("/coach/player-insights-valorant/{series_id}/{player_name}")
@@ -1874,11 +2595,7 @@ async def player_insights_valorant(series_id: str, player_name: str) -> Dict[str
         game_state = await grid_client.get_game_state(series_id)
         
         # Find the target player
-        player_state = None
-        for ps in game_state.player_states:
-            if ps.player_name.lower() == player_name.lower():
-                player_state = ps
-                break
+        player_state = game_state.player_index.get(player_name.casefold())
         
         if not player_state:
             raise HTTPException(status_code=404, detail=f"Player '{player_name}' not found")
@@ -1895,6 +2612,5 @@ async def player_insights_valorant(series_id: str, player_name: str) -> Dict[str
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Player Insight Error: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to generate insights: {str(e)}")
+        raise _http_error("Failed to generate insights", e)
 
@@ -0,0 +1,190 @@
+"""
+In-process caching primitives for Team Intuition Engine.
+Provides a bounded TTL+LRU cache, single-flight request coalescing for
+expensive GRID + DeepSeek pipelines (also as a decorator), an async TTL cache
+decorator and a background sweep that purges expired entries.
+"""
+import asyncio
+import functools
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Every live TTLCache, so sweep_expired() can purge them without a registry
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Expired entries are evicted lazily on access; once `maxsize` is reached
+    the least recently used entry is dropped.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        _caches.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` under `key`, evicting the oldest entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry (not just the ones being read); returns the count."""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+async def sweep_expired(interval: float) -> None:
+    """
+    Purge expired entries from every TTLCache every `interval` seconds.
+
+    Lazy eviction only frees entries that are read again, so keys for series
+    nobody asks about twice would otherwise sit in memory until LRU pressure.
+    Runs until cancelled (started and cancelled by the app lifespan).
+    """
+    while True:
+        await asyncio.sleep(interval)
+        purged = sum(cache.purge_expired() for cache in list(_caches))
+        if purged:
+            logger.debug("Cache sweep purged %d expired entries", purged)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one in-flight task.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same result instead of repeating the upstream
+    GRID/DeepSeek calls.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn()` for `key`, sharing the result with concurrent callers."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        # Shield so one cancelled waiter doesn't cancel the shared work
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+def single_flight(key_fn: Optional[Callable[..., Hashable]] = None):
+    """
+    Coalesce concurrent calls of an async function that share a key.
+
+    `key_fn` receives the call's arguments (default: the arguments themselves).
+    Nothing is cached - once the shared call finishes the next caller starts a
+    fresh one - so it is safe for endpoints whose data moves during a live series.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        flight = SingleFlight()
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = key_fn(*args, **kwargs) if key_fn else (args, tuple(sorted(kwargs.items())))
+            return await flight.do(key, lambda: fn(*args, **kwargs))
+
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
+
+
+def async_ttl_cache(
+    ttl: float,
+    maxsize: int = 128,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+):
+    """
+    Cache an async function's results per call arguments for `ttl` seconds.
+
+    Concurrent misses for the same arguments share one call. Results are only
+    stored when `cache_if(result)` is true (default: always), so upstream error
+    payloads aren't pinned for the whole TTL. Cached values are shared between
+    callers and must not be mutated.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        flight = SingleFlight()
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            async def call():
+                result = await fn(*args, **kwargs)
+                if cache_if is None or cache_if(result):
+                    cache.set(key, result)
+                return result
+
+            return await flight.do(key, call)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
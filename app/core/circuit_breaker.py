@@ -0,0 +1,63 @@
+"""
+Circuit breaker for upstream calls (DeepSeek).
+After `fail_max` consecutive failures the breaker opens and calls fail fast
+with CircuitOpenError for `reset_timeout` seconds, so a hung or erroring
+upstream can't tie up every request waiting on it.
+"""
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while the breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: calls go through. Open: calls raise CircuitOpenError until
+    `reset_timeout` has passed. Half-open: one trial call goes through - success
+    closes the breaker, failure opens it again. The trial restarts the open
+    window, so a trial that never reports back (cancelled) just delays the next.
+    """
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through right now."""
+        if self._opened_at is None:
+            return
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            raise CircuitOpenError(f"{self.name} circuit open")
+        self._opened_at = now
+        self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("%s circuit closed", self.name)
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.fail_max:
+            if self._opened_at is None:
+                logger.warning("%s circuit opened after %s consecutive failures", self.name, self._failures)
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
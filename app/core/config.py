@@ -8,12 +8,39 @@ class Settings(BaseSettings):
     DEEPSEEK_API_KEY: str = ""
     DEEPSEEK_BASE_URL: str = "https://api.deepseek.com"
     DEEPSEEK_MODEL: str = "deepseek-chat"
+    DEEPSEEK_MAX_CONCURRENCY: int = 8  # In-flight DeepSeek calls; the rest queue
+    DEEPSEEK_QUEUE_TIMEOUT: float = 30.0  # Max seconds a call waits for a free slot
+    DEEPSEEK_CACHE_TTL: int = 300  # Seconds to reuse a response for an identical prompt
+    DEEPSEEK_TIMEOUT: float = 20.0  # Hard cap per completion (covers the SDK's retries)
+    DEEPSEEK_BREAKER_FAILURES: int = 5  # Consecutive failures before failing fast
+    DEEPSEEK_BREAKER_RESET: float = 30.0  # Seconds to fail fast before a trial call
     
     # GRID API Configuration
     GRID_API_KEY: str = ""
     GRID_API_URL: str = "https://api-op.grid.gg/live-data-feed/series-state/graphql"
     GRID_EVENTS_URL: str = "https://api-op.grid.gg/live-data-feed/series-events/graphql"
     GRID_CENTRAL_DATA_URL: str = "https://api-op.grid.gg/central-data/graphql"
+    GRID_LIVE_SERIES_TTL: float = 3.0  # Seconds to reuse a live series state between polls
+    GRID_FINISHED_SERIES_TTL: int = 3600  # Seconds to keep a finished series state
+    
+    # Outbound HTTP connection pool (shared per client, opened in the app lifespan)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 50
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_POOL_TIMEOUT: float = 5.0  # Max wait for a free pooled connection before failing
+    HTTP2: bool = False  # Needs the h2 package (pip install "httpx[http2]")
+    HTTP_PREWARM: bool = True  # Open a keep-alive connection to GRID/DeepSeek at startup
+    
+    # Response compression (clients that send Accept-Encoding: gzip)
+    GZIP_MIN_SIZE: int = 1024  # Bytes; smaller bodies aren't worth compressing
+    GZIP_LEVEL: int = 5  # Most of level 9's ratio on JSON at a fraction of the CPU
+    
+    # In-process response caches
+    CACHE_SWEEP_INTERVAL: int = 60  # Seconds between expired-entry sweeps
+    
+    # Stored analyses of finished series (cached_analyses table)
+    ANALYSIS_CACHE_VERSION: str = "1"  # Bump on prompt/analyzer changes to roll stored analyses
+    ANALYSIS_CACHE_MAX_AGE: int = 7 * 24 * 3600  # Seconds a stored analysis is replayed
     
     model_config = SettingsConfigDict(case_sensitive=True, env_file=".env")
 
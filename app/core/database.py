@@ -4,7 +4,7 @@ Uses SQLAlchemy with SQLite for persistence.
 Supports DATABASE_URL env var for PostgreSQL on Railway.
 """
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # Use DATABASE_URL from environment (Railway PostgreSQL) or fallback to SQLite
@@ -15,16 +15,31 @@ if DATABASE_URL:
     if DATABASE_URL.startswith("postgres://"):
         DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
     SQLALCHEMY_DATABASE_URL = DATABASE_URL
-    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    # pre_ping replaces connections the platform dropped while idle
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_size=10, max_overflow=20, pool_pre_ping=True)
 else:
     # Local development: use SQLite
     SQLALCHEMY_DATABASE_URL = "sqlite:///./team_intuition.db"
+    # Default QueuePool keeps connections open between requests; not StaticPool,
+    # which would share one connection across the threadpool's sessions
     engine = create_engine(
         SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
     )
 
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers run alongside a writer; NORMAL sync is safe under WAL."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 # Create session local class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False keeps committed rows readable after the commit
+# (otherwise an updated row serializes as an empty object).
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
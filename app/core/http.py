@@ -0,0 +1,28 @@
+"""
+Process-wide outbound HTTP client for Team Intuition Engine.
+One pooled httpx.AsyncClient, created in the app lifespan, is shared by the
+GRID and DeepSeek clients so both reuse keep-alive connections.
+"""
+import httpx
+
+from .config import settings
+
+
+def request_timeout(read: float) -> httpx.Timeout:
+    """
+    Per-request timeout that keeps the pool's connect/pool limits. Passing a
+    bare float to httpx would apply it to every phase, including connect.
+    """
+    return httpx.Timeout(read, connect=settings.HTTP_CONNECT_TIMEOUT, pool=settings.HTTP_POOL_TIMEOUT)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the shared pooled client (call on the serving event loop)."""
+    return httpx.AsyncClient(
+        http2=settings.HTTP2,
+        timeout=request_timeout(30.0),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        )
+    )
@@ -0,0 +1,93 @@
+"""
+Response classes for Team Intuition Engine.
+Uses orjson for JSON encoding, which is several times faster than the
+stdlib encoder on the large nested analysis payloads, and provides
+Server-Sent Events helpers for streaming DeepSeek output.
+"""
+import hashlib
+from typing import Any, AsyncIterator, Final, Iterable, Optional, Tuple
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+# Stringify int/enum dict keys (e.g. round numbers) the way the stdlib encoder
+# does - plain orjson raises TypeError on them
+JSON_OPTIONS: Final[int] = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize `content` with orjson using the app-wide JSON_OPTIONS."""
+    return orjson.dumps(content, option=JSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def etag_for(payload: bytes) -> str:
+    """Strong ETag for a serialized body (128-bit blake2b of the bytes)."""
+    return '"' + hashlib.blake2b(payload, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match already covers `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def cached_json_response(request: Request, payload: bytes, etag: str, cache_control: str) -> Response:
+    """
+    Serve pre-serialized JSON with ETag/Cache-Control headers, answering
+    304 Not Modified (no body) when the client already holds this version.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+def wants_event_stream(request: Request) -> bool:
+    """True when the client asked for Server-Sent Events via the Accept header."""
+    return "text/event-stream" in request.headers.get("accept", "")
+
+
+def sse_event(data: Any, event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Event with an orjson `data:` payload."""
+    prefix = b"event: " + event.encode() + b"\n" if event else b""
+    return prefix + b"data: " + dumps(data) + b"\n\n"
+
+
+def wants_ndjson(request: Request) -> bool:
+    """True when the client asked for newline-delimited JSON via the Accept header."""
+    return "application/x-ndjson" in request.headers.get("accept", "")
+
+
+def ndjson_stream(rows: Iterable[Any]) -> StreamingResponse:
+    """Stream `rows` as newline-delimited JSON, one orjson-encoded object per line."""
+    def _gen():
+        for row in rows:
+            yield dumps(row) + b"\n"
+
+    return StreamingResponse(_gen(), media_type="application/x-ndjson")
+
+
+def event_stream(events: AsyncIterator[Tuple[str, Any]]) -> StreamingResponse:
+    """Stream `(event, data)` pairs to the client as Server-Sent Events."""
+    async def _gen():
+        async for event, data in events:
+            yield sse_event(data, event)
+
+    return StreamingResponse(
+        _gen(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
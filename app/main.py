@@ -9,21 +9,57 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 logger.info("Starting Team Intuition Engine...")
-logger.info(f"DATABASE_URL set: {bool(os.getenv('DATABASE_URL'))}")
+logger.info("DATABASE_URL set: %s", bool(os.getenv('DATABASE_URL')))
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from .api.routes import router as api_router
+from .core.cache import sweep_expired
+from .core.http import create_http_client
 from .core.config import settings
+from .core.responses import ORJSONResponse
 from .core.database import engine, Base
 from .models import db as db_models
+from .services.grid_client import grid_client
+from .services.deepseek_client import deepseek_client
 
 # Create database tables
 try:
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created successfully")
 except Exception as e:
-    logger.error(f"Database initialization failed: {e}")
+    logger.error("Database initialization failed: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the shared outbound connection pool on the serving event loop, hand it
+    to the GRID and DeepSeek clients, and close it on shutdown. The clients stay
+    module singletons (routes and services import them directly); only the pool
+    is bound here (also exposed as app.state.http).
+    Also runs the background sweep that purges expired cache entries, and
+    pre-warms one keep-alive connection per upstream without delaying startup.
+    """
+    http = create_http_client()
+    app.state.http = http
+    await grid_client.start(http)
+    await deepseek_client.start(http)
+    tasks = [asyncio.create_task(sweep_expired(settings.CACHE_SWEEP_INTERVAL))]
+    if settings.HTTP_PREWARM:
+        tasks.append(asyncio.create_task(grid_client.warm()))
+        tasks.append(asyncio.create_task(deepseek_client.warm()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        await grid_client.aclose()
+        await deepseek_client.aclose()
+        await http.aclose()
 
 
 def get_application() -> FastAPI:
@@ -31,6 +67,9 @@ def get_application() -> FastAPI:
         title=settings.PROJECT_NAME,
         description="AI-powered coaching insights for League of Legends. Comprehensive Assistant Coach for esports teams.",
         version="1.0.0",
+        lifespan=lifespan,
+        # App-wide so /health, / and any router without its own default also use orjson
+        default_response_class=ORJSONResponse,
     )
     
     # Enable CORS for dashboard
@@ -47,9 +86,21 @@ def get_application() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Analysis bodies run to tens of KB of JSON; SSE streams are left uncompressed
+    application.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MIN_SIZE,
+        compresslevel=settings.GZIP_LEVEL,
+    )
 
     application.include_router(api_router, prefix=settings.API_V1_STR)
 
+    @application.exception_handler(Exception)
+    async def unhandled_exception(request: Request, exc: Exception) -> ORJSONResponse:
+        """Last resort for errors no endpoint mapped: log the traceback and answer in JSON, not plain text."""
+        logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+        return ORJSONResponse({"detail": "Internal server error"}, status_code=500)
+
     @application.get("/health")
     async def health_check():
         return {"status": "ok"}
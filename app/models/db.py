@@ -1,10 +1,15 @@
 """
 Database models for Team Intuition Engine.
 """
-from sqlalchemy import Column, Integer, String, DateTime
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary
+from datetime import datetime, timezone
 from ..core.database import Base
 
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime (the form stored in DateTime columns)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class RecentMatch(Base):
     """
     Stores history of connected matches/series for quick access.
@@ -16,8 +21,24 @@ class RecentMatch(Base):
     title = Column(String) # e.g. "League of Legends", "Valorant"
     team1_name = Column(String)
     team2_name = Column(String)
-    match_time = Column(DateTime, default=datetime.utcnow)
+    match_time = Column(DateTime, default=utcnow)
     
     # Optional metadata
     winner = Column(String, nullable=True)
     score = Column(String, nullable=True)
+
+
+class CachedAnalysis(Base):
+    """
+    Serialized analysis of a finished series, so repeat requests skip GRID and DeepSeek.
+    A finished series no longer changes, but the analysis of it does when the
+    prompts or model change - rows are keyed by `version` and expire by age.
+    Purely a cache: the table can be dropped at any time.
+    """
+    __tablename__ = "cached_analyses"
+
+    series_id = Column(String, primary_key=True)
+    endpoint = Column(String, primary_key=True)  # e.g. "full-valorant"
+    version = Column(String, primary_key=True)  # ANALYSIS_CACHE_VERSION + DeepSeek model
+    payload = Column(LargeBinary, nullable=False)  # JSON response body
+    created_at = Column(DateTime, default=utcnow)
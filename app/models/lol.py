@@ -2,6 +2,7 @@
 Pydantic data models for the Team Intuition Engine.
 Defines schemas for players, matches, game state, and AI analysis responses.
 """
+from functools import cached_property, lru_cache
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -38,6 +39,20 @@ class Player(BaseModel):
     team: str # 'blue' or 'red'
     stats: Optional[PlayerStats] = None
 
+    @classmethod
+    def from_state(cls, ps: "PlayerState") -> "Player":
+        """
+        Pro player built from a GRID player snapshot, memoized per
+        (name, role, champion, team) so repeated analyses skip re-validation.
+        The instance is shared between callers and must not be mutated.
+        """
+        return _pro_player(cls, ps.player_name, ps.role, ps.champion, ps.team_name or "Unknown")
+
+
+@lru_cache(maxsize=256)
+def _pro_player(cls: type, name: str, role: str, champion: str, team: str) -> Player:
+    return cls(name=name, role=role, champion=champion, rank="Pro", team=team)
+
 
 class Match(BaseModel):
     """Data model representing a League of Legends match."""
@@ -131,12 +146,23 @@ class GameState(BaseModel):
     team_2_score: int = 0
     winner: Optional[str] = None
     map_name: Optional[str] = None
+    title_id: Optional[int] = None  # GRID title (3=LoL, 6=VALORANT) when known
+    series_finished: bool = False  # GRID seriesState.finished - the state is final
     
     player_states: List[PlayerState] = Field(default_factory=list)
     objective_state: ObjectiveState = Field(default_factory=ObjectiveState)
     recent_timeline: List[TimelineEvent] = Field(default_factory=list)
     gold_difference: int = 0  # Positive = blue advantage
 
+    @cached_property
+    def player_index(self) -> Dict[str, PlayerState]:
+        """
+        Player states keyed by casefolded player name, built once per instance.
+        Lookups should casefold too: `game_state.player_index.get(name.casefold())`.
+        Not a field, so it is never serialized.
+        """
+        return {ps.player_name.casefold(): ps for ps in self.player_states}
+
 
 # ============================================================================
 # Analysis Request Models
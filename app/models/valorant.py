@@ -2,6 +2,8 @@
 VALORANT-specific models and utilities for Team Intuition Engine.
 Extends the base models with VALORANT-specific concepts like rounds, agents, economy.
 """
+from functools import cached_property
+from itertools import chain
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
 from enum import Enum
@@ -130,6 +132,17 @@ class ValorantMatch(BaseModel):
     total_rounds: int = 0
     overtime_rounds: int = 0
 
+    @cached_property
+    def player_index(self) -> Dict[str, ValorantPlayerState]:
+        """
+        Both rosters keyed by casefolded player name, built once per instance
+        (team 1 wins on a name clash). Not a field, so it is never serialized.
+        """
+        index: Dict[str, ValorantPlayerState] = {}
+        for p in chain(self.team_1_players, self.team_2_players):
+            index.setdefault(p.player_name.casefold(), p)
+        return index
+
 
 # ============================================================================
 # VALORANT Analysis Response Models
@@ -300,4 +313,8 @@ class EnhancedMacroReview(BaseModel):
     economy_analysis: Optional[EconomyStats] = None
     
     # What If candidates (critical rounds that can be further analyzed)
-    what_if_candidates: List[int] = Field(default_factory=list, description="Round numbers good for What If analysis")
\ No newline at end of file
+    what_if_candidates: List[int] = Field(default_factory=list, description="Round numbers good for What If analysis")
+    
+    # False when DeepSeek's answer could not be parsed and the review is built
+    # from fallbacks only. Internal - never serialized.
+    ai_parsed: bool = Field(default=True, exclude=True)
\ No newline at end of file
@@ -3,14 +3,24 @@ DeepSeek API Client for Team Intuition Engine.
 Provides structured AI reasoning for micro-error detection, team synergy, and hypothetical predictions.
 All coaching decisions flow through this client—no hard-coded rules.
 """
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Final, List, Mapping, Optional
+import httpx
+import orjson
 from openai import AsyncOpenAI
+from ..core.cache import TTLCache
+from ..core.circuit_breaker import CircuitBreaker
 from ..core.config import settings
+from ..core.http import request_timeout
 
 logger = logging.getLogger(__name__)
 
+# Shared "any JSON object" schema hint - read-only since every caller passes the same instance
+OBJECT_SCHEMA: Final[Mapping[str, Any]] = MappingProxyType({"type": "object"})
+
 
 class DeepSeekClient:
     """
@@ -25,10 +35,60 @@ class DeepSeekClient:
             timeout=60.0
         )
         self.model = settings.DEEPSEEK_MODEL
-        logger.info(f"DeepSeek Client initialized with model: {self.model}")
+        # Shared pooled httpx client behind self.client, set by start()
+        self._http: Optional[httpx.AsyncClient] = None
+        # Exact-prompt memo: prompt hash -> serialized parsed response
+        self._memo = TTLCache(maxsize=512, ttl=settings.DEEPSEEK_CACHE_TTL)
+        # Bounds in-flight DeepSeek calls across every caller; bursts queue here
+        # instead of racing into upstream rate limits and timeouts
+        self._slots = asyncio.Semaphore(settings.DEEPSEEK_MAX_CONCURRENCY)
+        # Fails fast (CircuitOpenError) after repeated API errors/timeouts
+        self._breaker = CircuitBreaker(
+            "DeepSeek",
+            fail_max=settings.DEEPSEEK_BREAKER_FAILURES,
+            reset_timeout=settings.DEEPSEEK_BREAKER_RESET
+        )
+        logger.info("DeepSeek Client initialized with model: %s", self.model)
+    
+    async def start(self, http: httpx.AsyncClient) -> None:
+        """
+        Rebind the OpenAI client to the app's shared pooled httpx client
+        (called from the app lifespan), so concurrent requests share one pool.
+        """
+        self._http = http
+        self.client = AsyncOpenAI(
+            api_key=settings.DEEPSEEK_API_KEY,
+            base_url=settings.DEEPSEEK_BASE_URL,
+            timeout=request_timeout(60.0),
+            http_client=self._http
+        )
+    
+    async def warm(self) -> None:
+        """
+        Open a keep-alive connection to DeepSeek ahead of the first request so
+        it doesn't pay the TCP + TLS handshake. Best effort - errors are ignored.
+        """
+        if self._http is None:
+            return
+        try:
+            await self._http.head(settings.DEEPSEEK_BASE_URL, timeout=settings.HTTP_CONNECT_TIMEOUT)
+        except httpx.HTTPError as e:
+            logger.debug("DeepSeek pre-warm failed: %r", e)
+    
+    async def aclose(self) -> None:
+        """
+        Detach from the shared HTTP client (the lifespan owns and closes it).
+        Falls back to a standalone OpenAI client for any later use.
+        """
+        self._http = None
+        self.client = AsyncOpenAI(
+            api_key=settings.DEEPSEEK_API_KEY,
+            base_url=settings.DEEPSEEK_BASE_URL,
+            timeout=60.0
+        )
     
     async def analyze(self, system_prompt: str, user_prompt: str, 
-                      response_schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                      response_schema: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
         """
         Send a structured analysis request to DeepSeek.
         
@@ -39,29 +99,127 @@ class DeepSeekClient:
             
         Returns:
             Parsed JSON response from DeepSeek
+            
+        Identical requests within DEEPSEEK_CACHE_TTL are answered from memory.
+        Each caller gets its own copy, so callers may mutate the result.
+        
+        At most DEEPSEEK_MAX_CONCURRENCY calls are in flight; the rest queue.
+        Raises asyncio.TimeoutError after DEEPSEEK_QUEUE_TIMEOUT seconds queued
+        or DEEPSEEK_TIMEOUT seconds in the call, and CircuitOpenError without
+        calling the API while the breaker is open.
         """
+        memo_key = self._memo_key(system_prompt, user_prompt, response_schema)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            logger.debug("DeepSeek memo hit")
+            return orjson.loads(cached)
+        
+        await self._acquire_slot()
+        try:
+            result = await self._complete(system_prompt, user_prompt, response_schema)
+        finally:
+            self._slots.release()
+        
+        if not result.get("parse_error"):
+            self._memo[memo_key] = orjson.dumps(result)
+        return result
+    
+    async def _acquire_slot(self) -> None:
+        """Wait for a free DeepSeek slot (asyncio.TimeoutError after DEEPSEEK_QUEUE_TIMEOUT)."""
+        await asyncio.wait_for(self._slots.acquire(), timeout=settings.DEEPSEEK_QUEUE_TIMEOUT)
+    
+    async def _complete(self, system_prompt: str, user_prompt: str,
+                        response_schema: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+        """One non-streaming completion through the circuit breaker (see `analyze`)."""
+        self._breaker.before_call()
         try:
             messages = [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ]
             
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=2000,
-                response_format={"type": "json_object"} if response_schema else None
+            response = await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=2000,
+                    response_format={"type": "json_object"} if response_schema else None
+                ),
+                timeout=settings.DEEPSEEK_TIMEOUT
             )
             
             content = response.choices[0].message.content
-            return self._parse_json_response(content)
+            result = self.parse_json_response(content)
+            
+        except Exception as e:
+            self._breaker.record_failure()
+            logger.error("DeepSeek API error: %r", e)
+            raise
+        self._breaker.record_success()
+        return result
+    
+    def _memo_key(self, system_prompt: str, user_prompt: str,
+                  response_schema: Optional[Mapping[str, Any]]) -> bytes:
+        """Exact-match cache key: blake2b over model, prompts and output mode."""
+        h = hashlib.blake2b(digest_size=16)
+        for part in (self.model, system_prompt, user_prompt, "json" if response_schema else "text"):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.digest()
+    
+    async def analyze_stream(self, system_prompt: str, user_prompt: str,
+                             response_schema: Optional[Mapping[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        Stream a structured analysis request to DeepSeek.
+        
+        Same request as `analyze`, but yields content deltas as the model emits
+        them so callers can forward tokens before the completion finishes.
+        Join the deltas and pass them to `parse_json_response` for the result.
+        DEEPSEEK_TIMEOUT caps the wait for the stream to open; the concurrency
+        slot (held until the stream ends) and circuit breaker apply as in `analyze`.
+        """
+        await self._acquire_slot()
+        try:
+            async for delta in self._stream(system_prompt, user_prompt, response_schema):
+                yield delta
+        finally:
+            self._slots.release()
+    
+    async def _stream(self, system_prompt: str, user_prompt: str,
+                      response_schema: Optional[Mapping[str, Any]]) -> AsyncIterator[str]:
+        """Streaming completion through the circuit breaker (see `analyze_stream`)."""
+        self._breaker.before_call()
+        try:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+            
+            stream = await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=2000,
+                    response_format={"type": "json_object"} if response_schema else None,
+                    stream=True
+                ),
+                timeout=settings.DEEPSEEK_TIMEOUT
+            )
+            # The stream opened - count that as the success (the consumer may stop early)
+            self._breaker.record_success()
+            
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
             
         except Exception as e:
-            logger.error(f"DeepSeek API error: {e}")
+            self._breaker.record_failure()
+            logger.error("DeepSeek streaming error: %r", e)
             raise
     
-    def _parse_json_response(self, content: str) -> Dict[str, Any]:
+    def parse_json_response(self, content: str) -> Dict[str, Any]:
         """Parse JSON from response, handling markdown code blocks."""
         content = content.strip()
         
@@ -74,8 +232,8 @@ class DeepSeekClient:
             content = content[:-3]
         
         try:
-            return json.loads(content.strip())
-        except json.JSONDecodeError:
+            return orjson.loads(content.strip())
+        except orjson.JSONDecodeError:
             return {"raw_response": content, "parse_error": True}
 
 
@@ -3,16 +3,17 @@ Micro-Error Detection Module for Team Intuition Engine.
 Uses DeepSeek to dynamically identify player mistakes and their cascading effects.
 All predictions flow through AI—no hard-coded rules.
 """
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
 from ..models.lol import (
     Player, PlayerState, TimelineEvent,
     MicroError, ErrorAssessment, MicroErrorResponse, AnalysisResponse
 )
-from .deepseek_client import deepseek_client, PromptTemplates
+from .deepseek_client import deepseek_client, PromptTemplates, OBJECT_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -72,12 +73,30 @@ class MicroErrorDetector(MicroErrorDetectorInterface):
         response = await self.client.analyze(
             system_prompt=PromptTemplates.MICRO_ERROR_DETECTION,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         # Parse response into structured models
         return self._parse_response(response, player.name)
     
+    async def detect_errors_batch(
+        self,
+        players: Sequence[Tuple[Player, PlayerState]],
+        timeline: Optional[List[TimelineEvent]] = None
+    ) -> List[Union[MicroErrorResponse, Exception]]:
+        """
+        Detect micro-errors for several players at once.
+        
+        The per-player DeepSeek calls are independent, so they run concurrently
+        (one round-trip of latency instead of one per player). Results come back
+        in input order; a failed player yields its exception instead of failing
+        the whole batch.
+        """
+        return await asyncio.gather(
+            *(self.detect_errors(player, timeline, [state]) for player, state in players),
+            return_exceptions=True
+        )
+    
     def _build_analysis_prompt(
         self,
         player: Player,
@@ -158,7 +177,7 @@ Respond with JSON containing "errors" array and "overall_assessment" object.
                 )
                 errors.append(micro_error)
             except Exception as e:
-                logger.warning(f"Failed to parse error: {e}")
+                logger.warning("Failed to parse error: %s", e)
                 continue
         
         # Parse overall assessment
@@ -173,7 +192,7 @@ Respond with JSON containing "errors" array and "overall_assessment" object.
                     reasoning=raw_assessment.get("reasoning", "Analysis based on available data")
                 )
             except Exception as e:
-                logger.warning(f"Failed to parse assessment: {e}")
+                logger.warning("Failed to parse assessment: %s", e)
         
         return MicroErrorResponse(
             status="success",
@@ -188,8 +207,6 @@ Respond with JSON containing "errors" array and "overall_assessment" object.
     # Legacy method for backward compatibility
     def detect_errors_sync(self, player_data: Player) -> AnalysisResponse:
         """Synchronous wrapper for legacy API compatibility."""
-        import asyncio
-        
         async def _run():
             result = await self.detect_errors(player_data)
             # Convert to legacy format
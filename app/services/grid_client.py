@@ -1,11 +1,15 @@
+import asyncio
 import logging
 import json
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from typing import Any, Dict, List, Optional, AsyncGenerator, NamedTuple, Tuple
 import httpx
+import orjson
 import websockets
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ..core.config import settings
+from ..core.cache import SingleFlight, TTLCache
+from ..core.http import request_timeout
 from ..models.lol import (
     Player, PlayerStats, PlayerState, Match,
     TimelineEvent, ObjectiveState, GameState
@@ -13,6 +17,33 @@ from ..models.lol import (
 
 logger = logging.getLogger(__name__)
 
+# GRID title IDs
+LOL_TITLE_ID = 3
+VALORANT_TITLE_ID = 6
+
+# Game-team GraphQL type -> GRID title ID (lets us tag GameState without a title query)
+_TEAM_TYPENAME_TITLES = {
+    "GameTeamStateLol": LOL_TITLE_ID,
+    "GameTeamStateValorant": VALORANT_TITLE_ID,
+}
+
+
+def series_state_of(state_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The `data.seriesState` object of a series-state response ({} if missing or null)."""
+    return ((state_data or {}).get("data") or {}).get("seriesState") or {}
+
+
+def latest_game(state_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The current (last) game of a series-state response ({} if there are none)."""
+    games = series_state_of(state_data).get("games") or []
+    return games[-1] if games else {}
+
+
+class SeriesBundle(NamedTuple):
+    """Match + GameState built from a single series-state fetch (see get_bundle)."""
+    match: Match
+    game_state: GameState
+
 
 class GRIDClient:
     """
@@ -36,8 +67,50 @@ class GRIDClient:
         self.events_ws_url = "wss://api-op.grid.gg/live-data-feed/series"
         # Central Data - GraphQL over HTTP
         self.central_data_url = settings.GRID_CENTRAL_DATA_URL
-        
-        logger.info(f"GRID Client initialized. State: {self.state_url}, Events WS: {self.events_ws_url}")
+        # Shared pooled HTTP client, handed in by start() from the app lifespan
+        self._http: Optional[httpx.AsyncClient] = None
+        # Coalesces concurrent series-state fetches for the same series
+        self._series_flight = SingleFlight()
+        # Recent series states: live ones briefly (dashboards poll every few
+        # seconds), finished ones for long since they no longer change
+        self._series_live = TTLCache(maxsize=256, ttl=settings.GRID_LIVE_SERIES_TTL)
+        self._series_final = TTLCache(maxsize=256, ttl=settings.GRID_FINISHED_SERIES_TTL)
+        
+        logger.info("GRID Client initialized. State: %s, Events WS: %s", self.state_url, self.events_ws_url)
+
+    async def start(self, http: httpx.AsyncClient) -> None:
+        """Use the app's shared pooled HTTP client (called from the app lifespan)."""
+        self._http = http
+
+    async def warm(self) -> None:
+        """
+        Open a keep-alive connection to GRID ahead of the first request so it
+        doesn't pay the TCP + TLS handshake. Best effort - errors are ignored.
+        """
+        if self._http is None:
+            return
+        try:
+            await self._http.head(self.state_url, timeout=settings.HTTP_CONNECT_TIMEOUT)
+        except httpx.HTTPError as e:
+            logger.debug("GRID pre-warm failed: %r", e)
+
+    async def aclose(self) -> None:
+        """Detach from the shared HTTP client (the lifespan owns and closes it)."""
+        self._http = None
+
+    async def _post_graphql(self, url: str, query: str, variables: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """POST a GraphQL query, reusing the pooled client when the app has started one."""
+        payload = {"query": query, "variables": variables}
+        headers = {"x-api-key": self.api_key, "Content-Type": "application/json"}
+        if self._http is not None:
+            response = await self._http.post(url, json=payload, headers=headers, timeout=request_timeout(timeout))
+        else:
+            # Standalone use (scripts, tests) - no lifespan, so use a one-off client
+            async with httpx.AsyncClient() as client:
+                response = await client.post(url, json=payload, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        # orjson over httpx's .json() (stdlib) - series state payloads are large
+        return orjson.loads(response.content)
 
     async def get_series_state(self, series_id: str) -> Dict[str, Any]:
         """
@@ -46,12 +119,32 @@ class GRIDClient:
         The state updates as actions happen during an ongoing series.
         State remains accessible after the series is finished.
         
+        Concurrent calls for the same series (e.g. player insights for a whole
+        roster, or get_game_state + get_match_for_analysis) share one upstream
+        request, and error-free results are reused for GRID_LIVE_SERIES_TTL
+        seconds (GRID_FINISHED_SERIES_TTL once the series is finished).
+        Callers must treat the returned dict as read-only.
+        
         Args:
             series_id: GRID series identifier
             
         Returns:
             Raw GRID series state data
         """
+        cached = self._series_final.get(series_id) or self._series_live.get(series_id)
+        if cached is not None:
+            return cached
+        return await self._series_flight.do(series_id, lambda: self._fetch_and_cache_series_state(series_id))
+
+    async def _fetch_and_cache_series_state(self, series_id: str) -> Dict[str, Any]:
+        result = await self._fetch_series_state(series_id)
+        if not result.get("errors"):
+            series = (result.get("data") or {}).get("seriesState") or {}
+            (self._series_final if series.get("finished") else self._series_live)[series_id] = result
+        return result
+
+    async def _fetch_series_state(self, series_id: str) -> Dict[str, Any]:
+        """Issue the series-state GraphQL query (see get_series_state)."""
         # Query using proper inline fragments for game-specific types
         # Note: title.name causes errors, SeriesTeamState fragments not supported consistently
         query = """
@@ -70,6 +163,7 @@ class GRIDClient:
                     map { name }
                     clock { currentSeconds }
                     teams {
+                        __typename
                         ... on GameTeamStateValorant {
                             id
                             name
@@ -136,17 +230,9 @@ class GRIDClient:
 
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.state_url,
-                    json={"query": query, "variables": {"seriesId": series_id}},
-                    headers={"x-api-key": self.api_key, "Content-Type": "application/json"},
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post_graphql(self.state_url, query, {"seriesId": series_id}, timeout=30.0)
         except Exception as e:
-            logger.error(f"GRID Series State API error: {e}")
+            logger.error("GRID Series State API error: %s", e)
             raise
 
     async def connect_to_series_stream(self, series_id: str) -> AsyncGenerator[Dict[str, Any], None]:
@@ -166,7 +252,7 @@ class GRIDClient:
         
         try:
             async with websockets.connect(uri) as websocket:
-                logger.info(f"Connected to event stream for series {series_id}")
+                logger.info("Connected to event stream for series %s", series_id)
                 
                 # Send configuration to receive all events
                 config = {
@@ -175,10 +261,10 @@ class GRIDClient:
                 await websocket.send(json.dumps(config))
                 
                 async for message in websocket:
-                    yield json.loads(message)
+                    yield orjson.loads(message)
                     
         except Exception as e:
-            logger.error(f"WebSocket connection error: {e}")
+            logger.error("WebSocket connection error: %s", e)
             raise
 
     async def get_series_events(self, series_id: str) -> Dict[str, Any]:
@@ -207,6 +293,42 @@ class GRIDClient:
         # Transform to our models
         return self._transform_to_game_state(state_data, events_data)
 
+    async def get_bundle(self, series_id: str) -> SeriesBundle:
+        """
+        Fetch a series once and build both the Match and the GameState from it.
+        
+        Endpoints that need both would otherwise go through
+        get_match_for_analysis + get_game_state and rely on the single-flight
+        to line the two series-state requests up; this makes it one round trip
+        regardless of timing.
+        
+        Args:
+            series_id: GRID series identifier
+            
+        Returns:
+            SeriesBundle(match, game_state)
+        """
+        state_data, events_data = await asyncio.gather(
+            self.get_series_state(series_id),
+            self.get_series_events(series_id)
+        )
+        return SeriesBundle(
+            match=self._transform_to_match(series_id, state_data),
+            game_state=self._transform_to_game_state(state_data, events_data)
+        )
+
+    async def get_game_state_with_series(self, series_id: str) -> Tuple[GameState, Dict[str, Any]]:
+        """
+        Fetch a series once and return (GameState, raw series state).
+        
+        The GameState is derived from the series state, so callers that also
+        need the raw data (e.g. segments) get both from one request instead of
+        gathering get_game_state + get_series_state. The raw dict is read-only.
+        """
+        state_data = await self.get_series_state(series_id)
+        events_data = await self.get_series_events(series_id)
+        return self._transform_to_game_state(state_data, events_data), state_data
+
     async def get_titles(self) -> Dict[str, Any]:
         """Query GRID for available titles."""
         query = """
@@ -351,7 +473,7 @@ class GRIDClient:
         
         if team_name or status:
             filtered_edges = []
-            now = datetime.utcnow()
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
             
             for edge in edges:
                 node = edge.get("node", {})
@@ -394,20 +516,12 @@ class GRIDClient:
     async def _execute_central_query(self, query: str, variables: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute a GraphQL query against GRID Central Data API."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.central_data_url,
-                    json={"query": query, "variables": variables or {}},
-                    headers={"x-api-key": self.api_key, "Content-Type": "application/json"},
-                    timeout=60.0
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post_graphql(self.central_data_url, query, variables or {}, timeout=60.0)
         except httpx.TimeoutException:
-            logger.error(f"GRID Central Data API timed out after 60s")
+            logger.error("GRID Central Data API timed out after 60s")
             return {"errors": [{"message": "Request timed out"}]}
         except Exception as e:
-            logger.error(f"GRID Central Data API error: {e}")
+            logger.error("GRID Central Data API error: %s", e)
             return {"errors": [{"message": str(e)}]}
 
     def _transform_to_game_state(
@@ -418,11 +532,10 @@ class GRIDClient:
         """Transform GRID data into our GameState model."""
         
         # Extract series state
-        series = state_data.get("data", {}).get("seriesState", {})
-        games = series.get("games", [])
+        series = series_state_of(state_data)
         
         # Get current/latest game
-        current_game = games[-1] if games else {}
+        current_game = latest_game(state_data)
         
         # Extract game time
         clock = current_game.get("clock", {})
@@ -579,6 +692,9 @@ class GRIDClient:
         # Map Name extraction
         map_name = current_game.get("map", {}).get("name", "Summoner's Rift")
         
+        # Title from the game-team GraphQL type (GameTeamStateValorant / GameTeamStateLol)
+        title_id = _TEAM_TYPENAME_TITLES.get(game_teams[0].get("__typename")) if game_teams else None
+        
         return GameState(
             timestamp=timestamp,
             game_phase=game_phase,
@@ -590,6 +706,8 @@ class GRIDClient:
             team_2_score=game_teams[1].get("score", 0) if len(game_teams) > 1 else 0,
             winner=winner,
             map_name=map_name,
+            title_id=title_id,
+            series_finished=bool(series.get("finished")),
             
             player_states=player_states,
             objective_state=objective_state,
@@ -649,18 +767,18 @@ class GRIDClient:
             Match object with player data
         """
         state_data = await self.get_series_state(series_id)
-        
-        # Extract series state
-        series = state_data.get("data", {}).get("seriesState", {})
-        games = series.get("games", [])
-        current_game = games[-1] if games else {}
+        return self._transform_to_match(series_id, state_data)
+
+    def _transform_to_match(self, series_id: str, state_data: Dict[str, Any]) -> Match:
+        """Build the synergy-analysis Match from raw series state data."""
+        current_game = latest_game(state_data)
         
         # Build players list
         players = []
         teams = current_game.get("teams", [])
         winner_side = "blue"  # Default
         
-        for team in teams:
+        for side, team in zip(("blue", "red"), teams):
             for player in team.get("players", []):
                 state = player.get("state", {})
                 stats = state.get("stats", {})
@@ -674,6 +792,7 @@ class GRIDClient:
                     role=player.get("role", "Unknown"),
                     champion=str(player.get("championId", "Unknown")),
                     rank="Pro",  # Pro matches don't have rank
+                    team=side,
                     stats=PlayerStats(
                         kda=(kills + assists) / max(deaths, 1),
                         cs_per_min=stats.get("minionKills", 0) / 10.0,  # Approximate
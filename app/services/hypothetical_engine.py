@@ -3,10 +3,10 @@ Hypothetical Engine for "What If" Scenario Predictions.
 Uses DeepSeek AI + live GRID game state for production-quality predictions.
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-from .grid_client import GRIDClient
-from .deepseek_client import deepseek_client
+from .grid_client import grid_client
+from .deepseek_client import deepseek_client, OBJECT_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -49,15 +49,61 @@ async def get_hypothetical_result(series_id: str, scenario: str) -> Dict[str, An
     Returns:
         Structured prediction with suggested action, delta, and reasoning
     """
-    client = GRIDClient()
+    game_state, user_prompt = await _build_prompt(series_id, scenario)
+    
+    try:
+        # Call DeepSeek AI for intelligent analysis
+        response = await deepseek_client.analyze(
+            system_prompt=HYPOTHETICAL_PROMPT,
+            user_prompt=user_prompt,
+            response_schema=OBJECT_SCHEMA
+        )
+        return _finalize_response(response, scenario, game_state)
+            
+    except Exception as e:
+        logger.error("DeepSeek analysis failed: %s", e)
+        # Fallback to data-driven heuristic (no hardcoded values)
+        return _compute_heuristic(scenario, game_state)
+
+
+async def stream_hypothetical_result(series_id: str, scenario: str) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Streaming variant of `get_hypothetical_result`.
+    
+    Yields ("delta", text) events as DeepSeek emits tokens, then a single
+    ("result", prediction) event carrying the same structure the buffered
+    call returns (heuristic fallback included).
+    """
+    game_state, user_prompt = await _build_prompt(series_id, scenario)
+    
+    parts = []
+    try:
+        async for delta in deepseek_client.analyze_stream(
+            system_prompt=HYPOTHETICAL_PROMPT,
+            user_prompt=user_prompt,
+            response_schema=OBJECT_SCHEMA
+        ):
+            parts.append(delta)
+            yield "delta", delta
+        response = deepseek_client.parse_json_response("".join(parts))
+        result = _finalize_response(response, scenario, game_state)
+    except Exception as e:
+        logger.error("DeepSeek streaming analysis failed: %s", e)
+        result = _compute_heuristic(scenario, game_state)
+    
+    yield "result", result
+
+
+async def _build_prompt(series_id: str, scenario: str) -> Tuple[Optional[Any], str]:
+    """Fetch live game state (best effort) and build the DeepSeek user prompt."""
     game_state = None
     
     # Fetch live game state from GRID
     try:
-        game_state = await client.get_game_state(series_id)
-        logger.info(f"Fetched live game state for series {series_id}")
+        game_state = await grid_client.get_game_state(series_id)
+        logger.info("Fetched live game state for series %s", series_id)
     except Exception as e:
-        logger.warning(f"Could not fetch live game state for {series_id}: {e}")
+        logger.warning("Could not fetch live game state for %s: %s", series_id, e)
     
     # Build context for DeepSeek
     game_context = _format_game_state(game_state) if game_state else "No live game state available - use general esports knowledge."
@@ -71,27 +117,16 @@ USER QUESTION:
 
 Analyze this scenario and provide your recommendation.
 """
-    
-    try:
-        # Call DeepSeek AI for intelligent analysis
-        response = await deepseek_client.analyze(
-            system_prompt=HYPOTHETICAL_PROMPT,
-            user_prompt=user_prompt,
-            response_schema={"type": "object"}
-        )
-        
-        # Validate response structure
-        if _is_valid_response(response):
-            logger.info(f"DeepSeek returned valid hypothetical analysis")
-            return response
-        else:
-            logger.warning(f"DeepSeek response missing required fields, using fallback")
-            return _enhance_response(response, scenario, game_state)
-            
-    except Exception as e:
-        logger.error(f"DeepSeek analysis failed: {e}")
-        # Fallback to data-driven heuristic (no hardcoded values)
-        return _compute_heuristic(scenario, game_state)
+    return game_state, user_prompt
+
+
+def _finalize_response(response: Dict[str, Any], scenario: str, game_state: Any) -> Dict[str, Any]:
+    """Validate DeepSeek's response structure, filling gaps when fields are missing."""
+    if _is_valid_response(response):
+        logger.info("DeepSeek returned valid hypothetical analysis")
+        return response
+    logger.warning("DeepSeek response missing required fields, using fallback")
+    return _enhance_response(response, scenario, game_state)
 
 
 def _format_game_state(game_state: Any) -> str:
@@ -100,7 +135,7 @@ def _format_game_state(game_state: Any) -> str:
         return "Game state unavailable"
     
     try:
-        gs_dict = game_state.dict() if hasattr(game_state, 'dict') else game_state
+        gs_dict = game_state.model_dump() if hasattr(game_state, 'model_dump') else game_state
         
         lines = [
             f"Map: {gs_dict.get('map_name', 'Unknown')}",
@@ -126,7 +161,7 @@ def _format_game_state(game_state: Any) -> str:
         
         return "\n".join(lines)
     except Exception as e:
-        logger.warning(f"Error formatting game state: {e}")
+        logger.warning("Error formatting game state: %s", e)
         return "Game state formatting error"
 
 
@@ -164,7 +199,7 @@ def _compute_heuristic(scenario: str, game_state: Any) -> Dict[str, Any]:
     
     if game_state:
         try:
-            gs_dict = game_state.dict() if hasattr(game_state, 'dict') else game_state
+            gs_dict = game_state.model_dump() if hasattr(game_state, 'model_dump') else game_state
             players = gs_dict.get('player_states', [])
             
             # Calculate actual economy
@@ -179,7 +214,7 @@ def _compute_heuristic(scenario: str, game_state: Any) -> Dict[str, Any]:
             
             round_score_diff = gs_dict.get('team_1_score', 0) - gs_dict.get('team_2_score', 0)
         except Exception as e:
-            logger.warning(f"Error extracting game state data: {e}")
+            logger.warning("Error extracting game state data: %s", e)
     
     # Calculate probabilities based on real data
     if "force" in lower or "buy" in lower:
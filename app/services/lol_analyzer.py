@@ -7,7 +7,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, Field
 
-from .deepseek_client import deepseek_client, PromptTemplates
+from .deepseek_client import deepseek_client, PromptTemplates, OBJECT_SCHEMA
 from ..models.lol import (
     Match, GameState, TimelineEvent, PlayerState,
     MacroReviewAgenda, CriticalMoment, ObjectiveAnalysis,
@@ -109,7 +109,7 @@ class LoLAnalyzer:
         response = await self.client.analyze(
             system_prompt=MacroReviewPrompts.MACRO_REVIEW,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         return self._parse_response(response, match)
@@ -130,7 +130,7 @@ class LoLAnalyzer:
         ai_response = await self.client.analyze(
             system_prompt=MacroReviewPrompts.MACRO_REVIEW,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         # 2. Quantitative Analysis (Stats Processor)
@@ -165,7 +165,7 @@ class LoLAnalyzer:
                     impact_score=moment.get("impact_score", 0.5)
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse critical moment for enhanced review: {e}")
+                logger.warning("Failed to parse critical moment for enhanced review: %s", e)
 
         # Ensure objective_analysis are parsed into the correct Pydantic model if they come as dicts
         objective_analysis_parsed = []
@@ -180,7 +180,7 @@ class LoLAnalyzer:
                     recommendations=obj.get("recommendations", [])
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse objective analysis for enhanced review: {e}")
+                logger.warning("Failed to parse objective analysis for enhanced review: %s", e)
 
         # Ensure death_analysis is parsed
         death_data = ai_data.get("death_analysis", {})
@@ -319,7 +319,7 @@ class LoLAnalyzer:
                     impact_score=moment.get("impact_score", 0.5)
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse critical moment: {e}")
+                logger.warning("Failed to parse critical moment: %s", e)
         
         # Parse objective analysis
         objective_analysis = []
@@ -334,7 +334,7 @@ class LoLAnalyzer:
                     recommendations=obj.get("recommendations", [])
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse objective analysis: {e}")
+                logger.warning("Failed to parse objective analysis: %s", e)
         
         # Parse death analysis
         death_data = response.get("death_analysis", {})
@@ -7,7 +7,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, Field
 
-from .deepseek_client import deepseek_client
+from .deepseek_client import deepseek_client, OBJECT_SCHEMA
 from ..models.lol import Match, GameState, PlayerState, Player
 
 logger = logging.getLogger(__name__)
@@ -176,7 +176,7 @@ class PlayerInsightGenerator:
         response = await self.client.analyze(
             system_prompt=PlayerInsightPrompts.PLAYER_INSIGHT,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         return self._parse_response(response, player)
@@ -272,7 +272,7 @@ class PlayerInsightGenerator:
                     recommendation=impact.get("recommendation", "")
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse positive impact: {e}")
+                logger.warning("Failed to parse positive impact: %s", e)
         
         # Parse negative impacts
         negative_impacts = []
@@ -288,7 +288,7 @@ class PlayerInsightGenerator:
                     recommendation=impact.get("recommendation", "")
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse negative impact: {e}")
+                logger.warning("Failed to parse negative impact: %s", e)
         
         # Parse statistical outliers
         outliers = []
@@ -302,7 +302,7 @@ class PlayerInsightGenerator:
                     interpretation=outlier.get("interpretation", "")
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse outlier: {e}")
+                logger.warning("Failed to parse outlier: %s", e)
         
         return PlayerInsightReport(
             status="success",
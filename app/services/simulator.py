@@ -3,6 +3,7 @@ Hypothetical Outcome Prediction Module for Team Intuition Engine.
 Uses DeepSeek to answer 'what-if' coaching questions with AI-driven reasoning.
 All predictions flow through AI—no hard-coded rules.
 """
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import List, Optional
@@ -11,7 +12,7 @@ from ..models.lol import (
     DecisionContext, GameState, PlayerState, ObjectiveState,
     ScenarioOutcome, HypotheticalResponse, HypotheticalRequest, AnalysisResponse
 )
-from .deepseek_client import deepseek_client, PromptTemplates
+from .deepseek_client import deepseek_client, PromptTemplates, OBJECT_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +75,7 @@ class HypotheticalSimulator(HypotheticalSimulatorInterface):
         response = await self.client.analyze(
             system_prompt=PromptTemplates.HYPOTHETICAL_PREDICTION,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         # Parse response into structured models
@@ -97,7 +98,7 @@ class HypotheticalSimulator(HypotheticalSimulatorInterface):
         response = await self.client.analyze(
             system_prompt=PromptTemplates.HYPOTHETICAL_PREDICTION,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         # Parse response
@@ -268,8 +269,6 @@ Respond with valid JSON.
     # Legacy method for backward compatibility
     def simulate_decision_sync(self, context: DecisionContext) -> AnalysisResponse:
         """Synchronous wrapper for legacy API compatibility."""
-        import asyncio
-        
         async def _run():
             result = await self.simulate_decision(context)
             # Convert to legacy format
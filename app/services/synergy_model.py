@@ -3,6 +3,7 @@ Team Synergy Modeling Module for Team Intuition Engine.
 Uses DeepSeek to evaluate how individual mistakes influence team-wide strategic outcomes.
 All predictions flow through AI—no hard-coded rules.
 """
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import List, Optional
@@ -12,7 +13,7 @@ from ..models.lol import (
     MicroError, SynergyMetrics, SynergyAnalysis, MicroErrorImpact,
     SynergyResponse, AnalysisResponse
 )
-from .deepseek_client import deepseek_client, PromptTemplates
+from .deepseek_client import deepseek_client, PromptTemplates, OBJECT_SCHEMA
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +77,7 @@ class TeamSynergyModel(TeamSynergyModelInterface):
         response = await self.client.analyze(
             system_prompt=PromptTemplates.TEAM_SYNERGY,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         # Parse response into structured models
@@ -180,7 +181,7 @@ Respond with valid JSON.
                     teamfight_reasoning=raw_analysis.get("teamfight_reasoning", "No analysis available")
                 )
             except Exception as e:
-                logger.warning(f"Failed to parse analysis: {e}")
+                logger.warning("Failed to parse analysis: %s", e)
         
         # Parse micro-error impact
         micro_error_impact = None
@@ -193,7 +194,7 @@ Respond with valid JSON.
                     reasoning=raw_impact.get("reasoning", "No impact analysis available")
                 )
             except Exception as e:
-                logger.warning(f"Failed to parse micro error impact: {e}")
+                logger.warning("Failed to parse micro error impact: %s", e)
         
         return SynergyResponse(
             status="success",
@@ -211,8 +212,6 @@ Respond with valid JSON.
     # Legacy method for backward compatibility
     def evaluate_synergy_sync(self, match_data: Match) -> AnalysisResponse:
         """Synchronous wrapper for legacy API compatibility."""
-        import asyncio
-        
         async def _run():
             result = await self.evaluate_synergy(match_data)
             # Convert to legacy format
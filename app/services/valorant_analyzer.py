@@ -5,7 +5,7 @@ Provides AI-powered coaching insights specifically for VALORANT matches.
 import logging
 from typing import Dict, List, Any, Optional
 
-from .deepseek_client import deepseek_client
+from .deepseek_client import deepseek_client, OBJECT_SCHEMA
 from ..models.valorant import (
     ValorantMatch, ValorantPlayerState, ValorantRound,
     ValorantMicroError, ValorantRoundAnalysis, ValorantTeamMetrics,
@@ -153,7 +153,7 @@ class ValorantAnalyzer:
         response = await self.client.analyze(
             system_prompt=ValorantPrompts.MACRO_REVIEW,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         return self._parse_macro_review(response, match)
@@ -239,7 +239,7 @@ class ValorantAnalyzer:
                     site_analysis=round_data.get("site_analysis")
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse round analysis: {e}")
+                logger.warning("Failed to parse round analysis: %s", e)
         
         # Parse team metrics
         team_metrics = None
@@ -261,7 +261,7 @@ class ValorantAnalyzer:
                 average_eco_damage=metrics_data.get("average_eco_damage", 100)
             )
         except Exception as e:
-            logger.warning(f"Failed to parse team metrics: {e}")
+            logger.warning("Failed to parse team metrics: %s", e)
             # Fallback metrics
             team_metrics = ValorantTeamMetrics(
                 pistol_round_win_rate=0.5, eco_round_win_rate=0.3, full_buy_win_rate=0.5,
@@ -286,7 +286,7 @@ class ValorantAnalyzer:
                     improvement_suggestion=error.get("improvement_suggestion", "")
                 ))
             except Exception as e:
-                logger.warning(f"Failed to parse player error: {e}")
+                logger.warning("Failed to parse player error: %s", e)
         
         # Calculate Real Stats using Processor
         real_stats = valorant_stats.process_match_stats(match)
@@ -460,7 +460,8 @@ class ValorantAnalyzer:
             review=base_review,
             kast_impact=kast_impact_list,
             economy_analysis=economy_stats,
-            what_if_candidates=response.get("priority_review_rounds", [1, 12, 13, 24])
+            what_if_candidates=response.get("priority_review_rounds", [1, 12, 13, 24]),
+            ai_parsed=not response.get("parse_error")
         )
     
     async def generate_player_insights(self, match: ValorantMatch, player_name: str) -> Dict[str, Any]:
@@ -469,10 +470,7 @@ class ValorantAnalyzer:
         Focuses on recurring patterns (Category 1 Req).
         """
         # specialized prompt construction
-        player_data = next((p for p in match.team_1_players if p.player_name.lower() == player_name.lower()), None)
-        if not player_data:
-             # try team 2
-            player_data = next((p for p in match.team_2_players if p.player_name.lower() == player_name.lower()), None)
+        player_data = match.player_index.get(player_name.casefold())
         
         if not player_data:
             return {"error": "Player not found"}
@@ -495,7 +493,7 @@ class ValorantAnalyzer:
         response = await self.client.analyze(
             system_prompt=ValorantPrompts.PLAYER_INSIGHT,
             user_prompt=user_prompt,
-            response_schema={"type": "object"}
+            response_schema=OBJECT_SCHEMA
         )
         
         return response
@@ -1,5 +1,4 @@
 from typing import List, Dict, Any, Optional
-from collections import defaultdict
 import logging
 
 from ..models.valorant import (
@@ -37,79 +36,58 @@ class ValorantStatsProcessor:
         """
         Calculate aggregated stats for each player.
         """
-        stats: Dict[str, ValorantAgentStats] = defaultdict(ValorantAgentStats)
+        # Raw counters per player as plain ints: [kills, deaths, assists,
+        # first_bloods, first_deaths, damage, headshots]. Each ValorantAgentStats
+        # is built once at the end instead of being updated field by field.
+        counters: Dict[str, List[int]] = {}
         
         # Case 1: Round History Available (Detailed Analysis)
         if match.rounds:
             for round_data in match.rounds:
+                # Identify first bloods/deaths from events
+                fb_actor = round_data.first_blood
+                fd_victim = round_data.first_blood_victim
                 for p_state in round_data.player_states:
-                    p_stat = stats[p_state.player_name]
-                    
-                    # Accumulate raw counters
-                    p_stat.kills += p_state.kills
-                    p_stat.deaths += p_state.deaths
-                    p_stat.assists += p_state.assists
-                    
-                    # Identify first bloods/deaths from events
-                    fb_actor = round_data.first_blood
-                    fd_victim = round_data.first_blood_victim
-                    
-                    if fb_actor == p_state.player_name:
-                        p_stat.first_bloods += 1
-                    if fd_victim == p_state.player_name:
-                        p_stat.first_deaths += 1
+                    name = p_state.player_name
+                    c = counters.get(name)
+                    if c is None:
+                        c = counters[name] = [0, 0, 0, 0, 0, 0, 0]
+                    c[0] += p_state.kills
+                    c[1] += p_state.deaths
+                    c[2] += p_state.assists
+                    if fb_actor == name:
+                        c[3] += 1
+                    if fd_victim == name:
+                        c[4] += 1
+                    # Damage/headshots are only taken from match totals
         
         # Case 2: No Round History (Use Match Totals)
         else:
-            all_players = match.team_1_players + match.team_2_players
-            for p in all_players:
-                p_stat = stats[p.player_name]
-                p_stat.kills = p.kills
-                p_stat.deaths = p.deaths
-                p_stat.assists = p.assists
-                # Use total damage_dealt if available for accurate ACS
-                # We store it temporarily in average_damage_per_round to carry it over
-                # (it will be divided later, so we just store raw damage here really)
-                # Hack: abuse the field to store total damage for a moment
-                p_stat.average_damage_per_round = float(p.damage_dealt)
-                p_stat.headshot_percent = float(p.headshots) # Store raw HS count temporarily
+            for p in match.team_1_players + match.team_2_players:
+                counters[p.player_name] = [p.kills, p.deaths, p.assists, 0, 0, p.damage_dealt, p.headshots]
 
         # Post-process averages
         num_rounds = match.total_rounds if match.total_rounds > 0 else 1
         
-        for p_name, p_stat in stats.items():
-            # Calculate ACS
-            # Formula: (1 * Damage) + (150 * Kills) + (25 * Assists) / Rounds
-            
-            # Check if we have total damage stored in the field (from fallback)
-            # or if we need to accumulate it (from rounds loop, wait, loops don't populate ADPR)
-            
-            # If rounds populated damage logic: we didn't populate damage in the rounds loop!
-            # Round loop needs modification to sum damage if we had round data.
-            # But for Fallback path, we put TOTAL damage in p_stat.average_damage_per_round.
-            
-            total_damage = p_stat.average_damage_per_round 
-            # Retrieve raw HS count if stored temporarily
-            raw_headshots = p_stat.headshot_percent # Hack: reused field
-            
-            if total_damage == 0:
-                # Estimate from Kills if no damage data found
-                estimated_damage = (p_stat.kills * 140) 
-                total_damage = estimated_damage
-            
-            combat_score = total_damage + (p_stat.kills * 150) + (p_stat.assists * 25)
-            # Store ACS in average_damage_per_round field (renaming conflict, but consistent with current usage)
-            p_stat.average_damage_per_round = round(combat_score / num_rounds, 1)
-            
-            # Calculate Real Headshot %
-            # If we have raw headshots
-            if p_stat.kills > 0:
-                 # If we used the hack field to store raw HS
-                 p_stat.headshot_percent = round((raw_headshots / p_stat.kills) * 100, 1)
-            else:
-                 p_stat.headshot_percent = 0.0 
+        stats: Dict[str, ValorantAgentStats] = {}
+        for p_name, (kills, deaths, assists, first_bloods, first_deaths, damage, headshots) in counters.items():
+            # Estimate damage from Kills if no damage data found
+            total_damage = float(damage) if damage else float(kills * 140)
+            # ACS formula: (1 * Damage) + (150 * Kills) + (25 * Assists) / Rounds
+            combat_score = total_damage + (kills * 150) + (assists * 25)
+            stats[p_name] = ValorantAgentStats(
+                kills=kills,
+                deaths=deaths,
+                assists=assists,
+                first_bloods=first_bloods,
+                first_deaths=first_deaths,
+                # ACS is stored in average_damage_per_round (consistent with current usage)
+                average_damage_per_round=round(combat_score / num_rounds, 1),
+                # Real headshot % from the raw headshot count
+                headshot_percent=round((headshots / kills) * 100, 1) if kills > 0 else 0.0
+            )
 
-        return dict(stats)
+        return stats
 
     def calculate_kast(self, match: ValorantMatch, player_name: str) -> KASTImpactStats:
         """
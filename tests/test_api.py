@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -58,3 +60,481 @@ def test_simulate_decision():
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "success"
+
+def test_hypothetical_valorant_streams_events(monkeypatch):
+    from app.services.deepseek_client import deepseek_client
+
+    async def fake_stream(*args, **kwargs):
+        yield '{"suggested": '
+        yield '"Save"}'
+
+    monkeypatch.setattr(deepseek_client, "analyze_stream", fake_stream)
+    response = client.post(
+        "/api/v1/grid/hypothetical/valorant",
+        json={"scenario": "Force buy on round 3"},
+        headers={"Accept": "text/event-stream"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.count("event: delta") == 2
+    assert 'event: result\ndata: {"status":"success","game":"valorant"' in response.text
+    assert '"result":{"suggested":"Save"}' in response.text
+
+def test_macro_review_etag_revalidation():
+    from app.api.routes import macro_cache
+    from app.core.responses import etag_for
+
+    payload = b'{"status":"success","series_id":"etag-test","game":"lol","review":{}}'
+    macro_cache["etag-test"] = (payload, etag_for(payload))
+    try:
+        response = client.post("/api/v1/grid/macro-review/etag-test")
+        assert response.status_code == 200
+        assert response.content == payload
+        assert response.headers["x-cache"] == "HIT"
+        etag = response.headers["etag"]
+
+        response = client.post("/api/v1/grid/macro-review/etag-test", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+    finally:
+        macro_cache.pop("etag-test")
+
+
+def test_deepseek_analyze_memoizes_identical_prompts(monkeypatch):
+    from app.services.deepseek_client import deepseek_client
+
+    calls = []
+
+    class _Completions:
+        async def create(self, **kwargs):
+            calls.append(kwargs)
+            message = type("Message", (), {"content": '{"answer": 42}'})
+            choice = type("Choice", (), {"message": message})
+            return type("Completion", (), {"choices": [choice]})
+
+    fake_client = type("Client", (), {"chat": type("Chat", (), {"completions": _Completions()})})
+    monkeypatch.setattr(deepseek_client, "client", fake_client)
+    deepseek_client._memo.clear()
+
+    async def run():
+        first = await deepseek_client.analyze("sys", "memo-test", {"type": "object"})
+        first["answer"] = 0  # callers get their own copy
+        second = await deepseek_client.analyze("sys", "memo-test", {"type": "object"})
+        return second
+
+    assert asyncio.run(run()) == {"answer": 42}
+    assert len(calls) == 1
+    deepseek_client._memo.clear()
+
+
+def test_grid_outage_maps_to_bad_gateway(monkeypatch):
+    import httpx
+    from app.api import routes
+
+    async def unavailable(*args, **kwargs):
+        raise httpx.ConnectError("connection refused")
+
+    monkeypatch.setattr(routes.grid_client, "get_titles", unavailable)
+    response = client.get("/api/v1/grid/titles")
+    assert response.status_code == 502
+    assert "connection refused" not in response.json()["detail"]
+
+
+def test_deepseek_circuit_opens_after_repeated_failures(monkeypatch):
+    from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+    from app.services.deepseek_client import deepseek_client
+
+    calls = []
+
+    class _Completions:
+        async def create(self, **kwargs):
+            calls.append(kwargs)
+            raise RuntimeError("upstream down")
+
+    fake_client = type("Client", (), {"chat": type("Chat", (), {"completions": _Completions()})})
+    monkeypatch.setattr(deepseek_client, "client", fake_client)
+    monkeypatch.setattr(deepseek_client, "_breaker", CircuitBreaker("DeepSeek", fail_max=2, reset_timeout=60))
+
+    async def run():
+        for attempt in range(3):
+            try:
+                await deepseek_client.analyze("sys", f"breaker-test-{attempt}")
+            except RuntimeError:
+                assert attempt < 2
+            except CircuitOpenError:
+                assert attempt == 2
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_round_timeline_reads_current_game_segments(monkeypatch):
+    from app.api import routes
+    from app.models.lol import GameState
+
+    async def game_state(series_id):
+        return GameState(timestamp=0, team_1_name="A", team_2_name="B", map_name="Ascent")
+
+    async def series_state(series_id):
+        segments = [{"sequenceNumber": n, "type": "round"} for n in (2, 1, 13)]
+        return {"data": {"seriesState": {"games": [{"segments": []}, {"segments": segments}]}}}
+
+    monkeypatch.setattr(routes.grid_client, "get_game_state", game_state)
+    monkeypatch.setattr(routes.grid_client, "get_series_state", series_state)
+
+    response = client.get("/api/v1/grid/round-timeline/timeline-test")
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["number"] for r in data["rounds"]] == [1, 2, 13]
+    assert data["critical_round_numbers"] == [1, 13]
+
+
+def test_orjson_response_stringifies_int_keys():
+    from app.core.responses import ORJSONResponse
+
+    response = ORJSONResponse({"rounds": {1: "pistol", 13: "pistol"}})
+    assert response.body == b'{"rounds":{"1":"pistol","13":"pistol"}}'
+
+
+def test_round_timeline_streams_ndjson(monkeypatch):
+    import orjson
+    from app.api import routes
+    from app.models.lol import GameState
+
+    async def game_state(series_id):
+        return GameState(timestamp=0, team_1_name="A", team_2_name="B", map_name="Ascent")
+
+    async def series_state(series_id):
+        segments = [{"sequenceNumber": n, "type": "round"} for n in (2, 1, 25)]
+        return {"data": {"seriesState": {"games": [{"segments": segments}]}}}
+
+    monkeypatch.setattr(routes.grid_client, "get_game_state", game_state)
+    monkeypatch.setattr(routes.grid_client, "get_series_state", series_state)
+
+    response = client.get(
+        "/api/v1/grid/round-timeline/timeline-stream", headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    header, *rounds, trailer = [orjson.loads(line) for line in response.text.splitlines()]
+    assert header["team_1"] == "A"
+    assert [r["number"] for r in rounds] == [1, 2, 25]
+    assert trailer == {"critical_round_numbers": [1, 25], "total_rounds": 3}
+
+
+def test_simple_scenario_rewordings_share_one_deepseek_call(monkeypatch):
+    from app.api import routes
+
+    calls = []
+
+    async def analyze(system_prompt, user_prompt, response_schema=None):
+        calls.append(user_prompt)
+        return {"recommendation": "Hold"}
+
+    monkeypatch.setattr(routes.deepseek_client, "analyze", analyze)
+    routes._scenario_cache.clear()
+
+    for scenario in ("Push B site", "push to B site."):
+        response = client.post(
+            "/api/v1/simulate/scenario-simple",
+            json={"scenario": scenario, "game": "VALORANT", "context": {"game": "VALORANT"}}
+        )
+        assert response.json()["recommendation"] == "Hold"
+    assert len(calls) == 1
+    routes._scenario_cache.clear()
+
+
+def test_grid_errors_all_reports_players_independently(monkeypatch):
+    from app.api import routes
+    from app.models.lol import GameState, MicroErrorResponse, PlayerState
+
+    states = [
+        PlayerState(player_name=name, role="mid", champion="Ahri", team_name="A", kills=0, deaths=0,
+                    assists=0, gold=0, cs=0, level=1, vision_score=0)
+        for name in ("ok", "broken")
+    ]
+
+    async def game_state(series_id):
+        return GameState(timestamp=0, team_1_name="A", team_2_name="B", player_states=states)
+
+    async def detect_errors(player, timeline=None, player_states=None):
+        if player.name == "broken":
+            raise RuntimeError("boom")
+        return MicroErrorResponse(status="success", errors=[])
+
+    monkeypatch.setattr(routes.grid_client, "get_game_state", game_state)
+    monkeypatch.setattr(routes.error_detector, "detect_errors", detect_errors)
+
+    response = client.post("/api/v1/grid/errors/errors-all-test/all")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "partial"
+    assert list(data["players"]) == ["ok"]
+    assert data["errors"] == {"broken": "Micro-error detection failed for broken"}
+
+
+def test_series_filters_reject_unknown_games_before_the_handler():
+    from app.api.routes import GameName
+
+    assert GameName("LoL") is GameName.LOL
+    assert client.get("/api/v1/grid/series/nonsense").status_code == 422
+    response = client.get("/api/v1/grid/series-by-title", params={"title_id": 99})
+    assert response.status_code == 422
+
+
+def test_series_by_title_accepts_known_title_ids(monkeypatch):
+    from app.api import routes
+
+    requested = []
+
+    async def all_series(title_id, **kwargs):
+        requested.append(title_id)
+        return {"data": {"allSeries": {"edges": []}}, "title": title_id}
+
+    monkeypatch.setattr(routes.grid_client, "get_all_series_by_title", all_series)
+
+    for title_id in (3, 6):
+        response = client.get("/api/v1/grid/series-by-title", params={"title_id": title_id, "hours": 5})
+        assert response.status_code == 200
+        assert response.json()["title"] == title_id
+    assert requested == [3, 6] and all(type(t) is int for t in requested)
+
+
+def test_series_list_by_game_is_routed_apart_from_series_ids(monkeypatch):
+    from app.api import routes
+
+    pages = []
+
+    async def fetch_page(title_id, filter, cursor):
+        pages.append(title_id)
+        return {"data": {"allSeries": {"edges": [{"node": {"id": "42", "teams": []}}], "pageInfo": {}}}}
+
+    async def game_state(series_id):
+        raise AssertionError("game names must not reach get_grid_series")
+
+    monkeypatch.setattr(routes, "_fetch_series_page", fetch_page)
+    monkeypatch.setattr(routes.grid_client, "get_game_state", game_state)
+
+    response = client.get("/api/v1/grid/series/valorant")
+    assert response.status_code == 200
+    assert [s["id"] for s in response.json()["series"]] == ["42"]
+    assert pages == [routes.VALORANT_TITLE_ID]
+
+
+def test_series_list_by_game_revalidates_with_etag(monkeypatch):
+    from app.api import routes
+
+    async def fetch_page(title_id, filter, cursor):
+        return {"data": {"allSeries": {"edges": [{"node": {"id": "7", "teams": []}}], "pageInfo": {}}}}
+
+    monkeypatch.setattr(routes, "_fetch_series_page", fetch_page)
+
+    response = client.get("/api/v1/grid/series/lol")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == routes._SERIES_LIST_CACHE_CONTROL
+    etag = response.headers["etag"]
+    revalidated = client.get("/api/v1/grid/series/lol", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+def test_series_list_by_game_streams_ndjson(monkeypatch):
+    import orjson
+    from app.api import routes
+
+    async def fetch_page(title_id, filter, cursor):
+        edges = [{"node": {"id": sid, "teams": [{"baseInfo": {"name": "A"}}, {"baseInfo": {"name": "B"}}]}}
+                 for sid in ("1", "2")]
+        return {"data": {"allSeries": {"edges": edges, "pageInfo": {"hasNextPage": True, "endCursor": "c2"}}}}
+
+    monkeypatch.setattr(routes, "_fetch_series_page", fetch_page)
+
+    with client.stream("GET", "/api/v1/grid/series/valorant", headers={"Accept": "application/x-ndjson"}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        *rows, trailer = [orjson.loads(line) for line in response.iter_lines() if line]
+    assert [(r["id"], r["teams"]) for r in rows] == [("1", "A vs B"), ("2", "A vs B")]
+    assert trailer == {"status": "success", "source": "grid", "nextCursor": "c2"}
+
+def test_series_list_polls_share_one_grid_page(monkeypatch):
+    from app.api import routes
+
+    calls = []
+
+    async def all_series(title_id, start_time, limit, cursor):
+        calls.append((title_id, start_time, cursor))
+        return {"data": {"allSeries": {"edges": [], "pageInfo": {}}}}
+
+    monkeypatch.setattr(routes.grid_client, "get_all_series_by_title", all_series)
+
+    for _ in range(3):
+        response = client.get("/api/v1/grid/series/lol", params={"filter": "1w", "cursor": "poll-test"})
+        assert response.status_code == 200
+    assert len(calls) == 1
+    assert calls[0][1].endswith("Z")  # one-week start_time cutoff was computed
+
+def test_series_body_cache_is_keyed_by_series_ids_only(monkeypatch):
+    from app.api import routes
+    from app.models.lol import GameState
+
+    fetched = []
+
+    async def game_state(series_id):
+        fetched.append(series_id)
+        return GameState(timestamp=0, team_1_name="A", team_2_name="B")
+
+    async def fetch_page(title_id, filter, cursor):
+        return {"data": {"allSeries": {"edges": [], "pageInfo": {}}}}
+
+    monkeypatch.setattr(routes.grid_client, "get_game_state", game_state)
+    monkeypatch.setattr(routes, "_fetch_series_page", fetch_page)
+
+    first = client.get("/api/v1/grid/series/31301")
+    second = client.get("/api/v1/grid/series/31301")
+    assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+    assert second.json()["series_id"] == "31301"
+
+    assert client.get("/api/v1/grid/series/valorant").status_code == 200
+    assert fetched == ["31301"]
+    assert "valorant" not in routes._series_body_live
+
+def test_analysis_failures_do_not_leak_exception_text(monkeypatch):
+    from app.api import routes
+
+    async def bundle(series_id):
+        raise RuntimeError("GRID key sk-4711 rejected")
+
+    monkeypatch.setattr(routes.grid_client, "get_bundle", bundle)
+
+    for path in ("/api/v1/coach/full-analysis/46201", "/api/v1/coach/full-analysis-valorant/46202"):
+        response = client.post(path)
+        assert response.status_code == 500
+        assert "sk-4711" not in response.text
+        streamed = client.post(path, headers={"Accept": "text/event-stream"})
+        assert "event: error" in streamed.text
+        assert "sk-4711" not in streamed.text
+
+def _valorant_series_state(series_id, finished):
+    """seriesState GraphQL response shaped like GRID's, for a two-team VALORANT game."""
+    def team(name, won, score):
+        players = [
+            {"id": f"{name}{n}", "name": f"{name}-p{n}", "character": {"id": "jett", "name": "Jett"},
+             "kills": 15, "killAssistsGiven": 4, "deaths": 12, "alive": True, "money": 3900,
+             "headshots": 6, "damageDealt": 3100}
+            for n in range(5)
+        ]
+        return {"__typename": "GameTeamStateValorant", "id": name, "name": name, "side": "attacker",
+                "won": won, "score": score, "kills": 75, "deaths": 60, "players": players}
+
+    game = {"id": "g1", "sequenceNumber": 1, "started": True, "finished": finished,
+            "map": {"name": "Ascent"}, "clock": {"currentSeconds": 2400},
+            "teams": [team("Alpha", finished, 13), team("Bravo", False, 9)], "segments": []}
+    return {"data": {"seriesState": {"id": series_id, "format": "bo1", "started": True,
+                                     "finished": finished, "games": [game]}}}
+
+
+def test_finished_series_analyses_are_persisted_from_grid_state(monkeypatch):
+    from app.api import routes
+    from app.models.valorant import EnhancedMacroReview, ValorantMacroReview
+
+    stored = []
+
+    async def series_state(series_id):
+        return _valorant_series_state(series_id, finished=series_id == "46001")
+
+    async def review(match, game_state):
+        return EnhancedMacroReview.model_construct(
+            review=ValorantMacroReview.model_construct(), kast_impact=[], economy_analysis=None,
+            what_if_candidates=[], ai_parsed=True
+        )
+
+    async def no_cached_analysis(series_id, endpoint):
+        return None
+
+    async def store(series_id, endpoint, result):
+        stored.append(series_id)
+
+    monkeypatch.setattr(routes.grid_client, "_fetch_series_state", series_state)
+    monkeypatch.setattr(routes.valorant_analyzer, "generate_macro_review_from_grid", review)
+    monkeypatch.setattr(routes, "_load_finished_analysis", no_cached_analysis)
+    monkeypatch.setattr(routes, "_store_finished_analysis", store)
+
+    for series_id in ("46001", "46002"):  # finished, live
+        response = client.post(f"/api/v1/coach/full-analysis-valorant/{series_id}")
+        assert response.status_code == 200
+        assert response.json()["match"]["team_1_name"] == "Alpha"
+    assert stored == ["46001"]
+
+def test_finished_series_bodies_are_kept_in_the_final_cache(monkeypatch):
+    from app.api import routes
+
+    async def series_state(series_id):
+        return _valorant_series_state(series_id, finished=series_id == "46101")
+
+    monkeypatch.setattr(routes.grid_client, "_fetch_series_state", series_state)
+
+    for series_id in ("46101", "46102"):  # finished, live
+        assert client.get(f"/api/v1/grid/series/{series_id}").status_code == 200
+    assert "46101" in routes._series_body_final and "46101" not in routes._series_body_live
+    assert "46102" in routes._series_body_live and "46102" not in routes._series_body_final
+
+def test_unparsed_valorant_reviews_are_not_persisted(monkeypatch):
+    from app.api import routes
+    from app.models.lol import GameState
+    from app.models.valorant import EnhancedMacroReview, ValorantMacroReview
+
+    parsed = iter([False, True])
+    stored = []
+
+    async def bundle(series_id):
+        return None, GameState(timestamp=0, team_1_name="A", team_2_name="B", series_finished=True)
+
+    async def review(match, game_state):
+        return EnhancedMacroReview.model_construct(
+            review=ValorantMacroReview.model_construct(), kast_impact=[], economy_analysis=None,
+            what_if_candidates=[], ai_parsed=next(parsed)
+        )
+
+    async def no_cached_analysis(series_id, endpoint):
+        return None
+
+    async def store(series_id, endpoint, result):
+        stored.append(series_id)
+
+    monkeypatch.setattr(routes.grid_client, "get_bundle", bundle)
+    monkeypatch.setattr(routes.valorant_analyzer, "generate_macro_review_from_grid", review)
+    monkeypatch.setattr(routes, "_load_finished_analysis", no_cached_analysis)
+    monkeypatch.setattr(routes, "_store_finished_analysis", store)
+
+    for series_id in ("unparsed", "parsed"):
+        assert client.post(f"/api/v1/coach/full-analysis-valorant/{series_id}").status_code == 200
+    assert stored == ["parsed"]
+
+def test_grid_series_state_is_reused_between_polls():
+    from app.services.grid_client import GRIDClient
+
+    grid = GRIDClient()
+    fetched = []
+
+    async def fetch(series_id):
+        fetched.append(series_id)
+        await asyncio.sleep(0.01)
+        if series_id == "broken":
+            return {"errors": [{"message": "timeout"}]}
+        return {"data": {"seriesState": {"finished": series_id == "done"}}}
+
+    grid._fetch_series_state = fetch
+
+    async def main():
+        await asyncio.gather(*(grid.get_series_state("live") for _ in range(5)))
+        for series_id in ("live", "done", "done", "broken", "broken"):
+            await grid.get_series_state(series_id)
+
+    asyncio.run(main())
+    assert fetched == ["live", "done", "broken", "broken"]
+    assert "done" in grid._series_final and "live" in grid._series_live
+
+
+def test_large_responses_are_gzipped():
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert client.get("/health", headers={"Accept-Encoding": "gzip"}).headers.get("content-encoding") is None
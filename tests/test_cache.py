@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+from app.core.cache import TTLCache, SingleFlight, async_ttl_cache, single_flight
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache["c"] = 3
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(maxsize=4, ttl=0.01)
+    cache["a"] = 1
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+
+def test_ttl_cache_purge_expired_drops_unread_entries():
+    cache = TTLCache(maxsize=4, ttl=0.01)
+    cache["a"] = 1
+    cache["b"] = 2
+    time.sleep(0.02)
+    cache["c"] = 3
+    assert cache.purge_expired() == 2
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "review"
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("series", compute) for _ in range(10)))
+        assert len(flight) == 0
+        return results
+
+    assert asyncio.run(main()) == ["review"] * 10
+    assert calls == 1
+
+
+def test_single_flight_decorator_coalesces_by_key():
+    calls = []
+
+    @single_flight(key_fn=lambda series_id, player_name: series_id)
+    async def analyze(series_id: str, player_name: str):
+        calls.append(series_id)
+        await asyncio.sleep(0.01)
+        return series_id
+
+    async def main():
+        results = await asyncio.gather(
+            analyze("s1", player_name="a"), analyze("s1", player_name="b"), analyze("s2", player_name="a")
+        )
+        assert results == ["s1", "s1", "s2"]
+        await analyze("s1", player_name="a")  # nothing cached once the flight lands
+
+    asyncio.run(main())
+    assert calls == ["s1", "s2", "s1"]
+
+
+def test_async_ttl_cache_skips_rejected_results():
+    calls = []
+
+    @async_ttl_cache(ttl=60, cache_if=lambda result: "errors" not in result)
+    async def fetch(title_id: str):
+        calls.append(title_id)
+        return {"errors": ["timeout"]} if title_id == "bad" else {"data": title_id}
+
+    async def main():
+        assert await fetch(title_id="3") == {"data": "3"}
+        assert await fetch(title_id="3") == {"data": "3"}
+        await fetch(title_id="bad")
+        await fetch(title_id="bad")
+
+    asyncio.run(main())
+    assert calls == ["3", "bad", "bad"]